@@ -3,8 +3,10 @@ import pandas as pd
 import plotly.graph_objects as go
 from utils.excel_reader import ExcelReader, create_sample_excel
 from utils.chart_creator import ChartCreator
+from utils.column_profile import get_column_profile
 from utils.data_analyzer import DataAnalyzer
-import os
+from utils.upload_store import upload_store
+from utils.workbook_cache import workbook_cache
 
 # 페이지 설정
 st.set_page_config(
@@ -56,9 +58,10 @@ def create_dashboard_charts(df, chart_creator):
     charts = []
     
     # 수치형 컬럼들
-    numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-    categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
-    date_cols = df.select_dtypes(include=['datetime64']).columns.tolist()
+    profile = get_column_profile(df)
+    numeric_cols = profile['numeric_columns']
+    categorical_cols = profile['categorical_columns']
+    date_cols = profile['date_columns']
     
     # 1. 상관관계 히트맵 (수치형 컬럼이 2개 이상인 경우)
     if len(numeric_cols) >= 2:
@@ -89,7 +92,7 @@ def create_dashboard_charts(df, chart_creator):
     if categorical_cols and numeric_cols:
         cat_col = categorical_cols[0]
         num_col = numeric_cols[0]
-        pie_data = df.groupby(cat_col)[num_col].sum().reset_index()
+        pie_data = df.groupby(cat_col, observed=True)[num_col].sum().reset_index()
         fig_pie = chart_creator.create_pie_chart(pie_data, num_col, cat_col, f"{cat_col}별 {num_col} 비율")
         charts.append((f"{cat_col}별 {num_col} 비율", fig_pie))
     
@@ -119,7 +122,7 @@ def create_dashboard_charts(df, chart_creator):
         cat_col = categorical_cols[0]
         num_col = numeric_cols[0]
         
-        top_data = df.groupby(cat_col)[num_col].sum().sort_values(ascending=False).head(10).reset_index()
+        top_data = df.groupby(cat_col, observed=True)[num_col].sum().sort_values(ascending=False).head(10).reset_index()
         fig_top = chart_creator.create_bar_chart(top_data, cat_col, num_col, title=f"상위 10개 {cat_col}별 {num_col}")
         charts.append((f"상위 10개 {cat_col}별 {num_col}", fig_top))
     
@@ -130,17 +133,16 @@ def display_dashboard(df, chart_creator):
     st.header("📊 데이터 대시보드")
     
     # 데이터 요약 정보
+    profile = get_column_profile(df)
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("총 행 수", len(df))
     with col2:
         st.metric("총 열 수", len(df.columns))
     with col3:
-        numeric_count = len(df.select_dtypes(include=['number']).columns)
-        st.metric("수치형 컬럼", numeric_count)
+        st.metric("수치형 컬럼", len(profile['numeric_columns']))
     with col4:
-        categorical_count = len(df.select_dtypes(include=['object']).columns)
-        st.metric("범주형 컬럼", categorical_count)
+        st.metric("범주형 컬럼", len(profile['categorical_columns']))
     
     # 대시보드 차트 생성
     dashboard_charts = create_dashboard_charts(df, chart_creator)
@@ -169,111 +171,156 @@ def display_dashboard(df, chart_creator):
     else:
         st.warning("대시보드를 생성할 수 있는 충분한 데이터가 없습니다.")
 
+def display_descriptive_statistics(desc_stats):
+    """기술통계 분석 결과 표시"""
+    st.subheader("📊 기술통계 분석")
+    
+    for col, stats in desc_stats.items():
+        with st.expander(f"{col} 기술통계"):
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("평균", f"{stats['mean']:.2f}")
+                st.metric("중앙값", f"{stats['median']:.2f}")
+            with col2:
+                st.metric("표준편차", f"{stats['std']:.2f}")
+                st.metric("분산", f"{stats['std']**2:.2f}")
+            with col3:
+                st.metric("최소값", f"{stats['min']:.2f}")
+                st.metric("최대값", f"{stats['max']:.2f}")
+            with col4:
+                st.metric("왜도", f"{stats['skewness']:.2f}")
+                st.metric("첨도", f"{stats['kurtosis']:.2f}")
+
+def display_correlation_analysis(correlation_analysis):
+    """상관관계 분석 결과 표시"""
+    st.subheader("🔗 상관관계 분석")
+    corr_matrix, p_values = correlation_analysis
+    
+    if not corr_matrix.empty:
+        st.write("**상관계수 행렬**")
+        st.dataframe(corr_matrix.round(3))
+        
+        # 유의한 상관관계 표시
+        significant_correlations = []
+        for i in corr_matrix.columns:
+            for j in corr_matrix.columns:
+                if i != j and p_values.get(i, {}).get(j, 1) < 0.05:
+                    significant_correlations.append({
+                        '변수1': i,
+                        '변수2': j,
+                        '상관계수': corr_matrix.loc[i, j],
+                        'p값': p_values[i][j]
+                    })
+        
+        if significant_correlations:
+            st.write("**유의한 상관관계 (p < 0.05)**")
+            sig_df = pd.DataFrame(significant_correlations)
+            st.dataframe(sig_df.round(4))
+
+def display_outlier_analysis(outlier_analysis):
+    """이상치 분석 결과 표시"""
+    st.subheader("⚠️ 이상치 분석")
+    
+    for col, outlier_info in outlier_analysis.items():
+        with st.expander(f"{col} 이상치"):
+            st.metric("이상치 개수", outlier_info['outlier_count'])
+            st.metric("이상치 비율", f"{outlier_info['outlier_percent']:.2f}%")
+
+def display_normality_test(normality_test):
+    """정규성 검정 결과 표시"""
+    st.subheader("📈 정규성 검정")
+    
+    for col, test_results in normality_test.items():
+        with st.expander(f"{col} 정규성"):
+            st.write(f"**Shapiro-Wilk**: {'정규분포' if test_results['is_normal_shapiro'] else '비정규분포'}")
+            st.write(f"**KS 검정**: {'정규분포' if test_results['is_normal_ks'] else '비정규분포'}")
+            st.caption(f"표본 크기: {test_results['sample_size']:,}개")
+
+def display_trend_analysis(trend_analysis):
+    """시계열 분석 결과 표시"""
+    st.subheader("📈 시계열 분석")
+    st.metric("기울기", f"{trend_analysis['slope']:.4f}")
+    st.metric("R²", f"{trend_analysis['r_squared']:.4f}")
+    st.metric("추세 방향", trend_analysis['trend_direction'])
+
+def display_column_trends(column_trends):
+    """컬럼별 추세 요약 표시"""
+    if not column_trends:
+        return
+    
+    st.write("**컬럼별 추세**")
+    trend_df = pd.DataFrame([
+        {'컬럼': col, '기울기': trend['slope'], 'R²': trend['r_squared'], '추세 방향': trend['trend_direction']}
+        for col, trend in column_trends.items()
+    ])
+    st.dataframe(trend_df.round(4), hide_index=True)
+
+def display_cluster_analysis(cluster_analysis):
+    """군집 분석 결과 표시"""
+    st.subheader("🎯 군집 분석")
+    st.metric("군집 수", cluster_analysis['n_clusters'])
+    st.metric("Inertia", f"{cluster_analysis['inertia']:.2f}")
+
+def display_financial_analysis(financial_analysis):
+    """재무 분석 결과 표시"""
+    if not financial_analysis:
+        return
+    
+    st.markdown("---")
+    st.subheader("💰 재무 분석")
+    
+    metrics_cols = st.columns(len(financial_analysis))
+    for i, (metric, value) in enumerate(financial_analysis.items()):
+        with metrics_cols[i]:
+            st.metric(metric.replace('_', ' ').title(), f"{value:.2f}%")
+
 def display_advanced_analysis(df, analyzer):
-    """고급 분석 결과 표시"""
+    """고급 분석 결과 표시 (섹션이 끝나는 대로 해당 위치에 표시)"""
     st.header("🔬 고급 데이터 분석")
     
-    # 분석 리포트 생성
-    with st.spinner("전문적인 데이터 분석을 수행하고 있습니다..."):
-        report = analyzer.create_analysis_report(df)
+    # 분석 파라미터 (바꾼 파라미터를 사용하는 섹션만 다시 계산)
+    param_col1, param_col2 = st.columns(2)
+    with param_col1:
+        n_clusters = st.slider("군집 수", min_value=2, max_value=10, value=3)
+    with param_col2:
+        outlier_method = st.selectbox("이상치 탐지 방법", ["iqr", "zscore"])
     
     # 탭으로 분석 결과 구분
     tab1, tab2, tab3, tab4 = st.tabs(["📊 기술통계", "🔗 상관관계", "⚠️ 이상치/정규성", "📈 시계열/군집"])
+    tab3_col1, tab3_col2 = tab3.columns(2)
+    tab4_col1, tab4_col2 = tab4.columns(2)
     
-    with tab1:
-        st.subheader("📊 기술통계 분석")
-        desc_stats = report['descriptive_statistics']
-        
-        for col, stats in desc_stats.items():
-            with st.expander(f"{col} 기술통계"):
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("평균", f"{stats['mean']:.2f}")
-                    st.metric("중앙값", f"{stats['median']:.2f}")
-                with col2:
-                    st.metric("표준편차", f"{stats['std']:.2f}")
-                    st.metric("분산", f"{stats['std']**2:.2f}")
-                with col3:
-                    st.metric("최소값", f"{stats['min']:.2f}")
-                    st.metric("최대값", f"{stats['max']:.2f}")
-                with col4:
-                    st.metric("왜도", f"{stats['skewness']:.2f}")
-                    st.metric("첨도", f"{stats['kurtosis']:.2f}")
+    # 섹션 이름 -> (표시할 위치, 표시 함수)
+    sections = {
+        'descriptive_statistics': (tab1, display_descriptive_statistics),
+        'correlation_analysis': (tab2, display_correlation_analysis),
+        'outlier_analysis': (tab3_col1, display_outlier_analysis),
+        'normality_test': (tab3_col2, display_normality_test),
+        'trend_analysis': (tab4_col1, display_trend_analysis),
+        'column_trends': (tab4_col1, display_column_trends),
+        'cluster_analysis': (tab4_col2, display_cluster_analysis),
+        'financial_analysis': (st.container(), display_financial_analysis)
+    }
+    placeholders = {name: container.empty() for name, (container, _) in sections.items()}
     
-    with tab2:
-        st.subheader("🔗 상관관계 분석")
-        corr_matrix, p_values = report['correlation_analysis']
-        
-        if not corr_matrix.empty:
-            st.write("**상관계수 행렬**")
-            st.dataframe(corr_matrix.round(3))
-            
-            # 유의한 상관관계 표시
-            significant_correlations = []
-            for i in corr_matrix.columns:
-                for j in corr_matrix.columns:
-                    if i != j and p_values.get(i, {}).get(j, 1) < 0.05:
-                        significant_correlations.append({
-                            '변수1': i,
-                            '변수2': j,
-                            '상관계수': corr_matrix.loc[i, j],
-                            'p값': p_values[i][j]
-                        })
-            
-            if significant_correlations:
-                st.write("**유의한 상관관계 (p < 0.05)**")
-                sig_df = pd.DataFrame(significant_correlations)
-                st.dataframe(sig_df.round(4))
+    status = st.empty()
+    status.info("전문적인 데이터 분석을 수행하고 있습니다...")
     
-    with tab3:
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("⚠️ 이상치 분석")
-            outlier_analysis = report['outlier_analysis']
-            
-            for col, outlier_info in outlier_analysis.items():
-                with st.expander(f"{col} 이상치"):
-                    st.metric("이상치 개수", outlier_info['outlier_count'])
-                    st.metric("이상치 비율", f"{outlier_info['outlier_percent']:.2f}%")
+    completed = 0
+    for name, result in analyzer.iter_analysis_report(df, n_clusters=n_clusters, outlier_method=outlier_method,
+                                                      timeout=120):
+        if name in sections:
+            with placeholders[name].container():
+                sections[name][1](result)
         
-        with col2:
-            st.subheader("📈 정규성 검정")
-            normality_test = report['normality_test']
-            
-            for col, test_results in normality_test.items():
-                with st.expander(f"{col} 정규성"):
-                    st.write(f"**Shapiro-Wilk**: {'정규분포' if test_results['is_normal_shapiro'] else '비정규분포'}")
-                    st.write(f"**KS 검정**: {'정규분포' if test_results['is_normal_ks'] else '비정규분포'}")
+        completed += 1
+        status.info(f"전문적인 데이터 분석을 수행하고 있습니다... ({completed}개 섹션 완료)")
     
-    with tab4:
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if 'trend_analysis' in report:
-                st.subheader("📈 시계열 분석")
-                trend_analysis = report['trend_analysis']
-                st.metric("기울기", f"{trend_analysis['slope']:.4f}")
-                st.metric("R²", f"{trend_analysis['r_squared']:.4f}")
-                st.metric("추세 방향", trend_analysis['trend_direction'])
-        
-        with col2:
-            if 'cluster_analysis' in report:
-                st.subheader("🎯 군집 분석")
-                cluster_analysis = report['cluster_analysis']
-                st.metric("군집 수", cluster_analysis['n_clusters'])
-                st.metric("Inertia", f"{cluster_analysis['inertia']:.2f}")
+    status.empty()
     
-    # 재무 분석 (별도 섹션)
-    if 'financial_analysis' in report and report['financial_analysis']:
-        st.markdown("---")
-        st.subheader("💰 재무 분석")
-        financial_analysis = report['financial_analysis']
-        
-        metrics_cols = st.columns(len(financial_analysis))
-        for i, (metric, value) in enumerate(financial_analysis.items()):
-            with metrics_cols[i]:
-                st.metric(metric.replace('_', ' ').title(), f"{value:.2f}%")
+    if analyzer.section_errors:
+        failed = ', '.join(analyzer.section_errors)
+        st.warning(f"일부 분석을 완료하지 못했습니다: {failed}")
 
 def main():
     # 헤더
@@ -304,16 +351,17 @@ def main():
     # 메인 컨텐츠
     if uploaded_file is not None:
         # 엑셀 파일 읽기
-        excel_reader = ExcelReader()
+        excel_reader = ExcelReader(cache=workbook_cache, optimize=True)
         chart_creator = ChartCreator()
         data_analyzer = DataAnalyzer()
         
-        # 임시 파일로 저장
-        with open("temp_file.xlsx", "wb") as f:
-            f.write(uploaded_file.getbuffer())
+        # 세션별 업로드 저장소에 보관 (같은 업로드는 재실행 시 다시 저장하지 않음)
+        upload_id = uploaded_file.file_id
+        if upload_store.get(upload_id) is None:
+            upload_store.put(uploaded_file.getvalue(), uploaded_file.name, upload_id=upload_id)
         
         # 엑셀 파일 읽기
-        sheets = excel_reader.read_excel("temp_file.xlsx")
+        sheets = excel_reader.read_upload(upload_store, upload_id, lazy=True)
         
         if sheets:
             # 시트 선택
@@ -362,9 +410,11 @@ def main():
                             y_col = st.selectbox("Y축", options.get('y', []))
                             color_col = st.selectbox("색상 구분", ['없음'] + options.get('color', []))
                             
+                            show_all = st.checkbox("모든 점 표시 (WebGL, 다운샘플링 안 함)", key="line_show_all")
+                            
                             if x_col and y_col:
                                 color_col = None if color_col == '없음' else color_col
-                                fig = chart_creator.create_line_chart(df, x_col, y_col, color_col)
+                                fig = chart_creator.create_line_chart(df, x_col, y_col, color_col, decimate=not show_all)
                                 st.plotly_chart(fig, use_container_width=True)
                         
                         elif chart_type == 'pie':
@@ -381,10 +431,18 @@ def main():
                             color_col = st.selectbox("색상 구분", ['없음'] + options.get('color', []))
                             size_col = st.selectbox("크기", ['없음'] + options.get('size', []))
                             
+                            display_mode = st.radio("표시 방식", ["다운샘플링", "모든 점 (WebGL)", "래스터 (밀도)"],
+                                                    horizontal=True, key="scatter_display_mode")
+                            
                             if x_col and y_col:
                                 color_col = None if color_col == '없음' else color_col
                                 size_col = None if size_col == '없음' else size_col
-                                fig = chart_creator.create_scatter_plot(df, x_col, y_col, color_col, size_col)
+                                if display_mode == "래스터 (밀도)":
+                                    fig = chart_creator.create_scatter_plot(df, x_col, y_col, color_col, size_col,
+                                                                            render_mode='raster')
+                                else:
+                                    fig = chart_creator.create_scatter_plot(df, x_col, y_col, color_col, size_col,
+                                                                            decimate=display_mode == "다운샘플링")
                                 st.plotly_chart(fig, use_container_width=True)
                         
                         elif chart_type == 'histogram':
@@ -471,6 +529,18 @@ def main():
                         missing_df = pd.DataFrame(list(missing_data.items()), columns=['컬럼', '결측값 수'])
                         st.dataframe(missing_df)
                     
+                    # 메모리 사용량 (dtype 최적화 전후)
+                    memory_usage = data_info.get('memory_usage', {})
+                    if memory_usage:
+                        st.subheader("메모리 사용량")
+                        col1, col2 = st.columns(2)
+                        with col1:
+                            st.metric("최적화 전", f"{memory_usage['before'] / 1024 ** 2:.2f} MB")
+                        with col2:
+                            saved = memory_usage['before'] - memory_usage['after']
+                            st.metric("최적화 후", f"{memory_usage['after'] / 1024 ** 2:.2f} MB",
+                                      delta=f"-{saved / 1024 ** 2:.2f} MB", delta_color="inverse")
+                    
                     # 데이터 타입 정보
                     st.subheader("데이터 타입 정보")
                     dtype_info = pd.DataFrame(list(data_info.get('dtypes', {}).items()), 
@@ -480,9 +550,8 @@ def main():
                 with tab6:
                     display_advanced_analysis(df, data_analyzer)
         
-        # 임시 파일 삭제
-        if os.path.exists("temp_file.xlsx"):
-            os.remove("temp_file.xlsx")
+        # 워크북 핸들 정리
+        excel_reader.close()
     
     else:
         # 시작 화면
@@ -1,17 +1,22 @@
 import dash
 from dash import dcc, html, Input, Output, State, callback_context
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from utils.excel_reader import ExcelReader, create_sample_excel
 from utils.chart_creator import ChartCreator
+from utils.column_profile import get_column_profile
+from utils.upload_store import upload_store
+from utils.workbook_cache import workbook_cache
 import base64
 import io
 import json
 
 # Dash 앱 초기화
-app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
+# 차트 컨트롤과 그래프는 업로드 후에 만들어지므로 처음 레이아웃에 없는 id의 콜백을 허용
+app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP], suppress_callback_exceptions=True)
 app.title = "Excel Dashboard"
 
 def create_dashboard_charts(df, chart_creator):
@@ -19,9 +24,10 @@ def create_dashboard_charts(df, chart_creator):
     charts = []
     
     # 수치형 컬럼들
-    numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-    categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
-    date_cols = df.select_dtypes(include=['datetime64']).columns.tolist()
+    profile = get_column_profile(df)
+    numeric_cols = profile['numeric_columns']
+    categorical_cols = profile['categorical_columns']
+    date_cols = profile['date_columns']
     
     if len(numeric_cols) >= 2:
         # 1. 상관관계 히트맵
@@ -55,7 +61,7 @@ def create_dashboard_charts(df, chart_creator):
         cat_col = categorical_cols[0]
         num_col = numeric_cols[0]
         # 파이차트는 값의 합계를 사용
-        pie_data = df.groupby(cat_col)[num_col].sum().reset_index()
+        pie_data = df.groupby(cat_col, observed=True)[num_col].sum().reset_index()
         fig_pie = chart_creator.create_pie_chart(pie_data, num_col, cat_col, f"{cat_col}별 {num_col} 비율")
         charts.append((f"{cat_col}별 {num_col} 비율", fig_pie))
     
@@ -94,7 +100,7 @@ def create_dashboard_charts(df, chart_creator):
         num_col = numeric_cols[0]
         
         # 상위 10개 분석
-        top_data = df.groupby(cat_col)[num_col].sum().sort_values(ascending=False).head(10).reset_index()
+        top_data = df.groupby(cat_col, observed=True)[num_col].sum().sort_values(ascending=False).head(10).reset_index()
         fig_top = chart_creator.create_bar_chart(top_data, cat_col, num_col, title=f"상위 10개 {cat_col}별 {num_col}")
         charts.append((f"상위 10개 {cat_col}별 {num_col}", fig_top))
     
@@ -159,8 +165,8 @@ def create_dashboard_charts(df, chart_creator):
         num_col = numeric_cols[0]
         
         # 두 범주형 변수의 조합별 평균
-        combo_data = df.groupby([cat1, cat2])[num_col].mean().reset_index()
-        combo_data['조합'] = combo_data[cat1] + ' - ' + combo_data[cat2]
+        combo_data = df.groupby([cat1, cat2], observed=True)[num_col].mean().reset_index()
+        combo_data['조합'] = combo_data[cat1].astype(str) + ' - ' + combo_data[cat2].astype(str)
         
         fig_combo = chart_creator.create_bar_chart(combo_data, '조합', num_col, title=f"{cat1} x {cat2} 조합별 {num_col} 평균")
         charts.append((f"{cat1} x {cat2} 조합별 {num_col} 평균", fig_combo))
@@ -184,13 +190,14 @@ def create_dashboard_charts(df, chart_creator):
         lower_bound = Q1 - 1.5 * IQR
         upper_bound = Q3 + 1.5 * IQR
         
-        outliers = df[(df[num_col] < lower_bound) | (df[num_col] > upper_bound)]
-        normal_data = df[(df[num_col] >= lower_bound) & (df[num_col] <= upper_bound)]
+        # 데이터프레임을 필터링하지 않고 컬럼 마스크로 개수만 계산
+        outlier_count = int(((df[num_col] < lower_bound) | (df[num_col] > upper_bound)).sum())
+        normal_count = int(df[num_col].between(lower_bound, upper_bound).sum())
         
         outlier_summary = pd.DataFrame({
             '구분': ['정상 데이터', '이상치'],
-            '개수': [len(normal_data), len(outliers)],
-            '비율': [len(normal_data)/len(df)*100, len(outliers)/len(df)*100]
+            '개수': [normal_count, outlier_count],
+            '비율': [normal_count/len(df)*100, outlier_count/len(df)*100]
         })
         
         fig_outlier = chart_creator.create_bar_chart(outlier_summary, '구분', '개수', title=f"{num_col} 이상치 분석")
@@ -230,7 +237,9 @@ app.layout = dbc.Container([
                         },
                         multiple=False
                     ),
-                    html.Div(id='upload-status')
+                    html.Div(id='upload-status'),
+                    # 세션별 업로드 ID (파일 내용은 서버의 업로드 저장소에 보관)
+                    dcc.Store(id='upload-id', storage_type='session')
                 ])
             ])
         ], width=12)
@@ -275,33 +284,32 @@ app.layout = dbc.Container([
      Output('dashboard-output', 'children'),
      Output('dashboard-output', 'style'),
      Output('chart-controls', 'children'),
-     Output('chart-controls', 'style')],
+     Output('chart-controls', 'style'),
+     Output('upload-id', 'data')],
     [Input('upload-data', 'contents')],
     [State('upload-data', 'filename')]
 )
 def update_output(contents, filename):
     if contents is None:
-        return "파일을 업로드하세요", "", {'display': 'none'}, "", {'display': 'none'}, "", {'display': 'none'}
+        return "파일을 업로드하세요", "", {'display': 'none'}, "", {'display': 'none'}, "", {'display': 'none'}, None
     
     # 파일 내용 디코딩
     content_type, content_string = contents.split(',')
     decoded = base64.b64decode(content_string)
+    upload_id = None
     
     try:
-        # 엑셀 파일 읽기
-        excel_reader = ExcelReader()
-        
-        # 임시 파일로 저장
-        with open("temp_dash_file.xlsx", "wb") as f:
-            f.write(decoded)
-        
-        sheets = excel_reader.read_excel("temp_dash_file.xlsx")
+        # 세션별 업로드 저장소에 보관 후 엑셀 파일 읽기
+        upload_id = upload_store.put(decoded, filename)
+        excel_reader = ExcelReader(cache=workbook_cache, optimize=True)
+        sheets = excel_reader.read_upload(upload_store, upload_id, lazy=True)
         
         if sheets:
             sheet_names = excel_reader.get_sheet_names()
             selected_sheet = sheet_names[0]  # 첫 번째 시트 선택
             df = excel_reader.get_sheet_data(selected_sheet)
             data_info = excel_reader.get_data_info(selected_sheet)
+            excel_reader.close()
             
             # 데이터 정보 표시
             info_content = dbc.Card([
@@ -413,17 +421,36 @@ def update_output(contents, filename):
                             html.Label("크기"),
                             dcc.Dropdown(id='size-dropdown', options=[])
                         ], width=4)
+                    ], className="mb-3"),
+                    dbc.Row([
+                        dbc.Col([
+                            html.Label("표시 방식 (선그래프/산점도)"),
+                            dcc.Dropdown(
+                                id='render-mode-dropdown',
+                                options=[
+                                    {'label': '자동 (다운샘플링)', 'value': 'auto'},
+                                    {'label': '모든 점 (WebGL)', 'value': 'webgl'},
+                                    {'label': '래스터 (산점도 밀도)', 'value': 'raster'}
+                                ],
+                                value='auto',
+                                clearable=False
+                            )
+                        ], width=4)
                     ])
                 ])
             ])
             
-            return f"✅ {filename} 업로드 완료", info_content, {'display': 'block'}, dashboard_content, {'display': 'block'}, controls_content, {'display': 'block'}
+            return f"✅ {filename} 업로드 완료", info_content, {'display': 'block'}, dashboard_content, {'display': 'block'}, controls_content, {'display': 'block'}, upload_id
         
         else:
-            return "❌ 파일 읽기 오류", "", {'display': 'none'}, "", {'display': 'none'}, "", {'display': 'none'}
+            upload_store.remove(upload_id)
+            return "❌ 파일 읽기 오류", "", {'display': 'none'}, "", {'display': 'none'}, "", {'display': 'none'}, None
     
     except Exception as e:
-        return f"❌ 오류: {str(e)}", "", {'display': 'none'}, "", {'display': 'none'}, "", {'display': 'none'}
+        # 읽지 못한 파일은 만료될 때까지 남기지 않고 바로 삭제
+        if upload_id is not None:
+            upload_store.remove(upload_id)
+        return f"❌ 오류: {str(e)}", "", {'display': 'none'}, "", {'display': 'none'}, "", {'display': 'none'}, None
 
 # 차트 타입 변경 콜백
 @app.callback(
@@ -432,16 +459,18 @@ def update_output(contents, filename):
      Output('color-dropdown', 'options'),
      Output('size-dropdown', 'options')],
     [Input('chart-type-dropdown', 'value'),
-     Input('sheet-dropdown', 'value')]
+     Input('sheet-dropdown', 'value')],
+    [State('upload-id', 'data')]
 )
-def update_chart_options(chart_type, sheet_name):
+def update_chart_options(chart_type, sheet_name, upload_id):
     if not chart_type or not sheet_name:
         return [], [], [], []
     
     try:
-        excel_reader = ExcelReader()
-        sheets = excel_reader.read_excel("temp_dash_file.xlsx")
+        excel_reader = ExcelReader(cache=workbook_cache, optimize=True)
+        sheets = excel_reader.read_upload(upload_store, upload_id, lazy=True)
         df = excel_reader.get_sheet_data(sheet_name)
+        excel_reader.close()
         chart_creator = ChartCreator()
         chart_options = chart_creator.get_chart_options(df)
         
@@ -468,16 +497,19 @@ def update_chart_options(chart_type, sheet_name):
      Input('x-axis-dropdown', 'value'),
      Input('y-axis-dropdown', 'value'),
      Input('color-dropdown', 'value'),
-     Input('size-dropdown', 'value')]
+     Input('size-dropdown', 'value'),
+     Input('render-mode-dropdown', 'value')],
+    [State('upload-id', 'data')]
 )
-def update_chart(chart_type, sheet_name, x_col, y_col, color_col, size_col):
+def update_chart(chart_type, sheet_name, x_col, y_col, color_col, size_col, render_mode, upload_id):
     if not all([chart_type, sheet_name, x_col, y_col]):
         return ""
     
     try:
-        excel_reader = ExcelReader()
-        sheets = excel_reader.read_excel("temp_dash_file.xlsx")
+        excel_reader = ExcelReader(cache=workbook_cache, optimize=True)
+        sheets = excel_reader.read_upload(upload_store, upload_id, lazy=True)
         df = excel_reader.get_sheet_data(sheet_name)
+        excel_reader.close()
         chart_creator = ChartCreator()
         
         # 색상 및 크기 컬럼 처리
@@ -487,9 +519,18 @@ def update_chart(chart_type, sheet_name, x_col, y_col, color_col, size_col):
         if chart_type == 'bar':
             fig = chart_creator.create_bar_chart(df, x_col, y_col, color_col)
         elif chart_type == 'line':
-            fig = chart_creator.create_line_chart(df, x_col, y_col, color_col)
+            if render_mode == 'webgl':
+                fig = chart_creator.create_line_chart(df, x_col, y_col, color_col, render_mode='webgl', decimate=False)
+            else:
+                fig = chart_creator.create_line_chart(df, x_col, y_col, color_col)
         elif chart_type == 'scatter':
-            fig = chart_creator.create_scatter_plot(df, x_col, y_col, color_col, size_col)
+            if render_mode == 'webgl':
+                fig = chart_creator.create_scatter_plot(df, x_col, y_col, color_col, size_col,
+                                                        render_mode='webgl', decimate=False)
+            elif render_mode == 'raster':
+                fig = chart_creator.create_scatter_plot(df, x_col, y_col, color_col, size_col, render_mode='raster')
+            else:
+                fig = chart_creator.create_scatter_plot(df, x_col, y_col, color_col, size_col)
         elif chart_type == 'area':
             fig = chart_creator.create_area_chart(df, x_col, y_col, color_col)
         elif chart_type == 'box':
@@ -501,10 +542,50 @@ def update_chart(chart_type, sheet_name, x_col, y_col, color_col, size_col):
         else:
             return ""
         
-        return dcc.Graph(figure=fig)
+        return dcc.Graph(id='chart-graph', figure=fig)
     
     except Exception as e:
         return html.Div(f"차트 생성 오류: {str(e)}", style={'color': 'red'})
 
+def _relayout_range(relayout_data, axis, current_range):
+    """확대/축소 이벤트에서 축 범위 추출 (자동 범위로 돌아가면 None, 변경이 없으면 현재 범위)"""
+    if relayout_data.get(f'{axis}.autorange'):
+        return None
+    if f'{axis}.range[0]' in relayout_data:
+        return float(relayout_data[f'{axis}.range[0]']), float(relayout_data[f'{axis}.range[1]'])
+    if f'{axis}.range' in relayout_data:
+        low, high = relayout_data[f'{axis}.range']
+        return float(low), float(high)
+    return current_range
+
+# 래스터 산점도 확대/축소 콜백 (보이는 범위를 같은 해상도로 다시 집계)
+@app.callback(
+    Output('chart-graph', 'figure'),
+    Input('chart-graph', 'relayoutData'),
+    [State('chart-graph', 'figure'),
+     State('sheet-dropdown', 'value'),
+     State('upload-id', 'data')]
+)
+def update_raster_range(relayout_data, figure, sheet_name, upload_id):
+    meta = (figure or {}).get('layout', {}).get('meta') or {}
+    if not relayout_data or not meta.get('raster'):
+        raise PreventUpdate
+    
+    axis_keys = [key for key in relayout_data if key.startswith(('xaxis.', 'yaxis.'))]
+    if not axis_keys:
+        raise PreventUpdate
+    
+    x_range = _relayout_range(relayout_data, 'xaxis', tuple(meta['x_range']))
+    y_range = _relayout_range(relayout_data, 'yaxis', tuple(meta['y_range']))
+    
+    excel_reader = ExcelReader(cache=workbook_cache, optimize=True)
+    excel_reader.read_upload(upload_store, upload_id, lazy=True)
+    df = excel_reader.get_sheet_data(sheet_name)
+    excel_reader.close()
+    
+    title = figure['layout'].get('title', {}).get('text', "산점도")
+    return ChartCreator().create_raster_scatter(df, meta['x_col'], meta['y_col'], value_col=meta.get('value_col'),
+                                                title=title, x_range=x_range, y_range=y_range)
+
 if __name__ == '__main__':
     app.run_server(debug=True, host='0.0.0.0', port=8050) 
\ No newline at end of file
@@ -0,0 +1,70 @@
+import io
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def sample_frames():
+    """테스트용 시트 두 개 (정수, 실수, 문자열 컬럼)"""
+    rng = np.random.default_rng(0)
+    sales = pd.DataFrame({
+        'Product': rng.choice(['A', 'B', 'C'], 50),
+        'Quantity': rng.integers(1, 50, 50),
+        'Price': np.round(rng.uniform(10, 100, 50), 2)
+    })
+    employees = pd.DataFrame({
+        'Name': ['John', 'Jane', 'Bob', 'Alice'],
+        'Age': [25, 30, 35, 28],
+        'Salary': [50000.5, 60000.0, 70000.25, 55000.0]
+    })
+    return {'Sales': sales, 'Employees': employees}
+
+
+@pytest.fixture
+def numeric_frame():
+    """결측값, 정수, nullable 정수, 큰 값, 상수 컬럼이 섞인 수치형 데이터"""
+    rng = np.random.default_rng(0)
+    n = 2000
+    df = pd.DataFrame({
+        'a': rng.normal(size=n),
+        'b': rng.normal(size=n) * 1e6 + 1e9,
+        'c': rng.integers(0, 100, n),
+        'd': pd.array(rng.integers(0, 10, n), dtype='Int64'),
+        'constant': np.ones(n),
+        'label': rng.choice(['x', 'y'], n)
+    })
+    df['e'] = df['a'] * 2 + rng.normal(size=n)
+    df.loc[rng.integers(0, n, 200), 'a'] = np.nan
+    df.loc[::7, 'd'] = pd.NA
+    return df
+
+
+@pytest.fixture
+def xlsx_bytes(sample_frames):
+    """sample_frames를 저장한 xlsx 파일 내용"""
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        for sheet_name, df in sample_frames.items():
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+    return output.getvalue()
+
+
+@pytest.fixture
+def xls_bytes(sample_frames):
+    """sample_frames를 저장한 xls 파일 내용 (xlwt, xlrd가 없으면 건너뜀)"""
+    xlwt = pytest.importorskip('xlwt')
+    pytest.importorskip('xlrd')
+    
+    workbook = xlwt.Workbook()
+    for sheet_name, df in sample_frames.items():
+        worksheet = workbook.add_sheet(sheet_name)
+        for c, col in enumerate(df.columns):
+            worksheet.write(0, c, col)
+        for r, row in enumerate(df.itertuples(index=False), start=1):
+            for c, value in enumerate(row):
+                worksheet.write(r, c, value.item() if isinstance(value, np.generic) else value)
+    
+    output = io.BytesIO()
+    workbook.save(output)
+    return output.getvalue()
@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+import pytest
+from utils.analysis_cache import AnalysisCache
+from utils.byte_lru import ByteLRUCache
+from utils.chart_creator import ChartCreator
+from utils.figure_cache import FigureCache
+from utils.workbook_cache import WorkbookCache
+
+
+@pytest.fixture
+def points_frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({'x': rng.normal(size=3000), 'y': rng.normal(size=3000),
+                         'group': rng.choice(['a', 'b'], 3000)})
+
+
+def test_byte_lru_evicts_least_recently_used():
+    """예산을 넘으면 가장 오래 사용하지 않은 항목부터 제거하고 크기 합계를 유지"""
+    cache = ByteLRUCache(max_bytes=100)
+    cache._put(('a',), 'A', 40)
+    cache._put(('b',), 'B', 40)
+    assert cache._get(('a',)) == 'A'
+    cache._put(('c',), 'C', 40)
+    
+    assert cache._get(('b',)) is None
+    assert cache._get(('a',)) == 'A' and cache._get(('c',)) == 'C'
+    stats = cache.stats()
+    assert stats['current_bytes'] == 80 and stats['entries'] == 2 and stats['evictions'] == 1
+    assert stats['hits'] == 3 and stats['misses'] == 1
+
+
+def test_byte_lru_replaces_and_rejects_oversized_entries():
+    """같은 키는 크기를 다시 계산하고, 최대 크기를 넘는 항목은 저장하지 않음"""
+    cache = ByteLRUCache(max_bytes=100, max_entry_bytes=50)
+    cache._put(('a',), 'A', 30)
+    cache._put(('a',), 'A2', 20)
+    assert cache.stats()['current_bytes'] == 20
+    
+    cache._put(('a',), 'A3', 60)
+    assert cache._get(('a',)) is None
+    assert cache.stats()['current_bytes'] == 0
+    
+    cache._put(('b',), 'B', 10)
+    cache.clear()
+    assert cache.stats()['entries'] == 0 and cache.stats()['current_bytes'] == 0
+
+
+def test_workbook_cache_accounts_frame_memory():
+    """워크북 캐시는 시트의 실제 메모리 크기로 예산을 계산"""
+    df = pd.DataFrame({'value': np.arange(1000)})
+    cache = WorkbookCache(max_bytes=10 * 1024 * 1024)
+    cache.put('hash', 'Sheet1', df)
+    cache.put_sheet_index('hash', {'Sheet1': {'n_rows': 1000}})
+    
+    assert cache.get('hash', 'Sheet1') is df
+    assert cache.get_sheet_index('hash') == {'Sheet1': {'n_rows': 1000}}
+    assert cache.stats()['current_bytes'] == df.memory_usage(deep=True).sum() + WorkbookCache.INDEX_ENTRY_BYTES
+
+
+def test_figure_cache_hit_returns_equal_copy(points_frame):
+    """캐시 적중 시 같은 내용의 새 Figure를 반환하고, 반환된 차트를 수정해도 캐시에 영향 없음"""
+    creator = ChartCreator(max_points=500, cache=FigureCache())
+    first = creator.create_scatter_plot(points_frame, 'x', 'y', color_col='group')
+    first.update_layout(title='changed')
+    second = creator.create_scatter_plot(points_frame, 'x', 'y', color_col='group')
+    
+    assert creator.cache.stats()['hits'] == 1
+    assert second.layout.title.text == '산점도'
+    expected = ChartCreator(max_points=500, cache=None).create_scatter_plot(points_frame, 'x', 'y', color_col='group')
+    for cached_trace, trace in zip(second.data, expected.data):
+        np.testing.assert_array_equal(cached_trace.x, trace.x)
+        np.testing.assert_array_equal(cached_trace.y, trace.y)
+
+
+def test_raster_scatter_is_not_cached(points_frame):
+    """래스터 산점도는 다시 집계하는 편이 빠르므로 캐시하지 않음"""
+    creator = ChartCreator(cache=FigureCache())
+    creator.create_scatter_plot(points_frame, 'x', 'y', render_mode='raster')
+    creator.create_raster_scatter(points_frame, 'x', 'y')
+    
+    stats = creator.cache.stats()
+    assert stats['entries'] == 0 and stats['hits'] == 0 and stats['misses'] == 0
+
+
+def test_analysis_cache_bounds_entry_count():
+    """분석 캐시는 항목 수 기준으로 가장 오래 사용하지 않은 결과부터 제거"""
+    cache = AnalysisCache(max_entries=2)
+    cache.put(('a',), 1)
+    cache.put(('b',), 2)
+    cache.get(('a',))
+    cache.put(('c',), 3)
+    
+    assert cache.get(('b',)) is None
+    assert cache.get(('a',)) == 1 and cache.get(('c',)) == 3
+    assert isinstance(cache, ByteLRUCache)
+    stats = cache.stats()
+    assert stats['entries'] == 2 and stats['evictions'] == 1 and stats['max_entries'] == 2
+    assert stats['hits'] == 3 and stats['misses'] == 1
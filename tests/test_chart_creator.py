@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+import pytest
+from utils.chart_creator import ChartCreator
+
+
+@pytest.fixture
+def grouped_frame():
+    """그룹 값 일부가 비어 있는 그룹별 수치 데이터"""
+    rng = np.random.default_rng(0)
+    n = 3000
+    df = pd.DataFrame({
+        'group': rng.choice(['A', 'B', 'C'], n),
+        'color': rng.choice(['x', 'y'], n),
+        'value': rng.standard_t(3, n) * 10
+    })
+    df.loc[::50, 'group'] = np.nan
+    # 그룹이 없는 행에는 어느 그룹 기준으로도 이상치인 값을 넣음
+    df.loc[df['group'].isna(), 'value'] = 1e6
+    return df
+
+
+def test_precomputed_box_plot_matches_pandas_quartiles(grouped_frame):
+    """미리 계산한 박스의 사분위수와 수염이 pandas 결과와 같음"""
+    fig = ChartCreator(max_points=500, cache=None).create_box_plot(grouped_frame, 'group', 'value')
+    box = fig.data[0]
+    valid = grouped_frame.dropna(subset=['group'])
+    grouped = valid.groupby('group')['value']
+    
+    assert sorted(box.x) == ['A', 'B', 'C']
+    for i, group in enumerate(box.x):
+        values = grouped.get_group(group)
+        q1, median, q3 = values.quantile([0.25, 0.5, 0.75])
+        np.testing.assert_allclose([box.q1[i], box.median[i], box.q3[i]], [q1, median, q3])
+        inside = values[values.between(q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1))]
+        np.testing.assert_allclose([box.lowerfence[i], box.upperfence[i]], [inside.min(), inside.max()])
+
+
+def test_precomputed_box_plot_ignores_missing_groups(grouped_frame):
+    """그룹 값이 없는 행은 이상치로도 표시하지 않음"""
+    fig = ChartCreator(max_points=500, cache=None).create_box_plot(grouped_frame, 'group', 'value')
+    outliers = fig.data[1]
+    
+    assert not pd.isna(list(outliers.x)).any()
+    assert 1e6 not in set(outliers.y)
+
+
+def test_bar_chart_sums_repeated_bars(grouped_frame):
+    """같은 (x, 색상) 값의 행을 합계 막대 하나로 보냄"""
+    df = grouped_frame.dropna(subset=['group'])
+    fig = ChartCreator(cache=None).create_bar_chart(df, 'group', 'value', color_col='color')
+    expected = df.groupby(['color', 'group'])['value'].sum()
+    
+    for trace in fig.data:
+        assert len(trace.x) == len(set(trace.x))
+        for group, total in zip(trace.x, trace.y):
+            assert total == pytest.approx(expected[(trace.name, group)])
+
+
+def test_line_downsampling_keeps_extremes():
+    """트레이스별 점 수를 max_points 이하로 줄이면서 구간별 최소/최대값(전체 극값 포함)을 유지"""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'t': np.arange(20000), 'value': rng.normal(size=20000).cumsum(),
+                       'series': np.repeat(['a', 'b'], 10000)})
+    fig = ChartCreator(max_points=1000, cache=None).create_line_chart(df, 't', 'value', color_col='series')
+    
+    assert fig.layout.meta['decimated'] and fig.layout.meta['original_points'] == len(df)
+    for trace in fig.data:
+        group = df[df['series'] == trace.name]
+        assert len(trace.x) <= 1000
+        assert np.all(np.diff(trace.x) > 0)
+        assert max(trace.y) == group['value'].max() and min(trace.y) == group['value'].min()
+
+
+def test_webgl_threshold_selects_trace_type(grouped_frame):
+    """그릴 점 수가 webgl_threshold를 넘으면 Scattergl, 아니면 Scatter 트레이스"""
+    creator = ChartCreator(max_points=None, webgl_threshold=1000, cache=None)
+    assert creator.create_scatter_plot(grouped_frame, 'value', 'value').data[0].type == 'scattergl'
+    assert creator.create_scatter_plot(grouped_frame.head(100), 'value', 'value').data[0].type == 'scatter'
+    assert creator.create_scatter_plot(grouped_frame, 'value', 'value', render_mode='svg').data[0].type == 'scatter'
+    with pytest.raises(ValueError):
+        creator.create_scatter_plot(grouped_frame, 'value', 'value', render_mode='canvas')
+
+
+def test_raster_scatter_matches_histogram2d():
+    """래스터 산점도의 칸별 점 수가 같은 범위의 numpy.histogram2d와 같음"""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'x': rng.normal(size=50000), 'y': rng.normal(size=50000)})
+    fig = ChartCreator(cache=None).create_raster_scatter(df, 'x', 'y', x_range=(-2, 2), y_range=(-1, 3),
+                                                        bins=(40, 20))
+    counts, _, _ = np.histogram2d(df['y'], df['x'], bins=(20, 40), range=[(-1, 3), (-2, 2)])
+    
+    np.testing.assert_array_equal(np.nan_to_num(np.asarray(fig.data[0].z, dtype=float)), counts)
+    assert fig.layout.meta['x_range'] == [-2, 2] and fig.layout.meta['original_points'] == len(df)
+
+
+def test_aggregation_skipped_when_value_column_is_a_key():
+    """값 컬럼이 그룹 키이기도 한 막대그래프/파이차트는 집계하지 않고 그대로 그림"""
+    df = pd.DataFrame({'a': [1, 1, 2, 3], 'b': [4, 5, 6, 7]})
+    creator = ChartCreator(cache=None)
+    
+    bar = creator.create_bar_chart(df, 'a', 'a')
+    assert list(bar.data[0].x) == [1, 1, 2, 3] and list(bar.data[0].y) == [1, 1, 2, 3]
+    colored = creator.create_bar_chart(df, 'b', 'a', color_col='a')
+    assert sum(len(trace.x) for trace in colored.data) == len(df)
+    pie = creator.create_pie_chart(df, 'a', 'a')
+    assert len(pie.data[0].values) == len(df)
@@ -0,0 +1,225 @@
+import time
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+from sklearn.cluster import KMeans
+from sklearn.decomposition import PCA
+from sklearn.preprocessing import StandardScaler
+from utils.analysis_cache import AnalysisCache
+from utils.data_analyzer import DataAnalyzer
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    """블록 경로를 검증하도록 블록 크기를 줄인 캐시 없는 분석기"""
+    monkeypatch.setattr(DataAnalyzer, 'BLOCK_ELEMENTS', 1000)
+    return DataAnalyzer(cache=None)
+
+
+def test_correlation_matches_pandas(analyzer, numeric_frame):
+    """행 블록으로 누적한 상관계수가 DataFrame.corr, p-value가 scipy.stats.pearsonr와 같음"""
+    corr, p_values = analyzer.correlation_analysis(numeric_frame)
+    expected = numeric_frame.drop(columns='label').corr()
+    
+    pd.testing.assert_frame_equal(corr, expected[corr.columns].loc[corr.index], atol=1e-10)
+    for x, y in [('a', 'e'), ('b', 'c'), ('a', 'd')]:
+        pair = numeric_frame[[x, y]].dropna().astype(float)
+        assert p_values[x][y] == pytest.approx(stats.pearsonr(pair[x], pair[y])[1], rel=1e-8, abs=1e-300)
+    assert np.isnan(p_values['a']['constant'])
+
+
+def test_correlation_empty_frame(analyzer, numeric_frame):
+    """행이 없으면 모든 상관계수가 NaN"""
+    corr, _ = analyzer.correlation_analysis(numeric_frame.iloc[:0])
+    assert corr.shape == (6, 6)
+    assert corr.isna().all().all()
+
+
+def test_descriptive_statistics_match_pandas(analyzer, numeric_frame):
+    """블록 단위 기술통계가 pandas의 describe/skew/kurt와 같음"""
+    result = analyzer.descriptive_statistics(numeric_frame)
+    
+    assert 'label' not in result
+    for col in ['a', 'b', 'c', 'd', 'e', 'constant']:
+        series = numeric_frame[col].astype(float)
+        described = series.describe()
+        stats_ = result[col]
+        assert stats_['count'] == described['count']
+        assert stats_['missing_count'] == series.isna().sum()
+        np.testing.assert_allclose(
+            [stats_['mean'], stats_['std'], stats_['min'], stats_['q1'], stats_['median'], stats_['q3'], stats_['max']],
+            described[['mean', 'std', 'min', '25%', '50%', '75%', 'max']].to_numpy(dtype=float), rtol=1e-12)
+        np.testing.assert_allclose([stats_['skewness'], stats_['kurtosis']], [series.skew(), series.kurt()],
+                                   rtol=1e-8, atol=1e-12)
+    assert isinstance(result['c']['min'], np.integer)
+    np.testing.assert_allclose(result['d']['missing_percent'], numeric_frame['d'].isna().mean() * 100)
+
+
+def test_outlier_detection_matches_reference(analyzer, numeric_frame):
+    """IQR/z 점수 이상치가 pandas 분위수와 scipy.stats.zscore로 구한 결과와 같음"""
+    iqr_result = analyzer.outlier_detection(numeric_frame, method='iqr')
+    z_result = analyzer.outlier_detection(numeric_frame, method='zscore', z_threshold=2.5)
+    
+    for col in ['a', 'b', 'c', 'd', 'e']:
+        series = numeric_frame[col].astype(float)
+        q1, q3 = series.quantile([0.25, 0.75])
+        expected = series.index[(series < q1 - 1.5 * (q3 - q1)) | (series > q3 + 1.5 * (q3 - q1))]
+        np.testing.assert_array_equal(iqr_result[col]['outlier_indices'], expected)
+        assert iqr_result[col]['outlier_count'] == len(expected)
+        
+        valid = series.dropna()
+        z = stats.zscore(valid.to_numpy())
+        np.testing.assert_array_equal(z_result[col]['outlier_indices'], valid.index[np.abs(z) > 2.5])
+    
+    assert iqr_result['constant']['outlier_count'] == 0
+    assert z_result['constant']['outlier_count'] == 0
+    assert analyzer.outlier_detection(numeric_frame, method='unknown') == {}
+
+
+def test_normality_test_matches_scipy(analyzer, numeric_frame):
+    """표본 크기 이하의 컬럼은 전체 값으로, 큰 컬럼은 시드를 고정한 표본으로 scipy와 같은 검정"""
+    frame = numeric_frame.drop(columns='constant')
+    small = analyzer.normality_test(frame, sample_size=5000)
+    data = frame['a'].dropna().to_numpy()
+    assert small['a']['sample_size'] == len(data)
+    np.testing.assert_allclose(small['a']['shapiro_p_value'], stats.shapiro(data).pvalue)
+    np.testing.assert_allclose(small['a']['ks_p_value'],
+                               stats.kstest(data, 'norm', args=(data.mean(), data.std(ddof=1))).pvalue)
+    
+    sampled = analyzer.normality_test(frame, sample_size=500, n_repeats=3, random_state=7)
+    rng = np.random.default_rng(7)
+    p_values = [stats.shapiro(data[rng.choice(len(data), 500, replace=False)]).pvalue for _ in range(3)]
+    assert sampled['a']['sample_size'] == 500 and sampled['a']['n_repeats'] == 3
+    np.testing.assert_allclose(sampled['a']['shapiro_p_value'], np.median(p_values))
+    assert sampled == analyzer.normality_test(frame, sample_size=500, n_repeats=3, random_state=7)
+
+
+def test_cluster_analysis_matches_sklearn(analyzer, numeric_frame):
+    """결측값이 없는 행이 적으면 정규화된 전체 행에 대한 sklearn KMeans와 같음"""
+    frame = numeric_frame[['a', 'b', 'e']]
+    result = analyzer.cluster_analysis(frame, n_clusters=3, return_labels=True)
+    complete = frame.dropna()
+    kmeans = KMeans(n_clusters=3, random_state=42).fit(StandardScaler().fit_transform(complete))
+    
+    assert result['method'] == 'kmeans' and result['n_samples'] == len(complete)
+    np.testing.assert_allclose(result['cluster_centers'], kmeans.cluster_centers_, atol=1e-8)
+    np.testing.assert_allclose(result['inertia'], kmeans.inertia_)
+    labels = pd.Series(result['cluster_labels'], index=frame.index)
+    np.testing.assert_array_equal(labels[complete.index], kmeans.labels_)
+    assert (labels.drop(complete.index) == -1).all()
+
+
+def test_cluster_analysis_sampled_path_labels_every_row(monkeypatch, analyzer, numeric_frame):
+    """표본으로 학습한 경로도 결측값이 없는 모든 행을 가장 가까운 중심에 할당"""
+    monkeypatch.setattr(DataAnalyzer, 'CLUSTER_SAMPLE_ROWS', 500)
+    monkeypatch.setattr(DataAnalyzer, 'CHUNK_ROWS', 300)
+    frame = numeric_frame[['a', 'b', 'e']]
+    result = analyzer.cluster_analysis(frame, n_clusters=3, return_labels=True)
+    complete = frame.dropna()
+    
+    assert result['method'] == 'minibatch_kmeans'
+    assert sum(result['cluster_sizes']) == len(complete)
+    scaled = StandardScaler().fit_transform(complete)
+    distances = ((scaled[:, np.newaxis, :] - np.array(result['cluster_centers'])) ** 2).sum(axis=2)
+    np.testing.assert_array_equal(result['cluster_labels'][frame.index.get_indexer(complete.index)],
+                                  distances.argmin(axis=1))
+    np.testing.assert_allclose(result['inertia'], distances.min(axis=1).sum())
+
+
+@pytest.mark.parametrize('method', ['exact', 'streaming'])
+def test_pca_matches_sklearn(analyzer, numeric_frame, method):
+    """정확한 경로와 블록 누적 경로 모두 정규화된 데이터에 대한 sklearn PCA와 같음 (주성분 부호 제외)"""
+    frame = numeric_frame[['a', 'b', 'c', 'd', 'e']]
+    result = analyzer.pca_analysis(frame, n_components=3, method=method)
+    complete = frame.dropna().astype(float)
+    pca = PCA(n_components=3).fit(StandardScaler().fit_transform(complete))
+    
+    assert result['method'] == method and result['feature_names'] == list(frame.columns)
+    np.testing.assert_allclose(result['explained_variance_ratio'], pca.explained_variance_ratio_, rtol=1e-8)
+    np.testing.assert_allclose(result['cumulative_variance_ratio'], np.cumsum(pca.explained_variance_ratio_),
+                               rtol=1e-8)
+    components = np.array(result['components'])
+    signs = np.sign((components * pca.components_).sum(axis=1))
+    np.testing.assert_allclose(components * signs[:, np.newaxis], pca.components_, atol=1e-6)
+
+
+def _record_calls(monkeypatch, analyzer, names):
+    """분석기 메서드 호출을 기록하는 목록 반환"""
+    calls = []
+    for name in names:
+        def recorded(*args, _name=name, _method=getattr(analyzer, name), **kwargs):
+            calls.append(_name)
+            return _method(*args, **kwargs)
+        monkeypatch.setattr(analyzer, name, recorded)
+    return calls
+
+
+def test_report_sections_are_cached_by_parameters(monkeypatch, numeric_frame):
+    """파라미터 하나를 바꾸면 그 파라미터를 사용하는 섹션만 다시 계산"""
+    analyzer = DataAnalyzer(cache=AnalysisCache())
+    calls = _record_calls(monkeypatch, analyzer, ['descriptive_statistics', 'cluster_analysis', 'pca_analysis'])
+    
+    first = analyzer.create_analysis_report(numeric_frame, n_clusters=3)
+    assert sorted(calls) == ['cluster_analysis', 'descriptive_statistics', 'pca_analysis']
+    
+    calls.clear()
+    second = analyzer.create_analysis_report(numeric_frame, n_clusters=4)
+    assert calls == ['cluster_analysis']
+    assert list(second) == list(first)
+    assert second['descriptive_statistics'] is first['descriptive_statistics']
+    assert second['cluster_analysis']['n_clusters'] == 4
+    
+    calls.clear()
+    analyzer.create_analysis_report(numeric_frame.assign(a=numeric_frame['a'] + 1), n_clusters=4)
+    assert sorted(calls) == ['cluster_analysis', 'descriptive_statistics', 'pca_analysis']
+
+
+def test_concurrent_report_matches_sequential(numeric_frame):
+    """스레드 풀로 계산한 리포트가 섹션을 하나씩 계산한 리포트와 같은 순서, 같은 결과"""
+    concurrent = DataAnalyzer(cache=None).create_analysis_report(numeric_frame, max_workers=4)
+    sequential = DataAnalyzer(cache=None).create_analysis_report(numeric_frame, max_workers=1)
+    
+    assert list(concurrent) == list(sequential)
+    assert concurrent['descriptive_statistics'].keys() == sequential['descriptive_statistics'].keys()
+    pd.testing.assert_frame_equal(concurrent['correlation_analysis'][0], sequential['correlation_analysis'][0])
+    assert concurrent['cluster_analysis']['cluster_sizes'] == sequential['cluster_analysis']['cluster_sizes']
+
+
+def test_report_records_failed_and_slow_sections(monkeypatch, numeric_frame):
+    """실패하거나 시간을 넘긴 섹션은 리포트에서 빠지고 section_errors에 기록되며 나머지는 계산됨"""
+    analyzer = DataAnalyzer(cache=None)
+    
+    def failing(df):
+        raise ValueError('broken')
+    
+    monkeypatch.setattr(analyzer, 'financial_analysis', failing)
+    monkeypatch.setattr(analyzer, 'normality_test', lambda df: time.sleep(2))
+    report = analyzer.create_analysis_report(numeric_frame, max_workers=4, timeout=0.5)
+    
+    assert 'financial_analysis' not in report and 'normality_test' not in report
+    assert analyzer.section_errors['financial_analysis'] == 'broken'
+    assert 'normality_test' in analyzer.section_errors
+    assert 'descriptive_statistics' in report and 'pca_analysis' in report
+
+
+def test_sections_finished_after_timeout_are_cached(monkeypatch, numeric_frame):
+    """시간이 초과되어 리포트에서 빠진 섹션도 계산이 끝나면 캐시되어 다음 리포트에서 재사용"""
+    analyzer = DataAnalyzer(cache=AnalysisCache())
+    
+    def slow_normality(df):
+        time.sleep(1)
+        return {'slow': True}
+    
+    monkeypatch.setattr(analyzer, 'normality_test', slow_normality)
+    report = analyzer.create_analysis_report(numeric_frame, max_workers=4, timeout=0.2)
+    assert 'normality_test' not in report
+    
+    key = analyzer._section_key(numeric_frame, 'normality_test', {})
+    deadline = time.monotonic() + 10
+    while analyzer.cache.get(key) is None and time.monotonic() < deadline:
+        time.sleep(0.05)
+    
+    calls = _record_calls(monkeypatch, analyzer, ['normality_test'])
+    assert analyzer.create_analysis_report(numeric_frame)['normality_test'] == {'slow': True}
+    assert calls == []
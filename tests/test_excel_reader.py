@@ -0,0 +1,169 @@
+import warnings
+import numpy as np
+import pandas as pd
+import pytest
+from utils.excel_reader import ExcelReader, optimize_dtypes
+
+
+@pytest.mark.parametrize('workbook', ['xlsx_bytes', 'xls_bytes'])
+@pytest.mark.parametrize('lazy', [False, True])
+def test_read_excel_matches_pandas(request, workbook, lazy, sample_frames):
+    """xlsx, xls 모두 지연/즉시 로딩 결과가 pandas로 읽은 시트와 같음"""
+    data = request.getfixturevalue(workbook)
+    reader = ExcelReader()
+    sheets = reader.read_excel(data, lazy=lazy)
+    
+    assert list(sheets) == list(sample_frames)
+    for sheet_name, expected in sample_frames.items():
+        pd.testing.assert_frame_equal(sheets[sheet_name], expected, check_dtype=False)
+
+
+@pytest.mark.parametrize('workbook', ['xlsx_bytes', 'xls_bytes'])
+def test_sheet_index_headers(request, workbook, sample_frames):
+    """시트 인덱스의 헤더는 형식과 관계없이 get_sheet_index에서 채워짐"""
+    reader = ExcelReader()
+    reader.read_excel(request.getfixturevalue(workbook), lazy=True)
+    
+    index = reader.get_sheet_index()
+    for sheet_name, expected in sample_frames.items():
+        assert index[sheet_name]['columns'] == expected.columns.tolist()
+        assert index[sheet_name]['n_cols'] == expected.shape[1]
+
+
+def test_xlsx_sheet_index_row_counts(xlsx_bytes, sample_frames):
+    """xlsx 시트 인덱스는 파싱 없이 행 수를 기록"""
+    reader = ExcelReader()
+    reader.read_excel(xlsx_bytes, lazy=True)
+    
+    for sheet_name, expected in sample_frames.items():
+        assert reader.sheet_index[sheet_name]['n_rows'] == len(expected)
+    assert reader.sheets == {}
+
+
+def test_optimize_dtypes_integer_floor():
+    """정수 컬럼은 기본적으로 int32보다 작게 줄이지 않아 일반적인 계산에서 넘치지 않음"""
+    df = pd.DataFrame({
+        'Quantity': [1, 2, 3],
+        'Large': [1, 2, 10 ** 12],
+        'Nullable': pd.array([1, None, 3], dtype='Int64')
+    })
+    
+    optimized = optimize_dtypes(df)
+    assert optimized['Quantity'].dtype == np.int32
+    assert optimized['Large'].dtype == np.int64
+    assert optimized['Nullable'].dtype == pd.Int32Dtype()
+    assert (optimized['Quantity'] * 100).tolist() == [100, 200, 300]
+    
+    assert optimize_dtypes(df, min_integer_bits=8)['Quantity'].dtype == np.int8
+
+
+def test_optimize_dtypes_preserves_values():
+    """dtype 최적화 후에도 값은 원본과 같음"""
+    df = pd.DataFrame({
+        'Date': ['2023-01-01', '2023-01-02', None, '2023-01-04'],
+        'Region': ['North', 'North', 'South', 'North'],
+        'Price': [1.5, 2.25, np.nan, 4.0],
+        'Ratio': [0.1, 0.2, 0.3, 0.4]
+    })
+    
+    optimized = optimize_dtypes(df)
+    assert pd.api.types.is_datetime64_any_dtype(optimized['Date'])
+    assert optimized['Region'].dtype == 'category'
+    assert optimized['Price'].dtype == np.float32
+    assert optimized['Ratio'].dtype == np.float64
+    pd.testing.assert_frame_equal(optimized.astype({'Region': object, 'Price': np.float64}),
+                                  df.assign(Date=pd.to_datetime(df['Date'])))
+
+
+
+def test_optimize_dtypes_converts_only_full_dates():
+    """연-월-일이 모두 있는 문자열만 날짜로 변환하고 시각, 분기 표기는 경고 없이 문자열로 유지"""
+    df = pd.DataFrame({
+        'Timestamp': ['2023/01/05 10:30', '2023/1/6 11:00:15', '2023/01/07 09:00', '2023/01/08 12:00'],
+        'Time': ['10:30', '11:00', '10:30', '12:15'],
+        'Quarter': ['2023-Q1', '2023-Q2', '2023-Q3', '2023-Q4'],
+        'Mixed': ['2023-01-05', '2023-01-06', '10:30', '2023-01-08'],
+        'Invalid': ['2023-01-05', '2023-13-01', '2023-01-07', '2023-01-08']
+    })
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        optimized = optimize_dtypes(df, category_threshold=0)
+    
+    assert optimized['Timestamp'].tolist() == [pd.Timestamp('2023-01-05 10:30'), pd.Timestamp('2023-01-06 11:00:15'),
+                                               pd.Timestamp('2023-01-07 09:00'), pd.Timestamp('2023-01-08 12:00')]
+    for col in ['Time', 'Quarter', 'Mixed', 'Invalid']:
+        assert optimized[col].tolist() == df[col].tolist()
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_sidecar_hit_restores_sheets_and_memory_usage(tmp_path, xlsx_bytes, sample_frames, lazy):
+    """사이드카 캐시에서 읽은 시트는 다시 파싱하지 않고 데이터와 최적화 전후 메모리 사용량을 유지"""
+    pytest.importorskip('pyarrow')
+    from utils.sidecar_cache import SidecarCache
+    
+    sidecar = SidecarCache(str(tmp_path))
+    first = ExcelReader(sidecar=sidecar, optimize=True)
+    first_sheets = dict(first.read_excel(xlsx_bytes, lazy=lazy))
+    first_info = {name: first.get_data_info(name)['memory_usage'] for name in sample_frames}
+    
+    second = ExcelReader(sidecar=sidecar, optimize=True)
+    second_sheets = dict(second.read_excel(xlsx_bytes, lazy=lazy))
+    
+    assert second.parse_times == {}
+    for sheet_name in sample_frames:
+        pd.testing.assert_frame_equal(second_sheets[sheet_name], first_sheets[sheet_name])
+        memory_usage = second.get_data_info(sheet_name)['memory_usage']
+        assert memory_usage == first_info[sheet_name]
+        assert memory_usage['before'] > memory_usage['after']
+
+
+def test_workbook_cache_hit_skips_parsing(xlsx_bytes, sample_frames):
+    """같은 내용의 워크북은 메모리 캐시에서 같은 데이터프레임을 재사용"""
+    from utils.workbook_cache import WorkbookCache
+    
+    cache = WorkbookCache()
+    first = ExcelReader(cache=cache).read_excel(xlsx_bytes)
+    reader = ExcelReader(cache=cache)
+    second = reader.read_excel(xlsx_bytes)
+    
+    assert reader.parse_times == {}
+    for sheet_name in sample_frames:
+        assert second[sheet_name] is first[sheet_name]
+    assert cache.stats()['hits'] >= len(sample_frames)
+
+
+def test_process_pool_matches_sequential(xlsx_bytes, sample_frames, monkeypatch):
+    """프로세스 풀로 파싱한 결과가 순차 파싱과 같음"""
+    monkeypatch.setattr('os.cpu_count', lambda: 2)
+    reader = ExcelReader(optimize=True)
+    sheets = reader.read_excel(xlsx_bytes, workers=2)
+    
+    assert reader.sheet_errors == {}
+    assert sorted(reader.parse_times) == sorted(sample_frames)
+    sequential = ExcelReader(optimize=True).read_excel(xlsx_bytes)
+    for sheet_name in sample_frames:
+        pd.testing.assert_frame_equal(sheets[sheet_name], sequential[sheet_name])
+        assert sheets[sheet_name].attrs == sequential[sheet_name].attrs
+
+
+def test_process_pool_skipped_on_single_cpu(xlsx_bytes, monkeypatch):
+    """CPU가 하나면 프로세스 풀을 띄우지 않음"""
+    monkeypatch.setattr('os.cpu_count', lambda: 1)
+    monkeypatch.setattr(ExcelReader, '_parse_sheets_in_pool', lambda *args: pytest.fail("pool used"))
+    
+    reader = ExcelReader()
+    assert len(reader.read_excel(xlsx_bytes, workers=4)) == 2
+
+
+def test_sheet_chunks_match_pandas(xlsx_bytes, sample_frames):
+    """스트리밍한 청크를 이어 붙이면 pandas로 읽은 시트와 같고 모든 청크의 dtype이 같음"""
+    reader = ExcelReader()
+    chunks = list(reader.iter_sheet_chunks('Sales', chunksize=16, source=xlsx_bytes))
+    expected = sample_frames['Sales']
+    
+    assert [len(chunk) for chunk in chunks] == [16, 16, 16, 2]
+    assert all(chunk.dtypes.equals(chunks[0].dtypes) for chunk in chunks)
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected, check_dtype=False)
+    
+    with pytest.raises(ValueError):
+        next(reader.iter_sheet_chunks('Sales', chunksize=0, source=xlsx_bytes))
@@ -0,0 +1,83 @@
+import warnings
+import numpy as np
+import pandas as pd
+import pytest
+from utils.data_analyzer import DataAnalyzer
+from utils.financial_ratios import compute_ratios, extract_accounts, financial_ratio_table
+
+
+@pytest.fixture
+def statements():
+    """회사별, 연도별 wide 형식 재무제표 (한글 컬럼 이름)"""
+    return pd.DataFrame({
+        '회사': ['A', 'A', 'A', 'B', 'B', 'B'],
+        '연도': [2022, 2021, 2023, 2021, 2022, 2023],
+        '매출액': [120.0, 100.0, 150.0, 200.0, 0.0, 220.0],
+        '매출원가': [70.0, 60.0, 90.0, 150.0, 10.0, 160.0],
+        '당기순이익': [12.0, 10.0, 18.0, 20.0, -5.0, 30.0],
+        '자산총계': [300.0, 250.0, 320.0, 400.0, 410.0, 0.0],
+        '부채총계': [120.0, 100.0, 150.0, 180.0, 200.0, 190.0]
+    })
+
+
+def test_ratios_match_manual_calculation(statements):
+    """행별 비율과 파생 항목(매출총이익)이 직접 계산한 값과 같고, 분모가 0이면 NaN"""
+    accounts = extract_accounts(statements, ['회사', '연도'])
+    ratios = compute_ratios(accounts, ['회사'], '연도')
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        expected = pd.DataFrame({
+            'profit_margin': statements['당기순이익'] / statements['매출액'] * 100,
+            'gross_margin': (statements['매출액'] - statements['매출원가']) / statements['매출액'] * 100,
+            'roa': statements['당기순이익'] / statements['자산총계'] * 100,
+            'debt_ratio': statements['부채총계'] / statements['자산총계'] * 100,
+            'cost_ratio': statements['매출원가'] / statements['매출액'] * 100
+        }).replace([np.inf, -np.inf], np.nan)
+    pd.testing.assert_frame_equal(ratios[expected.columns], expected)
+    
+    ordered = statements.sort_values(['회사', '연도'])
+    growth = ordered.groupby('회사')['매출액'].pct_change().replace([np.inf, -np.inf], np.nan) * 100
+    pd.testing.assert_series_equal(ratios['revenue_growth'], growth.reindex(statements.index),
+                                   check_names=False)
+
+
+def test_grouped_table_averages_row_ratios(statements):
+    """그룹/기간별 표는 행별 비율의 평균이고, 키가 없으면 시트 전체 평균 한 행"""
+    accounts = extract_accounts(statements, ['회사'])
+    ratios = compute_ratios(accounts, ['회사'])
+    
+    table = financial_ratio_table(statements, group_by='회사')
+    pd.testing.assert_frame_equal(table, ratios.groupby(statements['회사']).mean())
+    
+    overall = DataAnalyzer(cache=None).financial_analysis(statements)
+    means = compute_ratios(extract_accounts(statements)).mean()
+    assert overall == pytest.approx({name: value for name, value in means.items() if pd.notna(value)})
+
+
+def test_long_format_sheet_is_pivoted_by_period():
+    """계정과목/금액 컬럼으로 된 long 형식 시트는 기간별로 합산한 뒤 비율 계산"""
+    long_df = pd.DataFrame({
+        'Year': [2022, 2022, 2022, 2023, 2023, 2023, 2023],
+        '계정과목': ['매출', '순이익', '총자산', 'Revenue', 'Net Income', '총자산', '기타'],
+        '금액': [100.0, 10.0, 200.0, 60.0, 9.0, 250.0, 5.0]
+    })
+    long_df.loc[len(long_df)] = [2023, '매출', 60.0]
+    
+    table = financial_ratio_table(long_df, period_col='Year')
+    np.testing.assert_allclose(table.loc[2022, ['profit_margin', 'roa']], [10.0, 5.0])
+    np.testing.assert_allclose(table.loc[2023, ['profit_margin', 'roa', 'revenue_growth']], [7.5, 3.6, 20.0])
+    assert financial_ratio_table(pd.DataFrame({'x': [1, 2]})).empty
+
+
+def test_categorical_group_keys_skip_unused_categories(statements):
+    """category로 최적화된 그룹 키도 경고 없이 계산하고, 데이터에 없는 범주는 행으로 만들지 않음"""
+    categorical = statements.assign(회사=pd.Categorical(statements['회사'], categories=['A', 'B', 'C']))
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        table = financial_ratio_table(categorical, group_by='회사', period_col='연도')
+    
+    expected = financial_ratio_table(statements, group_by='회사', period_col='연도')
+    assert 'C' not in table.index.get_level_values('회사')
+    pd.testing.assert_frame_equal(table.reset_index().astype({'회사': object}).sort_values(['회사', '연도'], ignore_index=True),
+                                  expected.reset_index().sort_values(['회사', '연도'], ignore_index=True))
@@ -0,0 +1,56 @@
+import gc
+import pandas as pd
+from utils.column_profile import build_column_profile, get_column_profile
+from utils.fingerprint import dataframe_fingerprint
+from utils.frame_memo import frame_memo
+
+
+def test_reuses_result_until_columns_change():
+    """같은 데이터프레임은 결과를 재사용하고 컬럼 구성이 바뀌면 다시 계산"""
+    calls = []
+    
+    @frame_memo
+    def count_columns(df, offset=0):
+        calls.append(1)
+        return df.shape[1] + offset
+    
+    df = pd.DataFrame({'a': [1, 2]})
+    assert count_columns(df) == 1
+    assert count_columns(df, 0) == 1
+    assert count_columns(df, offset=0) == 1
+    assert len(calls) == 1
+    
+    assert count_columns(df, 5) == 6
+    df['b'] = [3, 4]
+    assert count_columns(df) == 2
+    assert len(calls) == 3
+
+
+def test_entries_removed_with_frame():
+    """데이터프레임이 사라지면 저장된 결과도 삭제"""
+    @frame_memo(exclusive=True)
+    def total(df):
+        return df.sum().sum()
+    
+    df = pd.DataFrame({'a': [1, 2]})
+    assert total(df) == 3
+    assert len(total.cache_entries) == 1
+    
+    del df
+    gc.collect()
+    assert total.cache_entries == {}
+
+
+def test_column_profile_matches_build():
+    """메모된 컬럼 프로파일은 직접 계산한 프로파일과 같음"""
+    df = pd.DataFrame({'x': [1.0, None], 'name': ['a', 'b'], 'date': pd.to_datetime(['2023-01-01', None])})
+    assert get_column_profile(df) is get_column_profile(df)
+    assert get_column_profile(df) == build_column_profile(df)
+
+
+def test_fingerprint_depends_on_content():
+    """지문은 내용이 같으면 같고 값이 다르면 다름"""
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+    assert dataframe_fingerprint(df) == dataframe_fingerprint(df.copy())
+    assert dataframe_fingerprint(df) != dataframe_fingerprint(df.assign(a=[1, 2, 4]))
+    assert dataframe_fingerprint(df) != dataframe_fingerprint(df.rename(columns={'a': 'c'}))
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+from utils.data_analyzer import DataAnalyzer
+from utils.streaming_stats import QuantileSketch, StreamingStatistics
+
+
+def _chunks(df, size):
+    return [df.iloc[start:start + size] for start in range(0, len(df), size)]
+
+
+def test_streaming_descriptive_statistics_match_pandas(numeric_frame):
+    """청크로 누적한 기술통계가 pandas와 같음 (분위수는 압축 전이므로 정확한 값)"""
+    accumulator = StreamingStatistics.from_chunks(_chunks(numeric_frame, 300))
+    result = accumulator.descriptive_statistics()
+    
+    for col in ['a', 'b', 'c', 'd', 'e']:
+        series = numeric_frame[col].astype(float)
+        assert result[col]['count'] == series.count()
+        assert result[col]['missing_count'] == series.isna().sum()
+        np.testing.assert_allclose(result[col]['mean'], series.mean(), rtol=1e-12)
+        np.testing.assert_allclose(result[col]['std'], series.std(), rtol=1e-9)
+        np.testing.assert_allclose(result[col]['skewness'], series.skew(), rtol=1e-6, atol=1e-12)
+        np.testing.assert_allclose(result[col]['kurtosis'], series.kurt(), rtol=1e-6, atol=1e-12)
+        np.testing.assert_allclose([result[col]['q1'], result[col]['median'], result[col]['q3']],
+                                   series.quantile([0.25, 0.5, 0.75]).to_numpy(), rtol=1e-12)
+        assert result[col]['min'] == series.min() and result[col]['max'] == series.max()
+    assert isinstance(result['c']['min'], np.integer)
+
+
+def test_streaming_report_matches_in_memory_analysis(numeric_frame):
+    """chunked_analysis_report의 상관계수가 전체 데이터의 correlation_analysis와 같음"""
+    analyzer = DataAnalyzer(cache=None)
+    report = analyzer.chunked_analysis_report(_chunks(numeric_frame, 250))
+    corr, p_values = report['correlation_analysis']
+    expected_corr, expected_p = analyzer.correlation_analysis(numeric_frame)
+    
+    pd.testing.assert_frame_equal(corr, expected_corr, atol=1e-9)
+    for col, expected_row in expected_p.items():
+        for other, p_value in expected_row.items():
+            np.testing.assert_allclose(p_values[col][other], p_value, rtol=1e-6, atol=1e-12)
+
+
+def test_streaming_update_leaves_chunk_unchanged(numeric_frame):
+    """누적 중에 입력 청크의 값이 바뀌지 않음"""
+    chunk = numeric_frame[['a', 'b', 'e']].copy()
+    expected = chunk.copy()
+    StreamingStatistics().update(chunk)
+    pd.testing.assert_frame_equal(chunk, expected)
+
+
+def test_streaming_merge_equals_single_pass(numeric_frame):
+    """따로 누적한 뒤 병합한 결과가 한 번에 누적한 결과와 같음"""
+    chunks = _chunks(numeric_frame, 400)
+    single = StreamingStatistics.from_chunks(chunks)
+    merged = StreamingStatistics.from_chunks(chunks[:2]).merge(StreamingStatistics.from_chunks(chunks[2:]))
+    
+    single_stats, merged_stats = single.descriptive_statistics(), merged.descriptive_statistics()
+    for col in single_stats:
+        for key in ['count', 'mean', 'std', 'skewness', 'kurtosis', 'min', 'max', 'missing_count']:
+            np.testing.assert_allclose(merged_stats[col][key], single_stats[col][key], rtol=1e-9)
+    pd.testing.assert_frame_equal(merged.correlation_analysis()[0], single.correlation_analysis()[0], atol=1e-12)
+
+
+def test_quantile_sketch_error_after_compression():
+    """압축이 일어난 뒤에도 분위수 추정값의 순위 오차가 작음"""
+    values = np.random.default_rng(1).normal(size=200_000)
+    sketch = QuantileSketch(capacity=256)
+    for part in np.array_split(values, 50):
+        sketch.update(part)
+    
+    qs = [0.1, 0.25, 0.5, 0.75, 0.9]
+    ranks = np.searchsorted(np.sort(values), sketch.quantiles(qs)) / len(values)
+    assert sketch.count == len(values)
+    np.testing.assert_allclose(ranks, qs, atol=0.02)
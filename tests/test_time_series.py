@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+from utils.data_analyzer import DataAnalyzer
+from utils.time_series import TimeSeries, _time_index, get_time_series
+
+
+@pytest.fixture
+def sales_frame():
+    """날짜 순서가 섞이고 값, 그룹에 결측값이 있는 시계열"""
+    rng = np.random.default_rng(0)
+    n = 300
+    df = pd.DataFrame({
+        'Date': pd.Timestamp('2022-01-01') + pd.to_timedelta(rng.permutation(n), unit='D'),
+        'Region': rng.choice(['North', 'South', 'East'], n).astype(object),
+        'Sales': rng.normal(100, 10, n) + np.arange(n) * 0.5,
+        'Quantity': rng.integers(1, 50, n)
+    })
+    df.loc[rng.integers(0, n, 20), 'Sales'] = np.nan
+    df.loc[rng.integers(0, n, 15), 'Region'] = None
+    df.loc[3, 'Region'] = np.nan
+    return df
+
+
+def _reference_trend(df, date_col, value_col):
+    """날짜 순서의 행 번호에 대한 np.polyfit 직선"""
+    ordered = df.sort_values(date_col, kind='stable')
+    positions = np.arange(len(ordered), dtype=float)
+    values = ordered[value_col].to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+    slope, intercept = np.polyfit(positions[valid], values[valid], 1)
+    return slope, intercept
+
+
+def test_trend_matches_polyfit(sales_frame):
+    """전체 추세가 np.polyfit과 같음"""
+    trend = DataAnalyzer(cache=None).trend_analysis(sales_frame, 'Date', 'Sales')
+    slope, intercept = _reference_trend(sales_frame, 'Date', 'Sales')
+    
+    assert trend['slope'] == pytest.approx(slope)
+    assert trend['intercept'] == pytest.approx(intercept)
+    assert trend['n_points'] == sales_frame['Sales'].notna().sum()
+
+
+def test_group_trend_skips_missing_group_keys(sales_frame):
+    """그룹 값이 없는 행은 제외하고 그룹별 추세를 계산"""
+    trends = DataAnalyzer(cache=None).column_trend_analysis(sales_frame, 'Date', 'Region')
+    
+    assert set(trends) == {'North', 'South', 'East'}
+    for region, group in sales_frame.groupby('Region'):
+        slope, intercept = _reference_trend(group, 'Date', 'Sales')
+        assert trends[region]['Sales']['slope'] == pytest.approx(slope)
+        assert trends[region]['Sales']['intercept'] == pytest.approx(intercept)
+        assert trends[region]['Quantity']['n_points'] == len(group)
+
+
+def test_group_seasonal_matches_groupby(sales_frame):
+    """그룹별 월별 평균이 groupby 결과와 같고 그룹 값이 없는 행은 제외"""
+    seasonal = DataAnalyzer(cache=None).column_seasonal_analysis(sales_frame, 'Date', 'Region')
+    
+    assert set(seasonal) == {'North', 'South', 'East'}
+    expected = sales_frame.groupby(['Region', sales_frame['Date'].dt.month])['Sales'].mean()
+    for (region, month), mean in expected.items():
+        assert seasonal[region]['Sales']['monthly_pattern'][month] == pytest.approx(mean)
+
+
+def test_all_group_keys_missing():
+    """그룹 값이 모두 없으면 빈 결과"""
+    df = pd.DataFrame({
+        'Date': pd.date_range('2023-01-01', periods=5),
+        'Region': [None] * 5,
+        'Sales': np.arange(5.0)
+    })
+    series = TimeSeries(df, 'Date', 'Region')
+    assert series.trend() == {}
+    assert series.seasonal() == {}
+
+
+def test_memo_keeps_only_row_order_and_group_codes(sales_frame):
+    """데이터프레임별로 보관하는 것은 행 위치와 그룹 코드뿐이고, 요청한 컬럼만 계산해도 결과는 같음"""
+    wide = sales_frame.assign(**{f'extra_{i}': np.arange(len(sales_frame), dtype=float) for i in range(20)})
+    series = get_time_series(wide, 'Date', 'Region')
+    
+    entries = [entry[2] for entry in _time_index.cache_entries.values() if entry[0]() is wide]
+    assert len(entries) == 1
+    order, dates, codes, _ = entries[0]
+    assert order.ndim == dates.ndim == codes.ndim == 1 and len(order) == len(dates) == len(codes)
+    
+    full = series.trend()
+    assert series.trend(['Sales']) == {region: {'Sales': trends['Sales']} for region, trends in full.items()}
+    assert get_time_series(wide, 'Date', 'Region').order is order
@@ -0,0 +1,30 @@
+import os
+from utils.upload_store import UploadStore
+
+
+def test_upload_store_spills_least_recently_used_to_disk(tmp_path):
+    """메모리 한도를 넘으면 가장 오래 사용하지 않은 파일을 디스크로 내보내고 내용은 그대로 반환"""
+    store = UploadStore(max_memory_bytes=10, spill_dir=str(tmp_path))
+    first = store.put(b'123456', filename='first.xlsx')
+    second = store.put(b'abcdef', filename='second.xlsx')
+    
+    stats = store.stats()
+    assert stats['memory_bytes'] == 6 and stats['spilled_entries'] == 1 and stats['spilled_bytes'] == 6
+    assert os.listdir(tmp_path) == [f"{first}.bin"]
+    assert store.get(first) == b'123456' and store.get(second) == b'abcdef'
+    assert store.get_filename(first) == 'first.xlsx'
+    
+    store.remove(first)
+    assert store.get(first) is None and os.listdir(tmp_path) == []
+
+
+def test_upload_store_drops_entries_without_spilling_and_expires():
+    """디스크를 쓰지 않으면 한도를 넘는 파일을 삭제하고, TTL이 지난 파일은 만료됨"""
+    store = UploadStore(max_memory_bytes=10, spill_to_disk=False)
+    first = store.put(b'123456')
+    second = store.put(b'abcdef')
+    assert store.get(first) is None and store.get(second) == b'abcdef'
+    
+    store.ttl_seconds = -1
+    assert store.purge_expired() == 1
+    assert store.stats()['entries'] == 0 and store.stats()['memory_bytes'] == 0
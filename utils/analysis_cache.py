@@ -0,0 +1,47 @@
+from typing import Dict, Tuple
+from utils.byte_lru import ByteLRUCache
+
+
+class AnalysisCache(ByteLRUCache):
+    """
+    분석 섹션 결과를 (섹션, 데이터 지문, 파라미터) 키로 보관하는 LRU 캐시
+    
+    섹션 결과(딕셔너리, 데이터프레임 등)는 크기를 재기 어렵고 대부분 작으므로 항목마다
+    크기 1로 세어 항목 수로 제한합니다.
+    """
+    
+    def __init__(self, max_entries: int = 128):
+        super().__init__(max_entries)
+    
+    @property
+    def max_entries(self) -> int:
+        """저장할 최대 항목 수"""
+        return self.max_bytes
+    
+    def get(self, key: Tuple):
+        """
+        캐시된 섹션 결과 반환 (없으면 None)
+
+        반환된 결과는 여러 리포트가 공유하므로 수정하지 말아야 합니다.
+        """
+        return self._get(key)
+    
+    def put(self, key: Tuple, result):
+        """섹션 결과 저장 (가장 오래 사용하지 않은 항목부터 제거)"""
+        self._put(key, result, 1)
+    
+    def stats(self) -> Dict:
+        """캐시 적중/실패 통계 반환"""
+        stats = super().stats()
+        return {
+            'hits': stats['hits'],
+            'misses': stats['misses'],
+            'hit_rate': stats['hit_rate'],
+            'evictions': stats['evictions'],
+            'entries': stats['entries'],
+            'max_entries': self.max_entries
+        }
+
+
+# 프로세스 전체에서 공유하는 분석 결과 캐시 (Streamlit 재실행 사이에도 유지)
+analysis_cache = AnalysisCache()
@@ -0,0 +1,82 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+class ByteLRUCache:
+    """
+    항목마다 크기(바이트)를 받아 전체 크기 예산 안에서 보관하는 스레드 안전 LRU 캐시
+
+    WorkbookCache, FigureCache, AnalysisCache처럼 값의 종류와 크기 계산 방법만 다른 캐시의
+    공통 부분입니다. 하위 클래스는 자기 키와 값 형식에 맞는 get/put을 정의하고 _get/_put을
+    사용합니다 (항목마다 크기 1을 넘기면 항목 수로 제한하는 캐시가 됨).
+    """
+
+    def __init__(self, max_bytes: int, max_entry_bytes: Optional[int] = None):
+        """
+        Args:
+            max_bytes (int): 저장할 값 전체의 크기 예산
+            max_entry_bytes (int): 항목 하나의 최대 크기 (None이면 max_bytes)
+        """
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def stats(self) -> Dict:
+        """캐시 적중/실패 통계 반환"""
+        with self._lock:
+            total = self.hits + self.misses
+            stats = {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'current_bytes': self.current_bytes,
+                'max_bytes': self.max_bytes
+            }
+            if self.max_entry_bytes is not None:
+                stats['max_entry_bytes'] = self.max_entry_bytes
+            return stats
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def _get(self, key: Tuple):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def _put(self, key: Tuple, value, nbytes: int):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+
+            # 예산(또는 항목 하나의 최대 크기)보다 큰 항목은 저장하지 않음
+            limit = self.max_bytes if self.max_entry_bytes is None else min(self.max_bytes, self.max_entry_bytes)
+            if nbytes > limit:
+                return
+
+            self._entries[key] = (value, nbytes)
+            self.current_bytes += nbytes
+
+            # 가장 오래 사용하지 않은 항목부터 제거
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_bytes
+                self.evictions += 1
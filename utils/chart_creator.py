@@ -1,17 +1,178 @@
+import functools
+import inspect
 import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 import matplotlib.pyplot as plt
 import seaborn as sns
 from typing import Dict, List, Optional, Tuple
 import streamlit as st
+from utils.column_profile import get_column_profile
+from utils.figure_cache import FigureCache, figure_cache
+from utils.fingerprint import dataframe_fingerprint
+
+
+def _minmax_indices(values: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    순서를 유지한 채 구간별 최소/최대값 위치만 남기는 데시메이션
+    
+    처음과 마지막 점을 뺀 나머지 점 수를 둘로 나눈 만큼의 연속 구간으로 행을 나누고 구간마다
+    최소값과 최대값을 남기므로 급격한 변화(피크)가 사라지지 않습니다. 처음과 마지막 점은 항상
+    포함되며, 전체 점 수는 max_points를 넘지 않습니다 (max_points가 4 미만이면 최대 4개).
+    """
+    n = len(values)
+    n_buckets = max(1, (max_points - 2) // 2)
+    width = -(-n // n_buckets)
+    
+    padded = np.full(n_buckets * width, np.nan)
+    padded[:n] = values
+    padded = padded.reshape(n_buckets, width)
+    offsets = np.arange(n_buckets) * width
+    
+    minimum = np.where(np.isnan(padded), np.inf, padded).argmin(axis=1) + offsets
+    maximum = np.where(np.isnan(padded), -np.inf, padded).argmax(axis=1) + offsets
+    
+    indices = np.unique(np.concatenate([[0, n - 1], minimum, maximum]))
+    return indices[indices < n]
+
+
+def _density_sample_indices(x: np.ndarray, y: np.ndarray, max_points: int,
+                            grid_size: int = 64, seed: int = 0) -> np.ndarray:
+    """
+    밀도를 유지하는 산점도 표본 위치
+    
+    무작위 표본으로 점의 상대적 밀도를 유지하되, 점이 있는 격자 칸마다 최소 한 점을 먼저
+    남겨서 밀도가 낮은 영역과 이상치가 사라지지 않게 합니다.
+    """
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(len(x))
+    
+    cells = np.zeros(len(x), dtype=np.int64)
+    for values in (x, y):
+        finite = np.isfinite(values)
+        low, high = (values[finite].min(), values[finite].max()) if finite.any() else (0.0, 0.0)
+        scale = grid_size / (high - low) if high > low else 0.0
+        bins = np.clip(np.where(finite, (values - low) * scale, grid_size), 0, grid_size).astype(np.int64)
+        cells = cells * (grid_size + 1) + bins
+    
+    # 칸마다 무작위 순서에서 처음 나온 점을 대표로 사용
+    _, first = np.unique(cells[order], return_index=True)
+    representatives = order[np.sort(first)][:max_points]
+    
+    remaining = max_points - len(representatives)
+    if remaining > 0:
+        chosen = np.zeros(len(x), dtype=bool)
+        chosen[representatives] = True
+        others = order[~chosen[order]][:remaining]
+        representatives = np.concatenate([representatives, others])
+    
+    return np.sort(representatives)
+
+
+def _as_numeric(values: pd.Series) -> np.ndarray:
+    """데시메이션 계산용 float 배열 (날짜는 정수 시각, 범주는 코드)"""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.to_numpy(dtype='datetime64[ns]').astype(np.int64).astype(np.float64)
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return values.to_numpy(dtype=np.float64, na_value=np.nan)
+    codes, _ = pd.factorize(values)
+    return np.where(codes < 0, np.nan, codes).astype(np.float64)
+
+
+def _value_range(values: np.ndarray) -> Tuple[float, float]:
+    """유한한 값의 (최소, 최대) 범위 (값이 하나뿐이면 앞뒤로 0.5씩 넓힘)"""
+    finite = values[np.isfinite(values)]
+    if len(finite) == 0:
+        return 0.0, 1.0
+    low, high = float(finite.min()), float(finite.max())
+    return (low - 0.5, high + 0.5) if low == high else (low, high)
+
+
+def _raster_grid(x: np.ndarray, y: np.ndarray, weights: Optional[np.ndarray],
+                 x_range: Tuple[float, float], y_range: Tuple[float, float],
+                 bins: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    범위 안의 점을 (y 칸 x x 칸) 격자로 집계 (weights가 있으면 칸별 평균, 없으면 점 수)
+    
+    칸 번호를 직접 계산해 bincount로 세므로 점 수에 비례하는 한 번의 계산으로 끝납니다.
+    점이 없는 칸은 NaN (히트맵에서 투명)입니다.
+    """
+    nx, ny = bins
+    (x0, x1), (y0, y1) = x_range, y_range
+    
+    valid = np.isfinite(x) & np.isfinite(y) & (x >= x0) & (x <= x1) & (y >= y0) & (y <= y1)
+    if weights is not None:
+        valid &= np.isfinite(weights)
+    
+    # 범위의 오른쪽/위쪽 끝 값은 마지막 칸에 포함
+    ix = np.minimum(((x[valid] - x0) * (nx / (x1 - x0))).astype(np.intp), nx - 1)
+    iy = np.minimum(((y[valid] - y0) * (ny / (y1 - y0))).astype(np.intp), ny - 1)
+    cells = iy * nx + ix
+    
+    counts = np.bincount(cells, minlength=nx * ny).reshape(ny, nx).astype(np.float64)
+    if weights is None:
+        z = counts
+    else:
+        sums = np.bincount(cells, weights=weights[valid], minlength=nx * ny).reshape(ny, nx)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            z = sums / counts
+    z[counts == 0] = np.nan
+    
+    x_centers = x0 + (np.arange(nx) + 0.5) * ((x1 - x0) / nx)
+    y_centers = y0 + (np.arange(ny) + 0.5) * ((y1 - y0) / ny)
+    return x_centers, y_centers, z
+
+
+def _cached_figure(method):
+    """
+    차트 생성 메서드의 결과를 (데이터 지문, 메서드, 설정, 인자) 키로 캐시하는 데코레이터
+    
+    캐시에는 JSON 문자열을 저장하고 적중하면 새 Figure로 복원하므로, 반환된 차트를
+    수정해도 캐시된 차트에는 영향이 없습니다. 데이터가 없는 빈 차트는 저장하지 않습니다.
+    """
+    signature = inspect.signature(method)
+    
+    @functools.wraps(method)
+    def wrapper(self, df: pd.DataFrame, *args, **kwargs) -> go.Figure:
+        if self.cache is None:
+            return method(self, df, *args, **kwargs)
+        
+        bound = signature.bind(self, df, *args, **kwargs)
+        bound.apply_defaults()
+        spec = tuple((name, tuple(value) if isinstance(value, list) else value)
+                     for name, value in list(bound.arguments.items())[2:])
+        key = (dataframe_fingerprint(df), method.__name__, self.max_points, self.webgl_threshold) + spec
+        
+        figure_json = self.cache.get(key)
+        if figure_json is not None:
+            return pio.from_json(figure_json)
+        
+        fig = method(self, df, *args, **kwargs)
+        if fig.data:
+            self.cache.put(key, fig.to_json())
+        return fig
+    
+    return wrapper
 
 
 class ChartCreator:
     """다양한 차트를 생성하는 클래스"""
     
-    def __init__(self):
+    def __init__(self, max_points: Optional[int] = 5000, webgl_threshold: Optional[int] = 1000,
+                 cache: Optional[FigureCache] = figure_cache):
+        """
+        Args:
+            max_points (int): 선/영역/산점도 트레이스 하나에 표시할 최대 점 수
+                              (넘으면 다운샘플링, None이면 모든 점 표시)
+            webgl_threshold (int): 선그래프/산점도에 그릴 점 수가 이 값을 넘으면 SVG 대신
+                                   WebGL(Scattergl) 트레이스 사용 (None이면 항상 SVG)
+            cache (FigureCache): 생성한 차트를 재사용할 캐시 (None이면 캐시 사용 안 함)
+        """
+        self.max_points = max_points
+        self.webgl_threshold = webgl_threshold
+        self.cache = cache
         self.chart_types = {
             'bar': '막대그래프',
             'line': '선그래프',
@@ -23,10 +184,21 @@ class ChartCreator:
             'area': '영역차트'
         }
     
+    @_cached_figure
     def create_bar_chart(self, df: pd.DataFrame, x_col: str, y_col: str, 
-                         color_col: Optional[str] = None, title: str = "막대그래프") -> go.Figure:
-        """막대그래프 생성"""
-        fig = px.bar(df, x=x_col, y=y_col, color=color_col, title=title)
+                         color_col: Optional[str] = None, title: str = "막대그래프", agg: str = 'sum') -> go.Figure:
+        """
+        막대그래프 생성
+        
+        같은 (x, 색상) 값의 행이 여러 개면 미리 집계해서 막대 하나로 보냅니다.
+        기본값인 합계는 plotly가 행마다 쌓아 그리는 막대와 같은 모양입니다.
+        
+        Args:
+            agg (str): 같은 막대에 속한 행의 집계 방법 ('sum' 또는 'mean')
+        """
+        keys = [x_col] + ([color_col] if color_col is not None and color_col != x_col else [])
+        plot_df = self._aggregate(df, keys, y_col, agg)
+        fig = px.bar(plot_df, x=x_col, y=y_col, color=color_col, title=title)
         fig.update_layout(
             xaxis_title=x_col,
             yaxis_title=y_col,
@@ -34,36 +206,120 @@ class ChartCreator:
         )
         return fig
     
+    @_cached_figure
     def create_line_chart(self, df: pd.DataFrame, x_col: str, y_col: str,
-                         color_col: Optional[str] = None, title: str = "선그래프") -> go.Figure:
-        """선그래프 생성"""
-        fig = px.line(df, x=x_col, y=y_col, color=color_col, title=title)
+                         color_col: Optional[str] = None, title: str = "선그래프",
+                         render_mode: str = 'auto', decimate: bool = True) -> go.Figure:
+        """
+        선그래프 생성 (트레이스별 점 수가 max_points를 넘으면 구간별 최소/최대값으로 다운샘플링)
+        
+        Args:
+            render_mode (str): 'auto' (점 수가 webgl_threshold를 넘으면 WebGL), 'svg', 'webgl'
+            decimate (bool): False면 다운샘플링 없이 모든 점 표시 (WebGL과 함께 사용)
+        """
+        plot_df = self._downsample_lines(df, y_col, color_col) if decimate else df
+        fig = px.line(plot_df, x=x_col, y=y_col, color=color_col, title=title,
+                      render_mode=self._render_mode(len(plot_df), render_mode))
         fig.update_layout(
             xaxis_title=x_col,
             yaxis_title=y_col,
             template="plotly_white"
         )
+        self._mark_decimated(fig, len(df), len(plot_df))
         return fig
     
+    @_cached_figure
     def create_pie_chart(self, df: pd.DataFrame, values_col: str, names_col: str,
                          title: str = "파이차트") -> go.Figure:
-        """파이차트 생성"""
-        fig = px.pie(df, values=values_col, names=names_col, title=title)
+        """파이차트 생성 (같은 이름의 행은 미리 합산)"""
+        plot_df = self._aggregate(df, [names_col], values_col, 'sum')
+        fig = px.pie(plot_df, values=values_col, names=names_col, title=title)
         fig.update_layout(template="plotly_white")
         return fig
     
     def create_scatter_plot(self, df: pd.DataFrame, x_col: str, y_col: str,
                            color_col: Optional[str] = None, size_col: Optional[str] = None,
-                           title: str = "산점도") -> go.Figure:
-        """산점도 생성"""
-        fig = px.scatter(df, x=x_col, y=y_col, color=color_col, size=size_col, title=title)
+                           title: str = "산점도", render_mode: str = 'auto', decimate: bool = True) -> go.Figure:
+        """
+        산점도 생성 (트레이스별 점 수가 max_points를 넘으면 밀도를 유지하는 표본으로 다운샘플링)
+        
+        Args:
+            render_mode (str): 'auto' (점 수가 webgl_threshold를 넘으면 WebGL), 'svg', 'webgl',
+                               'raster' (create_raster_scatter로 격자 집계, size_col은 칸별 평균으로 표시)
+            decimate (bool): False면 다운샘플링 없이 모든 점 표시 (WebGL과 함께 사용)
+        """
+        if render_mode == 'raster':
+            return self.create_raster_scatter(df, x_col, y_col, value_col=size_col, title=title)
+        return self._create_point_scatter(df, x_col, y_col, color_col, size_col, title, render_mode, decimate)
+    
+    @_cached_figure
+    def _create_point_scatter(self, df: pd.DataFrame, x_col: str, y_col: str, color_col: Optional[str],
+                              size_col: Optional[str], title: str, render_mode: str, decimate: bool) -> go.Figure:
+        """점을 그리는 산점도 (래스터가 아닌 렌더링 방식)"""
+        plot_df = self._downsample_scatter(df, x_col, y_col, color_col) if decimate else df
+        fig = px.scatter(plot_df, x=x_col, y=y_col, color=color_col, size=size_col, title=title,
+                         render_mode=self._render_mode(len(plot_df), render_mode))
         fig.update_layout(
             xaxis_title=x_col,
             yaxis_title=y_col,
             template="plotly_white"
         )
+        self._mark_decimated(fig, len(df), len(plot_df))
+        return fig
+    
+    def create_raster_scatter(self, df: pd.DataFrame, x_col: str, y_col: str,
+                              value_col: Optional[str] = None, title: str = "산점도",
+                              x_range: Optional[Tuple[float, float]] = None,
+                              y_range: Optional[Tuple[float, float]] = None,
+                              bins: Tuple[int, int] = (256, 192)) -> go.Figure:
+        """
+        점을 2차원 격자로 집계해 히트맵으로 그린 산점도
+        
+        점 수와 관계없이 격자 크기만큼의 값만 보냅니다. 범위를 지정하면 그 범위 안의 점만
+        다시 집계하므로 확대할 때마다 해당 범위를 같은 해상도로 볼 수 있습니다.
+        범위와 컬럼 정보는 layout.meta에 기록됩니다. 격자 집계가 캐시된 JSON을 복원하는 것보다
+        빠르므로 차트 캐시를 사용하지 않습니다.
+        
+        Args:
+            value_col (str): 칸별 평균을 표시할 컬럼 (없으면 칸별 점 수)
+            x_range, y_range (Tuple[float, float]): 집계 범위 (없으면 데이터 전체 범위)
+            bins (Tuple[int, int]): x, y 방향 칸 수
+        """
+        x = _as_numeric(df[x_col])
+        y = _as_numeric(df[y_col])
+        weights = _as_numeric(df[value_col]) if value_col is not None else None
+        x_range = x_range if x_range is not None else _value_range(x)
+        y_range = y_range if y_range is not None else _value_range(y)
+        
+        x_centers, y_centers, z = _raster_grid(x, y, weights, x_range, y_range, bins)
+        label = f"{value_col} 평균" if value_col is not None else "점 수"
+        
+        fig = go.Figure(go.Heatmap(
+            x=x_centers, y=y_centers, z=z,
+            colorscale="Viridis", hoverongaps=False,
+            colorbar=dict(title=label),
+            hovertemplate=f"{x_col}: %{{x}}<br>{y_col}: %{{y}}<br>{label}: %{{z}}<extra></extra>"
+        ))
+        fig.update_layout(
+            title=title,
+            xaxis_title=x_col,
+            yaxis_title=y_col,
+            template="plotly_white",
+            meta={
+                'raster': True,
+                'x_col': x_col,
+                'y_col': y_col,
+                'value_col': value_col,
+                'x_range': list(x_range),
+                'y_range': list(y_range),
+                'original_points': len(df)
+            }
+        )
+        fig.update_xaxes(range=list(x_range))
+        fig.update_yaxes(range=list(y_range))
         return fig
     
+    @_cached_figure
     def create_histogram(self, df: pd.DataFrame, column: str, bins: int = 30,
                         title: str = "히스토그램") -> go.Figure:
         """히스토그램 생성"""
@@ -75,10 +331,19 @@ class ChartCreator:
         )
         return fig
     
+    @_cached_figure
     def create_box_plot(self, df: pd.DataFrame, x_col: str, y_col: str,
                        title: str = "박스플롯") -> go.Figure:
-        """박스플롯 생성"""
-        fig = px.box(df, x=x_col, y=y_col, title=title)
+        """
+        박스플롯 생성
+        
+        행 수가 max_points를 넘으면 그룹별 사분위수와 수염 위치를 미리 계산해서 보내고,
+        원본 값은 이상치만 (최대 max_points개) 함께 보냅니다.
+        """
+        if self.max_points is not None and len(df) > self.max_points:
+            fig = self._precomputed_box_plot(df, x_col, y_col, title)
+        else:
+            fig = px.box(df, x=x_col, y=y_col, title=title)
         fig.update_layout(
             xaxis_title=x_col,
             yaxis_title=y_col,
@@ -86,14 +351,15 @@ class ChartCreator:
         )
         return fig
     
+    @_cached_figure
     def create_heatmap(self, df: pd.DataFrame, columns: Optional[List[str]] = None,
                       title: str = "히트맵") -> go.Figure:
         """히트맵 생성"""
-        if columns is None:
-            # 수치형 컬럼만 선택
-            numeric_df = df.select_dtypes(include=[np.number])
-        else:
-            numeric_df = df[columns].select_dtypes(include=[np.number])
+        # 수치형 컬럼만 선택
+        numeric_cols = get_column_profile(df)['numeric_columns']
+        if columns is not None:
+            numeric_cols = [col for col in columns if col in numeric_cols]
+        numeric_df = df[numeric_cols]
         
         if numeric_df.empty:
             st.warning("히트맵을 생성할 수 있는 수치형 데이터가 없습니다.")
@@ -111,20 +377,161 @@ class ChartCreator:
         fig.update_layout(template="plotly_white")
         return fig
     
+    @_cached_figure
     def create_area_chart(self, df: pd.DataFrame, x_col: str, y_col: str,
                          color_col: Optional[str] = None, title: str = "영역차트") -> go.Figure:
-        """영역차트 생성"""
-        fig = px.area(df, x=x_col, y=y_col, color=color_col, title=title)
+        """영역차트 생성 (트레이스별 점 수가 max_points를 넘으면 구간별 최소/최대값으로 다운샘플링)"""
+        plot_df = self._downsample_area(df, x_col, y_col, color_col)
+        fig = px.area(plot_df, x=x_col, y=y_col, color=color_col, title=title)
         fig.update_layout(
             xaxis_title=x_col,
             yaxis_title=y_col,
             template="plotly_white"
         )
+        self._mark_decimated(fig, len(df), len(plot_df))
         return fig
     
+    def _aggregate(self, df: pd.DataFrame, keys: List[str], value_col: str, agg: str) -> pd.DataFrame:
+        """키가 같은 행을 집계 (키가 모두 다르거나 값 컬럼이 키이면 원본 그대로, 처음 나온 순서 유지)"""
+        # 값 컬럼이 키이기도 하면 (예: 수치형 컬럼만 있는 시트에서 x와 y가 같음) plotly에 그대로 넘김
+        if len(df) == 0 or value_col in keys:
+            return df
+        
+        grouped = df.groupby(keys, sort=False, observed=True, dropna=False)[value_col]
+        if grouped.ngroups == len(df):
+            return df
+        
+        # 값이 모두 없는 그룹은 0이 아닌 빈 막대로 표시
+        aggregated = grouped.sum(min_count=1) if agg == 'sum' else grouped.agg(agg)
+        return aggregated.reset_index()
+    
+    def _precomputed_box_plot(self, df: pd.DataFrame, x_col: str, y_col: str, title: str) -> go.Figure:
+        """그룹별 사분위수와 수염을 미리 계산한 박스플롯 (수염은 1.5 IQR 안의 가장 먼 값)"""
+        # 그룹 값이 없는 행은 px.box와 같이 제외 (어느 박스에도 속하지 않음)
+        df = df.loc[df[x_col].notna()]
+        values = df[y_col]
+        groups = df[x_col]
+        grouped = values.groupby(groups, sort=False, observed=True)
+        
+        quartiles = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+        box_stats = pd.DataFrame({'q1': quartiles[0.25], 'median': quartiles[0.5], 'q3': quartiles[0.75]})
+        iqr = box_stats['q3'] - box_stats['q1']
+        lower_bound = box_stats['q1'] - 1.5 * iqr
+        upper_bound = box_stats['q3'] + 1.5 * iqr
+        
+        # 행마다 자기 그룹의 경계값과 비교
+        row_lower = lower_bound.reindex(groups).to_numpy()
+        row_upper = upper_bound.reindex(groups).to_numpy()
+        raw = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        inside = (raw >= row_lower) & (raw <= row_upper)
+        inside_values = values.where(inside).groupby(groups, sort=False, observed=True)
+        box_stats['lowerfence'] = inside_values.min()
+        box_stats['upperfence'] = inside_values.max()
+        box_stats = box_stats.dropna(subset=['median'])
+        
+        outliers = df.loc[~inside & ~np.isnan(raw), [x_col, y_col]]
+        if len(outliers) > self.max_points:
+            outliers = outliers.iloc[_density_sample_indices(
+                _as_numeric(outliers[x_col]), _as_numeric(outliers[y_col]), self.max_points)]
+        
+        color = px.colors.qualitative.Plotly[0]
+        fig = go.Figure()
+        fig.add_trace(go.Box(
+            x=box_stats.index.tolist(),
+            q1=box_stats['q1'], median=box_stats['median'], q3=box_stats['q3'],
+            lowerfence=box_stats['lowerfence'], upperfence=box_stats['upperfence'],
+            name=y_col, marker_color=color, boxpoints=False, showlegend=False
+        ))
+        if len(outliers) > 0:
+            fig.add_trace(go.Scatter(
+                x=outliers[x_col], y=outliers[y_col], mode='markers', name='이상치',
+                marker=dict(color=color, size=4), showlegend=False
+            ))
+        fig.update_layout(title=title, meta={'aggregated': True, 'original_points': len(df)})
+        return fig
+    
+    def _render_mode(self, n_points: int, render_mode: str) -> str:
+        """plotly express에 넘길 렌더링 방식 ('svg' 또는 'webgl')"""
+        if render_mode == 'auto':
+            use_webgl = self.webgl_threshold is not None and n_points > self.webgl_threshold
+            return 'webgl' if use_webgl else 'svg'
+        if render_mode not in ('svg', 'webgl'):
+            raise ValueError(f"지원하지 않는 렌더링 방식입니다: {render_mode}")
+        return render_mode
+    
+    def _trace_positions(self, df: pd.DataFrame, color_col: Optional[str]) -> List[np.ndarray]:
+        """트레이스(색상 그룹)별 행 위치 (색상 컬럼이 없으면 전체가 한 트레이스)"""
+        if color_col is None:
+            return [np.arange(len(df))]
+        return list(df.groupby(color_col, sort=False, observed=True, dropna=False).indices.values())
+    
+    def _downsample_lines(self, df: pd.DataFrame, y_col: str, color_col: Optional[str]) -> pd.DataFrame:
+        """트레이스마다 구간별 최소/최대값 행만 남김"""
+        if self.max_points is None or len(df) <= self.max_points:
+            return df
+        
+        values = _as_numeric(df[y_col])
+        selected = []
+        for positions in self._trace_positions(df, color_col):
+            if len(positions) > self.max_points:
+                positions = positions[_minmax_indices(values[positions], self.max_points)]
+            selected.append(positions)
+        
+        selected = np.sort(np.concatenate(selected))
+        return df if len(selected) == len(df) else df.iloc[selected]
+    
+    def _downsample_area(self, df: pd.DataFrame, x_col: str, y_col: str, color_col: Optional[str]) -> pd.DataFrame:
+        """영역차트 다운샘플링 (누적 영역이 어긋나지 않도록 모든 트레이스에 같은 x값을 남김)"""
+        if color_col is None:
+            return self._downsample_lines(df, y_col, None)
+        if self.max_points is None:
+            return df
+        
+        # x값별 합계 곡선에서 남길 x값을 고른 뒤 그 x값의 행을 모두 남김
+        totals = df.groupby(x_col, sort=False, observed=True)[y_col].sum()
+        if len(totals) <= self.max_points:
+            return df
+        
+        kept_x = totals.index[_minmax_indices(_as_numeric(totals), self.max_points)]
+        return df[df[x_col].isin(kept_x)]
+    
+    def _downsample_scatter(self, df: pd.DataFrame, x_col: str, y_col: str,
+                            color_col: Optional[str]) -> pd.DataFrame:
+        """트레이스마다 밀도를 유지하는 표본만 남김"""
+        if self.max_points is None or len(df) <= self.max_points:
+            return df
+        
+        x = _as_numeric(df[x_col])
+        y = _as_numeric(df[y_col])
+        selected = []
+        for positions in self._trace_positions(df, color_col):
+            if len(positions) > self.max_points:
+                positions = positions[_density_sample_indices(x[positions], y[positions], self.max_points)]
+            selected.append(positions)
+        
+        selected = np.sort(np.concatenate(selected))
+        return df if len(selected) == len(df) else df.iloc[selected]
+    
+    def _mark_decimated(self, fig: go.Figure, original_points: int, displayed_points: int):
+        """다운샘플링된 차트에 원래/표시 점 수를 기록하고 안내 문구 표시"""
+        if displayed_points >= original_points:
+            return
+        
+        fig.update_layout(meta={
+            'decimated': True,
+            'original_points': original_points,
+            'displayed_points': displayed_points
+        })
+        fig.add_annotation(
+            text=f"다운샘플링: {displayed_points:,} / {original_points:,}개 점 표시",
+            xref="paper", yref="paper", x=1, y=1.02,
+            xanchor="right", yanchor="bottom",
+            showarrow=False, font=dict(size=11, color="gray")
+        )
+    
     def create_summary_stats(self, df: pd.DataFrame) -> pd.DataFrame:
         """요약 통계 생성"""
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        numeric_cols = get_column_profile(df)['numeric_columns']
         if len(numeric_cols) == 0:
             return pd.DataFrame()
         
@@ -133,9 +540,10 @@ class ChartCreator:
     
     def get_chart_options(self, df: pd.DataFrame) -> Dict[str, List[str]]:
         """데이터에 따른 차트 옵션 반환"""
-        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-        categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
-        date_cols = df.select_dtypes(include=['datetime64']).columns.tolist()
+        profile = get_column_profile(df)
+        numeric_cols = profile['numeric_columns']
+        categorical_cols = profile['categorical_columns']
+        date_cols = profile['date_columns']
         
         options = {
             'bar': {
@@ -0,0 +1,42 @@
+from typing import Dict
+import numpy as np
+import pandas as pd
+from utils.frame_memo import frame_memo
+
+
+def build_column_profile(df: pd.DataFrame) -> Dict:
+    """
+    컬럼 프로파일 계산
+
+    Returns:
+        Dict: 수치형/범주형/날짜형 컬럼 목록, 범주형 컬럼의 고유값 수,
+              컬럼별 결측값 수, 수치형/날짜형 컬럼의 최소값과 최대값
+    """
+    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
+    date_cols = df.select_dtypes(include=['datetime64']).columns.tolist()
+
+    range_cols = numeric_cols + date_cols
+    minimums = df[range_cols].min() if range_cols else pd.Series(dtype=object)
+    maximums = df[range_cols].max() if range_cols else pd.Series(dtype=object)
+
+    return {
+        'n_rows': len(df),
+        'numeric_columns': numeric_cols,
+        'categorical_columns': categorical_cols,
+        'date_columns': date_cols,
+        'cardinality': {col: df[col].nunique() for col in categorical_cols},
+        'null_counts': df.isnull().sum().to_dict(),
+        'min': minimums.to_dict(),
+        'max': maximums.to_dict()
+    }
+
+
+@frame_memo
+def get_column_profile(df: pd.DataFrame) -> Dict:
+    """
+    데이터프레임별로 한 번만 계산한 컬럼 프로파일 반환
+
+    같은 데이터프레임 객체에 대해서는 저장된 프로파일을 재사용합니다 (frame_memo 참고).
+    """
+    return build_column_profile(df)
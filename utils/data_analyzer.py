@@ -1,280 +1,692 @@
 import pandas as pd
 import numpy as np
-from scipy import stats
+from scipy import linalg, stats
 from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
-from sklearn.cluster import KMeans
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import r2_score, mean_squared_error
+from sklearn.cluster import KMeans, MiniBatchKMeans
 import plotly.graph_objects as go
 import plotly.express as px
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Optional
+from utils.column_profile import get_column_profile
+from utils.financial_ratios import financial_ratio_table
+from utils.fingerprint import dataframe_fingerprint
+from utils.time_series import get_time_series
+from utils.analysis_cache import AnalysisCache, analysis_cache
+from utils.stat_kernels import correlation_from_sums, correlation_result, moment_statistics, pairwise_sums
+from utils.streaming_stats import StreamingStatistics
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import warnings
 warnings.filterwarnings('ignore')
 
 
+def _block_quantiles(values: np.ndarray, count: np.ndarray, quantiles: List[float]) -> Dict[float, np.ndarray]:
+    """
+    (컬럼 x 행) 블록에서 여러 분위수를 한 번의 부분 정렬로 계산 (선형 보간)
+    
+    결측값 수가 같은 컬럼끼리 묶어서 필요한 순서 통계량 위치를 모두 지정한
+    np.partition 한 번으로 구합니다. 결측값(NaN)은 부분 정렬 시 끝으로 이동합니다.
+    """
+    result = {q: np.full(len(count), np.nan) for q in quantiles}
+    
+    for n in np.unique(count):
+        if n == 0:
+            continue
+        
+        rows = np.flatnonzero(count == n)
+        positions = {q: (n - 1) * q for q in quantiles}
+        kth = sorted({int(np.floor(pos)) for pos in positions.values()} |
+                     {int(np.ceil(pos)) for pos in positions.values()})
+        partitioned = np.partition(values[rows], kth, axis=1)
+        
+        for q, pos in positions.items():
+            lower = int(np.floor(pos))
+            upper = int(np.ceil(pos))
+            lower_values = partitioned[:, lower]
+            upper_values = partitioned[:, upper]
+            result[q][rows] = lower_values + (upper_values - lower_values) * (pos - lower)
+    
+    return result
+
+
+def _block_statistics(values: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    (컬럼 x 행) 블록의 컬럼별 기술통계를 한 번에 계산
+    
+    분위수와 최소/최대값은 한 번의 부분 정렬 결과를 공유하고, 분산/왜도/첨도는 같은 편차 배열에서
+    계산합니다. 결과는 pandas의 count/mean/median/std/quantile/skew/kurt와 같은 정의를 따릅니다.
+    """
+    mask = np.isnan(values)
+    count = (~mask).sum(axis=1)
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(mask, 0, values).sum(axis=1) / count
+        
+        # 중심 모멘트
+        adjusted = np.where(mask, 0, values - mean[:, np.newaxis])
+        adjusted2 = adjusted ** 2
+        m2 = adjusted2.sum(axis=1)
+        m3 = (adjusted2 * adjusted).sum(axis=1)
+        m4 = (adjusted2 ** 2).sum(axis=1)
+    
+    std, skewness, kurtosis = moment_statistics(count, m2, m3, m4)
+    
+    # 분위수와 최소/최대값은 하나의 부분 정렬 결과를 공유
+    quantiles = _block_quantiles(values, count, [0.0, 0.25, 0.5, 0.75, 1.0])
+    
+    return {
+        'count': count,
+        'mean': mean,
+        'median': quantiles[0.5],
+        'std': std,
+        'min': quantiles[0.0],
+        'max': quantiles[1.0],
+        'q1': quantiles[0.25],
+        'q3': quantiles[0.75],
+        'skewness': skewness,
+        'kurtosis': kurtosis
+    }
+
+
+def _complete_rows(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """선택한 컬럼에 결측값이 없는 행의 위치 반환"""
+    null_counts = get_column_profile(df)['null_counts']
+    columns = [col for col in columns if null_counts[col] > 0]
+    
+    complete = np.ones(len(df), dtype=bool)
+    for col in columns:
+        complete &= df[col].notna().to_numpy()
+    return np.flatnonzero(complete)
+
+
+def _numeric_rows(df: pd.DataFrame, columns: List[str], rows: np.ndarray) -> np.ndarray:
+    """선택한 행의 수치형 컬럼을 float64 배열로 반환 (전체 컬럼 블록을 복사하지 않음)"""
+    # 컬럼 단위로 채우므로 컬럼이 연속된 순서로 할당
+    block = np.empty((len(rows), len(columns)), dtype=np.float64, order='F')
+    for i, col in enumerate(columns):
+        column = df[col]
+        if isinstance(column.dtype, np.dtype):
+            block[:, i] = column.to_numpy()[rows]
+        else:
+            # nullable 정수 등 확장 dtype
+            block[:, i] = column.iloc[rows].to_numpy(dtype=np.float64, na_value=np.nan)
+    return block
+
+
+def _numeric_slice(df: pd.DataFrame, columns: List[str], start: int, stop: int) -> np.ndarray:
+    """연속된 행 구간의 수치형 컬럼을 float64 배열로 반환 (해당 구간만 변환)"""
+    stop = min(stop, len(df))
+    block = np.empty((stop - start, len(columns)), dtype=np.float64, order='F')
+    for i, col in enumerate(columns):
+        block[:, i] = df[col].iloc[start:stop].to_numpy(dtype=np.float64, na_value=np.nan)
+    return block
+
+
 class DataAnalyzer:
     """전문적인 데이터 분석 클래스"""
     
-    def __init__(self):
+    # 기술통계 블록 하나에 담을 최대 원소 수 (행 수 x 컬럼 수)
+    BLOCK_ELEMENTS = 16_000_000
+    # 전체 행으로 군집 모델을 학습할 최대 행 수 (넘으면 이 크기의 표본으로 학습)
+    CLUSTER_SAMPLE_ROWS = 100_000
+    # 전체 행을 나눠서 처리할 때 블록 하나의 행 수
+    CHUNK_ROWS = 100_000
+    # 정확한 PCA를 사용할 최대 원소 수 (행 수 x 컬럼 수, 넘으면 블록 단위 계산)
+    PCA_EXACT_ELEMENTS = 4_000_000
+    
+    def __init__(self, cache: Optional[AnalysisCache] = analysis_cache):
         self.analysis_results = {}
+        self.section_errors = {}
+        self.cache = cache
     
     def descriptive_statistics(self, df: pd.DataFrame) -> Dict:
-        """기술통계 분석"""
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        """기술통계 분석 (수치형 컬럼 전체를 블록 단위로 한 번에 계산)"""
+        numeric_cols = get_column_profile(df)['numeric_columns']
+        n_rows = len(df)
         
         stats_dict = {}
-        for col in numeric_cols:
-            stats_dict[col] = {
-                'count': df[col].count(),
-                'mean': df[col].mean(),
-                'median': df[col].median(),
-                'std': df[col].std(),
-                'min': df[col].min(),
-                'max': df[col].max(),
-                'q1': df[col].quantile(0.25),
-                'q3': df[col].quantile(0.75),
-                'skewness': df[col].skew(),
-                'kurtosis': df[col].kurtosis(),
-                'missing_count': df[col].isnull().sum(),
-                'missing_percent': (df[col].isnull().sum() / len(df)) * 100
-            }
+        # 메모리 사용량을 제한하기 위해 컬럼을 블록으로 나눠 계산
+        block_size = max(1, self.BLOCK_ELEMENTS // max(n_rows, 1))
+        
+        for start in range(0, len(numeric_cols), block_size):
+            block_cols = numeric_cols[start:start + block_size]
+            # 컬럼별 연산이 연속된 메모리에서 이루어지도록 (컬럼 x 행) 배열로 변환
+            values = np.ascontiguousarray(df[block_cols].to_numpy(dtype=np.float64, na_value=np.nan).T)
+            block_stats = _block_statistics(values)
+            
+            for i, col in enumerate(block_cols):
+                missing_count = np.int64(n_rows - block_stats['count'][i])
+                # 최소/최대값은 원래 dtype으로 반환 (정수 컬럼은 정수)
+                dtype = df[col].dtype
+                minimum, maximum = block_stats['min'][i], block_stats['max'][i]
+                if pd.api.types.is_integer_dtype(dtype) and block_stats['count'][i] > 0:
+                    minimum, maximum = dtype.type(minimum), dtype.type(maximum)
+                stats_dict[col] = {
+                    'count': block_stats['count'][i],
+                    'mean': block_stats['mean'][i],
+                    'median': block_stats['median'][i],
+                    'std': block_stats['std'][i],
+                    'min': minimum,
+                    'max': maximum,
+                    'q1': block_stats['q1'][i],
+                    'q3': block_stats['q3'][i],
+                    'skewness': block_stats['skewness'][i],
+                    'kurtosis': block_stats['kurtosis'][i],
+                    'missing_count': missing_count,
+                    'missing_percent': (missing_count / n_rows) * 100
+                }
         
         return stats_dict
     
     def correlation_analysis(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
-        """상관관계 분석"""
-        numeric_df = df.select_dtypes(include=[np.number])
-        
-        # 상관계수 계산
-        corr_matrix = numeric_df.corr()
-        
-        # 유의성 검정
-        p_values = {}
-        for i in numeric_df.columns:
-            p_values[i] = {}
-            for j in numeric_df.columns:
-                if i != j:
-                    correlation, p_value = stats.pearsonr(numeric_df[i].dropna(), numeric_df[j].dropna())
-                    p_values[i][j] = p_value
-        
-        return corr_matrix, p_values
+        """상관관계 분석 (컬럼 쌍마다 두 값이 모두 있는 행 사용, 행 블록 단위로 합계 누적)"""
+        numeric_cols = get_column_profile(df)['numeric_columns']
+        n_cols = len(numeric_cols)
+        
+        # 컬럼 평균을 기준점으로 빼서 자릿수 손실 방지 (값이 없는 컬럼은 0)
+        means = [df[col].mean() for col in numeric_cols]
+        shift = np.array([float(mean) if pd.notna(mean) else 0.0 for mean in means])
+        
+        # 메모리 사용량을 제한하기 위해 행을 블록으로 나눠 쌍별 합계를 누적
+        sums = [np.zeros((n_cols, n_cols)) for _ in range(4)]
+        block_rows = max(1, self.BLOCK_ELEMENTS // max(n_cols, 1))
+        for start in range(0, len(df), block_rows):
+            block = _numeric_slice(df, numeric_cols, start, start + block_rows)
+            for total, part in zip(sums, pairwise_sums(block, shift)):
+                total += part
+        
+        n_obs, sum_x, sum_xx, sum_xy = sums
+        corr = correlation_from_sums(n_obs, sum_x, sum_xx, sum_xy)
+        return correlation_result(numeric_cols, corr, n_obs)
     
-    def outlier_detection(self, df: pd.DataFrame, method: str = 'iqr') -> Dict:
-        """이상치 탐지"""
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+    def outlier_detection(self, df: pd.DataFrame, method: str = 'iqr', z_threshold: float = 3) -> Dict:
+        """
+        이상치 탐지 (수치형 컬럼 전체의 경계값과 이상치 마스크를 블록 단위로 한 번에 계산)
+        
+        Args:
+            df (pd.DataFrame): 데이터프레임
+            method (str): 'iqr' (Q1 - 1.5 IQR, Q3 + 1.5 IQR 경계) 또는 'zscore' (|z| > z_threshold)
+            z_threshold (float): zscore 방법의 기준값
+            
+        Returns:
+            Dict: 컬럼별 이상치 개수, 비율, 경계값, 이상치 행의 인덱스 배열 (outlier_indices)
+        """
+        numeric_cols = get_column_profile(df)['numeric_columns']
+        n_rows = len(df)
+        index = df.index.to_numpy()
+        
         outliers_dict = {}
+        if method not in ('iqr', 'zscore'):
+            return outliers_dict
         
-        for col in numeric_cols:
+        # 메모리 사용량을 제한하기 위해 컬럼을 블록으로 나눠 계산
+        block_size = max(1, self.BLOCK_ELEMENTS // max(n_rows, 1))
+        
+        for start in range(0, len(numeric_cols), block_size):
+            block_cols = numeric_cols[start:start + block_size]
+            # 컬럼별 연산이 연속된 메모리에서 이루어지도록 (컬럼 x 행) 배열로 변환
+            values = np.ascontiguousarray(df[block_cols].to_numpy(dtype=np.float64, na_value=np.nan).T)
+            count = (~np.isnan(values)).sum(axis=1)
+            
             if method == 'iqr':
-                Q1 = df[col].quantile(0.25)
-                Q3 = df[col].quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                
-                outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)]
-                
-                outliers_dict[col] = {
-                    'outlier_count': len(outliers),
-                    'outlier_percent': (len(outliers) / len(df)) * 100,
-                    'lower_bound': lower_bound,
-                    'upper_bound': upper_bound,
-                    'outlier_indices': outliers.index.tolist()
-                }
+                quantiles = _block_quantiles(values, count, [0.25, 0.75])
+                iqr = quantiles[0.75] - quantiles[0.25]
+                lower_bounds = quantiles[0.25] - 1.5 * iqr
+                upper_bounds = quantiles[0.75] + 1.5 * iqr
+            else:
+                # scipy.stats.zscore와 같은 모집단 표준편차 (결측값 제외)
+                means = np.nanmean(values, axis=1)
+                stds = np.nanstd(values, axis=1)
+                # 분산이 0인 컬럼은 z 점수를 정의할 수 없으므로 이상치 없음
+                stds[stds == 0] = np.nan
+                lower_bounds = means - z_threshold * stds
+                upper_bounds = means + z_threshold * stds
             
-            elif method == 'zscore':
-                z_scores = np.abs(stats.zscore(df[col].dropna()))
-                outliers = df[z_scores > 3]
-                
-                outliers_dict[col] = {
-                    'outlier_count': len(outliers),
-                    'outlier_percent': (len(outliers) / len(df)) * 100,
-                    'z_score_threshold': 3,
-                    'outlier_indices': outliers.index.tolist()
+            # 결측값과 NaN 경계값은 비교 결과가 False이므로 이상치로 세지 않음
+            mask = (values < lower_bounds[:, np.newaxis]) | (values > upper_bounds[:, np.newaxis])
+            outlier_counts = mask.sum(axis=1)
+            
+            for i, col in enumerate(block_cols):
+                outlier_count = int(outlier_counts[i])
+                col_result = {
+                    'outlier_count': outlier_count,
+                    'outlier_percent': (outlier_count / n_rows) * 100 if n_rows else 0.0,
+                    'lower_bound': lower_bounds[i],
+                    'upper_bound': upper_bounds[i],
+                    'outlier_indices': index[np.flatnonzero(mask[i])] if outlier_count else index[:0]
                 }
+                if method == 'zscore':
+                    col_result['z_score_threshold'] = z_threshold
+                outliers_dict[col] = col_result
         
         return outliers_dict
     
-    def normality_test(self, df: pd.DataFrame) -> Dict:
-        """정규성 검정"""
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+    def normality_test(self, df: pd.DataFrame, sample_size: int = 5000, n_repeats: int = 1,
+                       random_state: int = 0) -> Dict:
+        """
+        정규성 검정
+        
+        Shapiro-Wilk 검정은 5000개 정도까지만 유효하므로, 행이 더 많은 컬럼은 시드를 고정한
+        무작위 표본으로 검정합니다. 표본을 여러 번 뽑으면 통계량과 p값의 중앙값을 사용합니다.
+        
+        Args:
+            df (pd.DataFrame): 데이터프레임
+            sample_size (int): 컬럼별 최대 표본 크기
+            n_repeats (int): 표본 추출 반복 횟수 (행 수가 sample_size보다 많을 때만 사용)
+            random_state (int): 표본 추출 시드 (컬럼마다 같은 시드 사용)
+            
+        Returns:
+            Dict: 컬럼별 검정 결과 (사용한 표본 크기와 반복 횟수 포함)
+        """
+        numeric_cols = get_column_profile(df)['numeric_columns']
         normality_results = {}
         
         for col in numeric_cols:
-            data = df[col].dropna()
-            if len(data) > 3:
+            values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            data = values[~np.isnan(values)]
+            if len(data) <= 3:
+                continue
+            
+            if len(data) > sample_size:
+                rng = np.random.default_rng(random_state)
+                samples = [data[rng.choice(len(data), sample_size, replace=False)] for _ in range(n_repeats)]
+            else:
+                samples = [data]
+            
+            shapiro_results = []
+            ks_results = []
+            for sample in samples:
                 # Shapiro-Wilk 검정
-                shapiro_stat, shapiro_p = stats.shapiro(data)
+                shapiro_results.append(stats.shapiro(sample))
                 # Kolmogorov-Smirnov 검정
-                ks_stat, ks_p = stats.kstest(data, 'norm', args=(data.mean(), data.std()))
-                
-                normality_results[col] = {
-                    'shapiro_statistic': shapiro_stat,
-                    'shapiro_p_value': shapiro_p,
-                    'ks_statistic': ks_stat,
-                    'ks_p_value': ks_p,
-                    'is_normal_shapiro': shapiro_p > 0.05,
-                    'is_normal_ks': ks_p > 0.05
-                }
+                ks_results.append(stats.kstest(sample, 'norm', args=(sample.mean(), sample.std(ddof=1))))
+            
+            shapiro_stat, shapiro_p = np.median(shapiro_results, axis=0)
+            ks_stat, ks_p = np.median(ks_results, axis=0)
+            
+            normality_results[col] = {
+                'shapiro_statistic': shapiro_stat,
+                'shapiro_p_value': shapiro_p,
+                'ks_statistic': ks_stat,
+                'ks_p_value': ks_p,
+                'is_normal_shapiro': shapiro_p > 0.05,
+                'is_normal_ks': ks_p > 0.05,
+                'sample_size': len(samples[0]),
+                'n_repeats': len(samples)
+            }
         
         return normality_results
     
     def trend_analysis(self, df: pd.DataFrame, date_col: str, value_col: str) -> Dict:
-        """시계열 트렌드 분석"""
-        df_copy = df.copy()
-        df_copy[date_col] = pd.to_datetime(df_copy[date_col])
-        df_copy = df_copy.sort_values(date_col)
-        
-        # 선형 회귀 분석
-        X = np.arange(len(df_copy)).reshape(-1, 1)
-        y = df_copy[value_col].values
-        
-        model = LinearRegression()
-        model.fit(X, y)
-        y_pred = model.predict(X)
-        
-        # 추세 분석 결과
-        trend_results = {
-            'slope': model.coef_[0],
-            'intercept': model.intercept_,
-            'r_squared': r2_score(y, y_pred),
-            'mse': mean_squared_error(y, y_pred),
-            'trend_direction': 'increasing' if model.coef_[0] > 0 else 'decreasing',
-            'trend_strength': abs(model.coef_[0])
-        }
-        
-        return trend_results
+        """시계열 트렌드 분석 (날짜 순서에 대한 선형 회귀)"""
+        return get_time_series(df, date_col).trend([value_col]).get(value_col, {})
     
     def seasonal_analysis(self, df: pd.DataFrame, date_col: str, value_col: str) -> Dict:
         """계절성 분석"""
-        df_copy = df.copy()
-        df_copy[date_col] = pd.to_datetime(df_copy[date_col])
-        
-        # 월별 평균
-        df_copy['month'] = df_copy[date_col].dt.month
-        monthly_avg = df_copy.groupby('month')[value_col].mean()
-        
-        # 분기별 평균
-        df_copy['quarter'] = df_copy[date_col].dt.quarter
-        quarterly_avg = df_copy.groupby('quarter')[value_col].mean()
-        
-        seasonal_results = {
-            'monthly_pattern': monthly_avg.to_dict(),
-            'quarterly_pattern': quarterly_avg.to_dict(),
-            'seasonal_strength': monthly_avg.std() / monthly_avg.mean() if monthly_avg.mean() != 0 else 0
-        }
-        
-        return seasonal_results
+        return get_time_series(df, date_col).seasonal([value_col]).get(value_col, {})
     
-    def cluster_analysis(self, df: pd.DataFrame, n_clusters: int = 3) -> Dict:
-        """군집 분석"""
-        numeric_df = df.select_dtypes(include=[np.number])
+    def column_trend_analysis(self, df: pd.DataFrame, date_col: str, group_col: Optional[str] = None) -> Dict:
+        """
+        수치형 컬럼 전체의 시계열 트렌드 분석
+        
+        Args:
+            df (pd.DataFrame): 데이터프레임
+            date_col (str): 날짜 컬럼
+            group_col (str): 그룹 컬럼 (지정하면 그룹별로 따로 분석)
+            
+        Returns:
+            Dict: {컬럼: 추세} (group_col이 있으면 {그룹: {컬럼: 추세}})
+        """
+        return get_time_series(df, date_col, group_col).trend()
+    
+    def column_seasonal_analysis(self, df: pd.DataFrame, date_col: str, group_col: Optional[str] = None) -> Dict:
+        """수치형 컬럼 전체의 계절성 분석 (group_col이 있으면 {그룹: {컬럼: 계절성}})"""
+        return get_time_series(df, date_col, group_col).seasonal()
+    
+    def cluster_analysis(self, df: pd.DataFrame, n_clusters: int = 3, return_labels: bool = False) -> Dict:
+        """
+        군집 분석
+        
+        결측값이 없는 행이 CLUSTER_SAMPLE_ROWS개 이하이면 전체 행으로 K-means를 학습하고,
+        더 많으면 시드를 고정한 표본으로 미니배치 K-means를 학습한 뒤 전체 행을
+        CHUNK_ROWS개씩 나눠 군집을 할당합니다.
+        
+        Args:
+            df (pd.DataFrame): 데이터프레임
+            n_clusters (int): 군집 수
+            return_labels (bool): 행별 군집 번호 포함 여부 (결측값이 있는 행은 -1)
+            
+        Returns:
+            Dict: 군집 중심, inertia, 군집 크기 (return_labels면 정수 배열 cluster_labels 포함)
+        """
+        numeric_cols = get_column_profile(df)['numeric_columns']
         
-        if len(numeric_df.columns) < 2:
+        if len(numeric_cols) < 2:
             return {}
         
-        # 데이터 정규화
+        # K-means는 결측값을 처리하지 못하므로 결측값이 없는 행만 사용
+        rows = _complete_rows(df, numeric_cols)
+        if len(rows) < n_clusters:
+            return {}
+        
+        # 데이터 정규화 (블록 단위로 평균과 분산 계산)
         scaler = StandardScaler()
-        scaled_data = scaler.fit_transform(numeric_df)
+        for start in range(0, len(rows), self.CHUNK_ROWS):
+            scaler.partial_fit(_numeric_rows(df, numeric_cols, rows[start:start + self.CHUNK_ROWS]))
+        
+        label_dtype = np.int8 if n_clusters < 128 else np.int32
+        labels = np.full(len(df), -1, dtype=label_dtype) if return_labels else None
         
-        # K-means 군집화
-        kmeans = KMeans(n_clusters=n_clusters, random_state=42)
-        clusters = kmeans.fit_predict(scaled_data)
+        if len(rows) <= self.CLUSTER_SAMPLE_ROWS:
+            # K-means 군집화
+            kmeans = KMeans(n_clusters=n_clusters, random_state=42)
+            clusters = kmeans.fit_predict(scaler.transform(_numeric_rows(df, numeric_cols, rows)))
+            
+            method = 'kmeans'
+            inertia = kmeans.inertia_
+            cluster_sizes = np.bincount(clusters, minlength=n_clusters)
+            if labels is not None:
+                labels[rows] = clusters
+        else:
+            # 표본으로 학습한 미니배치 K-means
+            rng = np.random.default_rng(42)
+            sample_rows = np.sort(rng.choice(rows, self.CLUSTER_SAMPLE_ROWS, replace=False))
+            kmeans = MiniBatchKMeans(n_clusters=n_clusters, random_state=42, n_init=3, batch_size=4096)
+            kmeans.fit(scaler.transform(_numeric_rows(df, numeric_cols, sample_rows)))
+            
+            # 전체 행을 블록 단위로 가장 가까운 군집에 할당
+            method = 'minibatch_kmeans'
+            inertia = 0.0
+            cluster_sizes = np.zeros(n_clusters, dtype=np.int64)
+            for start in range(0, len(rows), self.CHUNK_ROWS):
+                chunk_rows = rows[start:start + self.CHUNK_ROWS]
+                distances = kmeans.transform(scaler.transform(_numeric_rows(df, numeric_cols, chunk_rows)))
+                clusters = distances.argmin(axis=1)
+                
+                inertia += float(np.square(distances[np.arange(len(clusters)), clusters]).sum())
+                cluster_sizes += np.bincount(clusters, minlength=n_clusters)
+                if labels is not None:
+                    labels[chunk_rows] = clusters
         
         # 군집 분석 결과
         cluster_results = {
             'n_clusters': n_clusters,
-            'cluster_labels': clusters.tolist(),
+            'method': method,
+            'n_samples': len(rows),
             'cluster_centers': kmeans.cluster_centers_.tolist(),
-            'inertia': kmeans.inertia_,
-            'cluster_sizes': np.bincount(clusters).tolist()
+            'inertia': inertia,
+            'cluster_sizes': cluster_sizes.tolist()
         }
+        if labels is not None:
+            cluster_results['cluster_labels'] = labels
         
         return cluster_results
     
-    def pca_analysis(self, df: pd.DataFrame, n_components: int = 2) -> Dict:
-        """주성분 분석"""
-        numeric_df = df.select_dtypes(include=[np.number])
+    def pca_analysis(self, df: pd.DataFrame, n_components: int = 2, method: str = 'auto') -> Dict:
+        """
+        주성분 분석
+        
+        Args:
+            df (pd.DataFrame): 데이터프레임
+            n_components (int): 계산할 주성분 수
+            method (str): 'exact' (전체 행렬로 PCA), 'streaming' (행 블록 단위로 상관행렬을 누적한 뒤
+                          요청한 주성분만 고유값 분해), 'auto' (원소 수가 PCA_EXACT_ELEMENTS를 넘으면 streaming)
+            
+        Returns:
+            Dict: 설명 분산 비율, 누적 설명 분산 비율, 주성분, 컬럼 이름
+        """
+        numeric_cols = get_column_profile(df)['numeric_columns']
         
-        if len(numeric_df.columns) < 2:
+        if len(numeric_cols) < 2:
             return {}
         
-        # 데이터 정규화
-        scaler = StandardScaler()
-        scaled_data = scaler.fit_transform(numeric_df)
+        # PCA는 결측값을 처리하지 못하므로 결측값이 없는 행만 사용
+        rows = _complete_rows(df, numeric_cols)
+        n_components = min(n_components, len(numeric_cols))
+        if len(rows) < 2:
+            return {}
         
-        # PCA 분석
-        pca = PCA(n_components=min(n_components, len(numeric_df.columns)))
-        pca_result = pca.fit_transform(scaled_data)
+        if method == 'auto':
+            method = 'streaming' if len(rows) * len(numeric_cols) > self.PCA_EXACT_ELEMENTS else 'exact'
+        
+        if method == 'exact':
+            # 데이터 정규화
+            scaler = StandardScaler()
+            scaled_data = scaler.fit_transform(_numeric_rows(df, numeric_cols, rows))
+            
+            # PCA 분석
+            pca = PCA(n_components=n_components)
+            pca.fit(scaled_data)
+            explained_variance_ratio = pca.explained_variance_ratio_
+            components = pca.components_
+        else:
+            explained_variance_ratio, components = self._streaming_pca(df, numeric_cols, rows, n_components)
         
         pca_results = {
-            'explained_variance_ratio': pca.explained_variance_ratio_.tolist(),
-            'cumulative_variance_ratio': np.cumsum(pca.explained_variance_ratio_).tolist(),
-            'components': pca.components_.tolist(),
-            'feature_names': numeric_df.columns.tolist()
+            'explained_variance_ratio': explained_variance_ratio.tolist(),
+            'cumulative_variance_ratio': np.cumsum(explained_variance_ratio).tolist(),
+            'components': components.tolist(),
+            'feature_names': numeric_cols,
+            'method': method
         }
         
         return pca_results
     
+    def _streaming_pca(self, df: pd.DataFrame, numeric_cols: List[str], rows: np.ndarray,
+                       n_components: int) -> Tuple[np.ndarray, np.ndarray]:
+        """행 블록 단위로 공분산 행렬을 누적해서 정규화된 데이터의 상위 주성분 계산"""
+        # 한 번의 패스로 합계와 곱의 합 누적 (첫 블록 평균을 빼서 자릿수 손실 방지)
+        n_cols = len(numeric_cols)
+        shift = None
+        sums = np.zeros(n_cols)
+        products = np.zeros((n_cols, n_cols))
+        # 넓은 시트에서도 블록 크기가 BLOCK_ELEMENTS를 넘지 않도록 행 수 조정
+        chunk_size = max(1, min(self.CHUNK_ROWS, self.BLOCK_ELEMENTS // n_cols))
+        for start in range(0, len(rows), chunk_size):
+            block = _numeric_rows(df, numeric_cols, rows[start:start + chunk_size])
+            if shift is None:
+                shift = block.mean(axis=0)
+            block -= shift
+            sums += block.sum(axis=0)
+            products += block.T @ block
+        
+        # 공분산 행렬을 정규화된 데이터의 공분산 행렬(상관행렬)로 변환 (분산이 0인 컬럼은 0)
+        n_rows = len(rows)
+        covariance = (products - np.outer(sums, sums) / n_rows) / (n_rows - 1)
+        std = np.sqrt(np.clip(np.diag(covariance), 0, None))
+        inv_std = np.divide(1.0, std, out=np.zeros_like(std), where=std > 0)
+        covariance *= np.outer(inv_std, inv_std)
+        
+        # 요청한 주성분만 고유값 분해 (eigh는 오름차순으로 반환)
+        eigenvalues, eigenvectors = linalg.eigh(covariance, subset_by_index=[n_cols - n_components, n_cols - 1])
+        eigenvalues = np.clip(eigenvalues[::-1], 0, None)
+        components = eigenvectors[:, ::-1].T
+        
+        # 주성분 부호를 결정적으로 맞춤 (절댓값이 가장 큰 원소가 양수)
+        signs = np.sign(components[np.arange(n_components), np.abs(components).argmax(axis=1)])
+        components *= np.where(signs == 0, 1, signs)[:, np.newaxis]
+        
+        total_variance = np.trace(covariance)
+        explained_variance_ratio = eigenvalues / total_variance if total_variance > 0 else np.zeros(n_components)
+        return explained_variance_ratio, components
+    
     def financial_analysis(self, df: pd.DataFrame) -> Dict:
-        """재무 분석"""
-        financial_metrics = {}
-        
-        # 수익성 지표
-        if 'Revenue' in df.columns and 'Net_Income' in df.columns:
-            financial_metrics['profit_margin'] = (df['Net_Income'] / df['Revenue'] * 100).mean()
-        
-        if 'Revenue' in df.columns and 'Gross_Profit' in df.columns:
-            financial_metrics['gross_margin'] = (df['Gross_Profit'] / df['Revenue'] * 100).mean()
-        
-        # 수익성 지표
-        if 'Net_Income' in df.columns and 'Equity' in df.columns:
-            financial_metrics['roe'] = (df['Net_Income'] / df['Equity'] * 100).mean()
-        
-        if 'Net_Income' in df.columns and 'Total_Assets' in df.columns:
-            financial_metrics['roa'] = (df['Net_Income'] / df['Total_Assets'] * 100).mean()
-        
-        # 안정성 지표
-        if 'Total_Liabilities' in df.columns and 'Total_Assets' in df.columns:
-            financial_metrics['debt_ratio'] = (df['Total_Liabilities'] / df['Total_Assets'] * 100).mean()
+        """재무 분석 (시트 전체의 행별 재무비율 평균, 한글/영문 컬럼과 계정과목별 시트 지원)"""
+        table = financial_ratio_table(df)
+        if table.empty:
+            return {}
         
-        # 성장성 지표
-        if 'Revenue' in df.columns:
-            financial_metrics['revenue_growth'] = df['Revenue'].pct_change().mean() * 100
+        return {metric: value for metric, value in table.iloc[0].items() if pd.notna(value)}
+    
+    def financial_ratio_table(self, df: pd.DataFrame, group_by: Optional[List[str]] = None,
+                              period_col: Optional[str] = None) -> pd.DataFrame:
+        """
+        그룹/기간별 재무비율 표
+        
+        Args:
+            df (pd.DataFrame): 데이터프레임
+            group_by (List[str]): 그룹 컬럼 (예: 회사, 부서)
+            period_col (str): 기간 컬럼 (예: 연도, 날짜)
+            
+        Returns:
+            pd.DataFrame: (그룹, 기간)별 재무비율
+        """
+        return financial_ratio_table(df, group_by, period_col)
+    
+    def chunked_analysis_report(self, chunks: Iterable[pd.DataFrame]) -> Dict:
+        """
+        메모리에 다 올리지 않고 청크 단위로 기술통계와 상관관계 분석
         
-        return financial_metrics
+        Args:
+            chunks (Iterable[pd.DataFrame]): 데이터프레임 청크 (예: ExcelReader.iter_sheet_chunks 결과)
+            
+        Returns:
+            Dict: descriptive_statistics, correlation_analysis와 같은 형식의 결과
+                  (중앙값과 사분위수는 분위수 스케치 추정값)
+        """
+        accumulator = StreamingStatistics.from_chunks(chunks)
+        return {
+            'descriptive_statistics': accumulator.descriptive_statistics(),
+            'correlation_analysis': accumulator.correlation_analysis()
+        }
+    
+    def create_analysis_report(self, df: pd.DataFrame, n_clusters: int = 3, n_components: int = 2,
+                               outlier_method: str = 'iqr', max_workers: Optional[int] = None,
+                               timeout: Optional[float] = None) -> Dict:
+        """
+        종합 분석 리포트 생성
+        
+        각 섹션은 데이터 지문과 섹션 파라미터로 캐시되므로, 같은 데이터에서 파라미터 하나를
+        바꾸면 그 파라미터를 사용하는 섹션만 다시 계산합니다.
+        (실패하거나 시간이 초과된 섹션은 제외되고 오류는 section_errors에 기록)
+        """
+        results = dict(self.iter_analysis_report(df, n_clusters, n_components, outlier_method,
+                                                 max_workers=max_workers, timeout=timeout))
+        
+        # 섹션이 끝난 순서와 관계없이 항상 같은 순서로 정리
+        order = ['data_overview'] + [name for name, _, _ in
+                                     self._report_sections(df, n_clusters, n_components, outlier_method)]
+        return {name: results[name] for name in order if name in results}
     
-    def create_analysis_report(self, df: pd.DataFrame) -> Dict:
-        """종합 분석 리포트 생성"""
-        report = {
-            'data_overview': {
-                'shape': df.shape,
-                'columns': df.columns.tolist(),
-                'dtypes': df.dtypes.to_dict(),
-                'missing_data': df.isnull().sum().to_dict()
-            },
-            'descriptive_statistics': self.descriptive_statistics(df),
-            'correlation_analysis': self.correlation_analysis(df),
-            'outlier_analysis': self.outlier_detection(df),
-            'normality_test': self.normality_test(df),
-            'financial_analysis': self.financial_analysis(df)
+    def iter_analysis_report(self, df: pd.DataFrame, n_clusters: int = 3, n_components: int = 2,
+                             outlier_method: str = 'iqr', max_workers: Optional[int] = None,
+                             timeout: Optional[float] = None) -> Iterator[Tuple[str, object]]:
+        """
+        리포트 섹션을 스레드 풀에서 동시에 계산하고 끝나는 순서대로 반환
+        
+        Args:
+            df (pd.DataFrame): 분석할 데이터프레임 (계산 중에 수정하지 않아야 함)
+            max_workers (int): 동시에 계산할 섹션 수 (기본값: CPU 수)
+            timeout (float): 섹션 하나의 최대 계산 시간 (초)
+            
+        Yields:
+            Tuple[str, object]: (섹션 이름, 섹션 결과). 캐시된 섹션이 먼저 반환됩니다.
+        """
+        self.section_errors = {}
+        profile = get_column_profile(df)
+        
+        yield 'data_overview', {
+            'shape': df.shape,
+            'columns': df.columns.tolist(),
+            'dtypes': df.dtypes.to_dict(),
+            'missing_data': profile['null_counts']
         }
         
+        pending = []
+        for name, params, func in self._report_sections(df, n_clusters, n_components, outlier_method):
+            key = self._section_key(df, name, params)
+            result = self.cache.get(key) if self.cache is not None else None
+            if result is not None:
+                yield name, result
+            else:
+                pending.append((name, key, func))
+        
+        if not pending:
+            return
+        
+        started = {}
+        
+        cache = self.cache
+        
+        def run_section(name: str, key: Tuple, func: Callable[[], object]):
+            started[name] = time.monotonic()
+            result = func()
+            # 작업 스레드에서 바로 캐시에 저장 (리포트 소비가 중단되거나 시간이 초과되어 결과를
+            # 기다리지 않게 되어도 끝난 계산은 다음 리포트에서 재사용)
+            if cache is not None:
+                cache.put(key, result)
+            return result
+        
+        # 무거운 계산(BLAS, scikit-learn, SciPy)은 GIL을 놓으므로 데이터 복사가 필요 없는 스레드 풀 사용
+        executor = ThreadPoolExecutor(max_workers=min(len(pending), max_workers or os.cpu_count() or 1))
+        try:
+            futures = {executor.submit(run_section, name, key, func): name for name, key, func in pending}
+            
+            while futures:
+                wait_timeout = None
+                if timeout is not None:
+                    # 실행 중인 섹션 중 가장 먼저 시간이 초과되는 시점까지 대기
+                    deadlines = [started[name] + timeout for name in futures.values() if name in started]
+                    wait_timeout = max(min(deadlines) - time.monotonic(), 0) if deadlines else 0.05
+                
+                done, _ = wait(futures, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    name = futures.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        self.section_errors[name] = str(e)
+                        continue
+                    
+                    yield name, result
+                
+                if timeout is not None:
+                    now = time.monotonic()
+                    for future, name in list(futures.items()):
+                        if name in started and now - started[name] > timeout:
+                            # 실행 중인 스레드는 멈출 수 없으므로 결과를 기다리지 않고 버림
+                            del futures[future]
+                            self.section_errors[name] = f"{timeout}초 안에 계산을 마치지 못했습니다"
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _report_sections(self, df: pd.DataFrame, n_clusters: int, n_components: int,
+                         outlier_method: str) -> List[Tuple[str, Dict, Callable[[], object]]]:
+        """리포트 섹션 목록 (섹션 이름, 결과에 영향을 주는 파라미터, 계산 함수)"""
+        sections = [
+            ('descriptive_statistics', {}, lambda: self.descriptive_statistics(df)),
+            ('correlation_analysis', {}, lambda: self.correlation_analysis(df)),
+            ('outlier_analysis', {'method': outlier_method}, lambda: self.outlier_detection(df, outlier_method)),
+            ('normality_test', {}, lambda: self.normality_test(df)),
+            ('financial_analysis', {}, lambda: self.financial_analysis(df))
+        ]
+        
         # 시계열 분석 (날짜 컬럼이 있는 경우)
-        date_cols = df.select_dtypes(include=['datetime64']).columns
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        profile = get_column_profile(df)
+        date_cols = profile['date_columns']
+        numeric_cols = profile['numeric_columns']
         
         if len(date_cols) > 0 and len(numeric_cols) > 0:
             date_col = date_cols[0]
             value_col = numeric_cols[0]
+            params = {'date_col': date_col, 'value_col': value_col}
             
-            report['trend_analysis'] = self.trend_analysis(df, date_col, value_col)
-            report['seasonal_analysis'] = self.seasonal_analysis(df, date_col, value_col)
+            sections.append(('trend_analysis', params, lambda: self.trend_analysis(df, date_col, value_col)))
+            sections.append(('seasonal_analysis', params, lambda: self.seasonal_analysis(df, date_col, value_col)))
+            sections.append(('column_trends', {'date_col': date_col},
+                             lambda: self.column_trend_analysis(df, date_col)))
         
         # 군집 분석 (수치형 컬럼이 2개 이상인 경우)
         if len(numeric_cols) >= 2:
-            report['cluster_analysis'] = self.cluster_analysis(df)
-            report['pca_analysis'] = self.pca_analysis(df)
+            sections.append(('cluster_analysis', {'n_clusters': n_clusters},
+                             lambda: self.cluster_analysis(df, n_clusters)))
+            sections.append(('pca_analysis', {'n_components': n_components},
+                             lambda: self.pca_analysis(df, n_components)))
         
-        return report 
\ No newline at end of file
+        return sections
+    
+    def _section_key(self, df: pd.DataFrame, name: str, params: Dict) -> Tuple:
+        """섹션 캐시 키 (섹션 이름, 데이터 지문, 파라미터)"""
+        return name, dataframe_fingerprint(df), tuple(sorted(params.items()))
@@ -1,50 +1,606 @@
+import io
+import multiprocessing
+import os
+import tempfile
+import time
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+import openpyxl
 import streamlit as st
+from utils.column_profile import get_column_profile
+from utils.sidecar_cache import SidecarCache
+from utils.upload_store import UploadStore
+from utils.workbook_cache import WorkbookCache
+
+
+# 엑셀 입력으로 허용하는 형식: 파일 경로, 메모리 바이트, 파일 객체
+ExcelSource = Union[str, bytes, bytearray, memoryview, BinaryIO]
+
+
+def _as_excel_input(source: ExcelSource):
+    """바이트 입력은 BytesIO로 감싸서 pandas/openpyxl이 읽을 수 있게 변환"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(bytes(source))
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    return source
+
+
+def _read_bytes(source: ExcelSource) -> bytes:
+    """엑셀 입력의 전체 내용을 바이트로 읽기"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    if isinstance(source, str):
+        with open(source, 'rb') as f:
+            return f.read()
+    source.seek(0)
+    return source.read()
+
+
+def _make_column_names(header: Tuple) -> List[str]:
+    """pandas와 같은 규칙으로 헤더 행을 컬럼 이름으로 변환 (빈 이름, 중복 이름 처리)"""
+    names = []
+    seen = {}
+    for i, name in enumerate(header):
+        name = f"Unnamed: {i}" if name is None else name
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _lock_dtype(dtype) -> str:
+    """첫 청크에서 추론한 dtype을 이후 청크에도 유지할 수 있는 dtype으로 변환"""
+    if pd.api.types.is_bool_dtype(dtype):
+        return 'object'
+    if pd.api.types.is_numeric_dtype(dtype):
+        return 'float64'
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return 'datetime64[ns]'
+    return 'object'
+
+
+def _build_chunk(rows: List[Tuple], columns: List[str], chunk_dtypes: Optional[Dict[str, str]],
+                 dtypes: Optional[Dict[str, str]]) -> Tuple[pd.DataFrame, Dict[str, str]]:
+    """행 버퍼로 청크를 만들고 고정된 dtype 적용"""
+    chunk = pd.DataFrame.from_records(rows, columns=columns)
+    
+    if chunk_dtypes is None:
+        inferred = chunk.infer_objects()
+        chunk_dtypes = {col: _lock_dtype(dtype) for col, dtype in inferred.dtypes.items()}
+        chunk_dtypes.update(dtypes or {})
+    
+    for col, dtype in chunk_dtypes.items():
+        if dtype == 'object':
+            continue
+        if dtype.startswith('datetime64'):
+            chunk[col] = pd.to_datetime(chunk[col], errors='coerce')
+        elif dtype in ('float64', 'float32'):
+            chunk[col] = pd.to_numeric(chunk[col], errors='coerce').astype(dtype)
+        else:
+            chunk[col] = chunk[col].astype(dtype)
+    
+    return chunk, chunk_dtypes
+
+
+# 연-월-일 순서로 날짜가 모두 적힌 값 (뒤에 시각이 붙을 수 있음)
+_DATE_PATTERN = r'\d{4}[-/.]\d{1,2}[-/.]\d{1,2}(?:[ T]\d{1,2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?'
+
+
+def _parse_dates(series: pd.Series) -> Optional[pd.Series]:
+    """
+    연-월-일이 모두 적힌 문자열 컬럼을 datetime64로 변환 (날짜 컬럼이 아니면 None)
+    
+    pandas의 형식 추론은 '10:30' 같은 시각만 있는 값을 실행한 날의 날짜로, '2023-Q1' 같은
+    분기 표기를 분기 첫날로 해석하므로, 모든 값이 연-월-일 형식일 때만 ISO 8601로 변환합니다.
+    """
+    values = series.dropna()
+    sample = values.head(100)
+    if sample.empty or not all(isinstance(v, str) for v in sample):
+        return None
+    if not sample.str.fullmatch(_DATE_PATTERN).all():
+        return None
+    if not values.str.fullmatch(_DATE_PATTERN, na=False).all():
+        return None
+    
+    converted = pd.to_datetime(series, format='ISO8601', errors='coerce')
+    # 일부 값이 날짜로 해석되지 않으면 (예: 2023-13-01) 원본 유지
+    if converted.notna().sum() != len(values):
+        return None
+    return converted
+
+
+def optimize_dtypes(df: pd.DataFrame, category_threshold: float = 0.5,
+                    min_integer_bits: int = 32) -> pd.DataFrame:
+    """
+    메모리 사용량을 줄이도록 컬럼 dtype 최적화
+    
+    - 연-월-일 형식의 문자열 컬럼은 datetime64로 변환 (시각만 있는 값, 분기 표기는 문자열 유지)
+    - 고유값 비율이 category_threshold 이하인 문자열 컬럼은 category로 변환
+    - 정수 컬럼은 값 범위에 맞는 정수형으로 변환하되 min_integer_bits보다 작게 줄이지 않음
+    - 실수 컬럼은 값이 손실되지 않을 때만 float32로 변환
+    
+    정수 컬럼을 int8/int16까지 줄이면 메모리는 더 줄지만, 이후 df['Quantity'] * 10 같은
+    계산 결과가 범위를 넘을 때 오류 없이 값이 넘쳐 버립니다. 기본값 32비트는 int64의 절반
+    메모리로 일반적인 계산에 충분한 여유를 남깁니다 (약 ±21억을 넘는 결과는 여전히 넘칠 수 있음).
+    
+    Args:
+        df (pd.DataFrame): 원본 데이터프레임
+        category_threshold (float): category로 변환할 최대 고유값 비율
+        min_integer_bits (int): 정수 컬럼의 최소 비트 수 (8, 16, 32, 64, 작을수록 공격적인 축소)
+        
+    Returns:
+        pd.DataFrame: dtype이 최적화된 데이터프레임
+    """
+    optimized = {}
+    
+    for col in df.columns:
+        series = df[col]
+        
+        if series.dtype == object:
+            converted = _parse_dates(series)
+            if converted is not None:
+                optimized[col] = converted
+                continue
+            
+            n_values = series.notna().sum()
+            if n_values > 0 and series.nunique() / n_values <= category_threshold:
+                optimized[col] = series.astype('category')
+            else:
+                optimized[col] = series
+        
+        elif pd.api.types.is_integer_dtype(series.dtype):
+            downcast = pd.to_numeric(series, downcast='integer')
+            if series.dtype.itemsize * 8 <= min_integer_bits:
+                # 원래 dtype이 이미 하한보다 작으면 그대로 유지
+                downcast = series
+            elif downcast.dtype.itemsize * 8 < min_integer_bits:
+                # nullable 정수(Int64 등)는 같은 종류의 nullable 정수형 유지
+                nullable = isinstance(series.dtype, pd.api.extensions.ExtensionDtype)
+                downcast = series.astype(f"{'Int' if nullable else 'int'}{min_integer_bits}")
+            optimized[col] = downcast
+        
+        elif pd.api.types.is_float_dtype(series.dtype) and series.dtype != np.float32:
+            downcast = series.astype(np.float32)
+            if np.array_equal(downcast.to_numpy(dtype=np.float64), series.to_numpy(), equal_nan=True):
+                optimized[col] = downcast
+            else:
+                optimized[col] = series
+        
+        else:
+            optimized[col] = series
+    
+    result = pd.DataFrame(optimized, index=df.index)
+    result.columns = df.columns
+    return result
+
+
+def _parse_sheet_frame(excel_file: pd.ExcelFile, sheet_name: str, optimize: bool) -> pd.DataFrame:
+    """열려 있는 워크북에서 시트 하나를 파싱 (optimize이면 dtype 최적화 후 메모리 사용량 기록)"""
+    df = excel_file.parse(sheet_name)
+    
+    if optimize:
+        memory_before = int(df.memory_usage(deep=True).sum())
+        df = optimize_dtypes(df)
+        df.attrs['memory_usage'] = {
+            'before': memory_before,
+            'after': int(df.memory_usage(deep=True).sum())
+        }
+    
+    return df
+
+
+def _parse_sheets_in_worker(path: str, sheet_names: List[str],
+                            optimize: bool) -> List[Tuple[str, Optional[pd.DataFrame], float, Optional[str]]]:
+    """
+    프로세스 풀 작업자에서 워크북을 한 번 열고 맡은 시트들을 파싱
+    
+    Returns:
+        List[Tuple]: 시트별 (시트 이름, 데이터프레임, 소요 시간, 오류 메시지)
+    """
+    results = []
+    with pd.ExcelFile(path) as excel_file:
+        for sheet_name in sheet_names:
+            start = time.perf_counter()
+            try:
+                df, error = _parse_sheet_frame(excel_file, sheet_name, optimize), None
+            except Exception as e:
+                df, error = None, str(e)
+            results.append((sheet_name, df, time.perf_counter() - start, error))
+    return results
+
+
+def _pool_context():
+    """
+    작업자 프로세스 시작 방식
+    
+    Streamlit/Dash 서버는 여러 스레드를 실행 중이므로 fork로 복제하면 다른 스레드가 잡고 있던
+    잠금이 작업자에 그대로 남을 수 있습니다. 가능하면 깨끗한 프로세스에서 복제하는 forkserver를,
+    없으면 spawn을 사용합니다.
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+    
+    context = multiprocessing.get_context('forkserver')
+    # 이 모듈(pandas, openpyxl 포함)을 서버에서 한 번만 불러오고 작업자는 그 상태에서 복제
+    context.set_forkserver_preload([__name__])
+    return context
+
+
+class LazySheets(Mapping):
+    """시트에 처음 접근할 때 파싱하는 읽기 전용 시트 딕셔너리"""
+    
+    def __init__(self, reader: 'ExcelReader'):
+        self._reader = reader
+    
+    def __getitem__(self, sheet_name: str) -> pd.DataFrame:
+        df = self._reader.get_sheet_data(sheet_name)
+        if df is None:
+            raise KeyError(sheet_name)
+        return df
+    
+    def __iter__(self):
+        return iter(self._reader.get_sheet_names())
+    
+    def __len__(self) -> int:
+        return len(self._reader.sheet_index)
 
 
 class ExcelReader:
     """엑셀 파일을 읽고 처리하는 클래스"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[WorkbookCache] = None, sidecar: Optional[SidecarCache] = None,
+                 optimize: bool = False):
         self.data = None
         self.sheets = {}
+        self.sheet_index = {}
         self.current_sheet = None
+        self.parse_times = {}
+        self.sheet_errors = {}
+        self.cache = cache
+        self.sidecar = sidecar
+        self.optimize = optimize
+        self.content_hash = None
+        self._source = None
+        self._excel_file = None
     
-    def read_excel(self, file_path: str) -> Dict[str, pd.DataFrame]:
+    def read_excel(self, source: ExcelSource, lazy: bool = False,
+                   workers: Optional[int] = None) -> Mapping[str, pd.DataFrame]:
         """
-        엑셀 파일을 읽어서 모든 시트를 딕셔너리로 반환
+        엑셀 파일을 한 번만 열어서 모든 시트를 딕셔너리로 반환
         
         Args:
-            file_path (str): 엑셀 파일 경로
+            source (ExcelSource): 엑셀 파일 경로, 바이트 또는 파일 객체
+            lazy (bool): True이면 시트 인덱스만 만들고 데이터는 처음 조회할 때 파싱
+            workers (int): 2 이상이면 프로세스 풀에서 시트를 동시에 파싱
+                           (파싱할 시트 수와 CPU 수를 넘지 않고, 둘 중 하나가 1이면 순차 파싱)
             
         Returns:
-            Dict[str, pd.DataFrame]: 시트명을 키로 하는 데이터프레임 딕셔너리
+            Mapping[str, pd.DataFrame]: 시트명을 키로 하는 데이터프레임 딕셔너리
+            (읽지 못한 시트는 제외되고 오류는 sheet_errors에 기록)
         """
+        self.close()
+        self.sheets = {}
+        self.sheet_index = {}
+        self.parse_times = {}
+        self.sheet_errors = {}
+        self.content_hash = None
+        
         try:
-            # 모든 시트 읽기
-            excel_file = pd.ExcelFile(file_path)
-            sheets = {}
+            # 캐시를 사용하면 파일 내용의 해시로 이미 파싱된 워크북을 찾음
+            if self.cache is not None or self.sidecar is not None:
+                source_key = os.path.abspath(source) if isinstance(source, str) else None
+                source = _read_bytes(source)
+                self.content_hash = WorkbookCache.content_hash(source)
+                
+                if self.sidecar is not None and source_key is not None:
+                    # 같은 경로의 파일 내용이 바뀌었으면 이전 사이드카 파일 삭제
+                    self.sidecar.invalidate(source_key, self.content_hash)
+                
+                self.sheet_index = self._get_cached_sheet_index() or {}
             
-            for sheet_name in excel_file.sheet_names:
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
-                sheets[sheet_name] = df
+            self._source = source
             
-            self.sheets = sheets
-            return sheets
+            if not self.sheet_index:
+                self.sheet_index = self._build_sheet_index(self._open_workbook())
+                if self.cache is not None:
+                    self.cache.put_sheet_index(self.content_hash, self.sheet_index)
+                if self.sidecar is not None:
+                    self.sidecar.put_sheet_index(self.content_hash, self.sheet_index)
+            
+            if lazy:
+                # 시트 데이터는 처음 조회할 때 파싱
+                return LazySheets(self)
+            
+            # 캐시에 없는 시트만 파싱
+            pending = [name for name in self.sheet_index if self._get_cached_sheet(name) is None]
+            
+            # 작업자를 띄우는 비용이 이득보다 크면 (시트가 하나이거나 CPU가 하나) 순차 파싱
+            workers = min(workers or 1, os.cpu_count() or 1, len(pending))
+            if workers > 1:
+                self._parse_sheets_in_pool(pending, workers)
+            else:
+                # 워크북을 한 번만 열고 같은 핸들에서 모든 시트 파싱
+                for sheet_name in pending:
+                    try:
+                        self.get_sheet_data(sheet_name)
+                    except Exception as e:
+                        self.sheet_errors[sheet_name] = str(e)
+            self.close()
+            
+            if self.sheet_errors:
+                failed = ', '.join(self.sheet_errors)
+                st.warning(f"일부 시트를 읽지 못했습니다: {failed}")
+            
+            # 시트 순서를 원본 워크북과 같게 유지
+            return {name: self.sheets[name] for name in self.sheet_index if name in self.sheets}
             
         except Exception as e:
+            self.close()
             st.error(f"엑셀 파일 읽기 오류: {str(e)}")
             return {}
     
+    def read_upload(self, store: UploadStore, upload_id: str, lazy: bool = False) -> Mapping[str, pd.DataFrame]:
+        """
+        업로드 저장소에 보관된 파일을 임시 파일 없이 바로 읽기
+        
+        Args:
+            store (UploadStore): 업로드 저장소
+            upload_id (str): 업로드 ID
+            lazy (bool): True이면 시트 데이터는 처음 조회할 때 파싱
+            
+        Returns:
+            Mapping[str, pd.DataFrame]: 시트명을 키로 하는 데이터프레임 딕셔너리
+        """
+        data = store.get(upload_id)
+        if data is None:
+            st.error("업로드된 파일을 찾을 수 없습니다. 파일을 다시 업로드하세요.")
+            return {}
+        
+        return self.read_excel(data, lazy=lazy)
+    
+    def _get_cached_sheet_index(self) -> Optional[Dict[str, Dict]]:
+        """메모리 캐시, 사이드카 캐시 순으로 시트 인덱스 조회"""
+        sheet_index = None
+        if self.cache is not None:
+            sheet_index = self.cache.get_sheet_index(self.content_hash)
+        if sheet_index is None and self.sidecar is not None:
+            sheet_index = self.sidecar.get_sheet_index(self.content_hash)
+            if sheet_index is not None and self.cache is not None:
+                self.cache.put_sheet_index(self.content_hash, sheet_index)
+        return sheet_index
+    
+    def _open_workbook(self) -> pd.ExcelFile:
+        """워크북 핸들을 열거나 이미 열려 있는 핸들 반환"""
+        if self._excel_file is None:
+            self._excel_file = pd.ExcelFile(_as_excel_input(self._source))
+        return self._excel_file
+    
+    def _build_sheet_index(self, excel_file: pd.ExcelFile) -> Dict[str, Dict]:
+        """
+        가벼운 시트 인덱스 생성
+        
+        openpyxl로 여는 xlsx 워크북은 시트 XML의 dimension 정보와 첫 행(헤더)을 바로 읽습니다.
+        그 외 형식(xls, ods, xlsb)은 시트 이름만 기록하고 헤더는 get_sheet_index에서 필요할 때 읽습니다.
+        """
+        if excel_file.engine != 'openpyxl':
+            return {sheet_name: {'n_rows': None, 'n_cols': None, 'columns': None}
+                    for sheet_name in excel_file.sheet_names}
+        
+        index = {}
+        book = excel_file.book
+        
+        for sheet_name in excel_file.sheet_names:
+            worksheet = book[sheet_name]
+            header = next(worksheet.iter_rows(min_row=1, max_row=1, values_only=True), ())
+            columns = list(header)
+            while columns and columns[-1] is None:
+                columns.pop()
+            
+            max_row = worksheet.max_row
+            index[sheet_name] = {
+                'n_rows': max(max_row - 1, 0) if max_row else None,
+                'n_cols': worksheet.max_column or len(columns),
+                'columns': columns
+            }
+        
+        return index
+    
+    def _parse_sheet(self, excel_file: pd.ExcelFile, sheet_name: str) -> pd.DataFrame:
+        """열려 있는 워크북 핸들에서 시트 하나를 파싱하고 소요 시간 기록"""
+        start = time.perf_counter()
+        df = _parse_sheet_frame(excel_file, sheet_name, self.optimize)
+        self.parse_times[sheet_name] = time.perf_counter() - start
+        return df
+    
+    def _parse_sheets_in_pool(self, sheet_names: List[str], workers: int):
+        """
+        프로세스 풀에서 시트를 동시에 파싱 (오류는 시트별로 기록)
+        
+        워크북 내용은 임시 파일에 한 번만 써서 경로만 넘기고, 시트는 행 수 기준으로 작업자 수만큼의
+        묶음으로 나눠 작업자마다 워크북을 한 번만 열게 합니다.
+        """
+        tmp_path = None
+        if isinstance(self._source, str):
+            path = self._source
+        else:
+            with tempfile.NamedTemporaryFile(prefix='exceldash_', delete=False) as f:
+                f.write(_read_bytes(self._source))
+                tmp_path = path = f.name
+        
+        # 큰 시트부터 가장 적게 맡은 작업자에게 배정
+        batches = [[] for _ in range(workers)]
+        loads = [0] * workers
+        sizes = {name: (self.sheet_index.get(name, {}).get('n_rows') or 0) for name in sheet_names}
+        for sheet_name in sorted(sheet_names, key=sizes.get, reverse=True):
+            target = loads.index(min(loads))
+            batches[target].append(sheet_name)
+            loads[target] += sizes[sheet_name] + 1
+        
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as executor:
+                futures = {
+                    executor.submit(_parse_sheets_in_worker, path, batch, self.optimize): batch
+                    for batch in batches
+                }
+                for future in as_completed(futures):
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        for sheet_name in futures[future]:
+                            self.sheet_errors[sheet_name] = str(e)
+                        continue
+                    
+                    for sheet_name, df, elapsed, error in results:
+                        if error is not None:
+                            self.sheet_errors[sheet_name] = error
+                            continue
+                        self.parse_times[sheet_name] = elapsed
+                        self._store_sheet(sheet_name, df)
+        finally:
+            if tmp_path is not None:
+                os.remove(tmp_path)
+    
+    def close(self):
+        """열어 둔 워크북 핸들 닫기 (이후 조회가 필요하면 다시 열림)"""
+        if self._excel_file is not None:
+            self._excel_file.close()
+            self._excel_file = None
+    
+    def get_parse_times(self) -> Dict[str, float]:
+        """시트별 파싱 시간(초) 반환 (오래 걸린 순)"""
+        return dict(sorted(self.parse_times.items(), key=lambda item: item[1], reverse=True))
+    
     def get_sheet_names(self) -> List[str]:
         """시트 이름 목록 반환"""
-        return list(self.sheets.keys())
+        return list(self.sheet_index.keys())
+    
+    def get_sheet_index(self) -> Dict[str, Dict]:
+        """시트별 행 수, 열 수, 헤더 정보 반환 (헤더를 아직 읽지 않은 시트는 이때 읽음)"""
+        for sheet_name, info in self.sheet_index.items():
+            if info.get('columns') is not None:
+                continue
+            
+            df = self.sheets.get(sheet_name)
+            if df is None:
+                df = self._open_workbook().parse(sheet_name, nrows=0)
+            else:
+                info['n_rows'] = len(df)
+            info['n_cols'] = len(df.columns)
+            info['columns'] = df.columns.tolist()
+        
+        return self.sheet_index
     
     def get_sheet_data(self, sheet_name: str) -> Optional[pd.DataFrame]:
-        """특정 시트의 데이터 반환"""
-        return self.sheets.get(sheet_name)
+        """특정 시트의 데이터 반환 (지연 로딩 모드에서는 처음 조회할 때 파싱)"""
+        if sheet_name not in self.sheet_index:
+            return None
+        
+        df = self._get_cached_sheet(sheet_name)
+        if df is None:
+            df = self._parse_sheet(self._open_workbook(), sheet_name)
+            self._store_sheet(sheet_name, df)
+        
+        return df
+    
+    def _cache_key(self, sheet_name: str) -> str:
+        """캐시 키 (최적화된 시트는 원본 시트와 따로 저장)"""
+        return f"{sheet_name}:optimized" if self.optimize else sheet_name
+    
+    def _get_cached_sheet(self, sheet_name: str) -> Optional[pd.DataFrame]:
+        """이미 읽은 시트 → 메모리 캐시 → 사이드카 파일 순으로 조회"""
+        df = self.sheets.get(sheet_name)
+        if df is not None:
+            return df
+        
+        cache_key = self._cache_key(sheet_name)
+        if self.cache is not None:
+            df = self.cache.get(self.content_hash, cache_key)
+        
+        if df is None and self.sidecar is not None:
+            df = self.sidecar.get(self.content_hash, cache_key)
+            if df is not None and self.cache is not None:
+                self.cache.put(self.content_hash, cache_key, df)
+        
+        if df is not None:
+            self.sheets[sheet_name] = df
+        return df
+    
+    def _store_sheet(self, sheet_name: str, df: pd.DataFrame):
+        """새로 파싱한 시트를 저장하고 캐시에 추가"""
+        cache_key = self._cache_key(sheet_name)
+        if self.cache is not None:
+            self.cache.put(self.content_hash, cache_key, df)
+        if self.sidecar is not None:
+            self.sidecar.put(self.content_hash, cache_key, df)
+        self.sheets[sheet_name] = df
+    
+    def iter_sheet_chunks(self, sheet_name: Optional[str] = None, chunksize: int = 100000,
+                          source: Optional[ExcelSource] = None,
+                          dtypes: Optional[Dict[str, str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        openpyxl 읽기 전용 모드로 시트를 행 단위 청크로 스트리밍
+        
+        첫 청크에서 추론한 dtype을 이후 모든 청크에 같게 적용합니다.
+        정수 컬럼은 이후 청크의 결측값을 담을 수 있도록 float64로 고정합니다.
+        
+        Args:
+            sheet_name (str): 시트 이름 (없으면 첫 번째 시트)
+            chunksize (int): 청크당 행 수
+            source (ExcelSource): 엑셀 입력 (없으면 마지막으로 읽은 파일)
+            dtypes (Dict[str, str]): 컬럼별 dtype 지정 (추론 결과보다 우선)
+            
+        Yields:
+            pd.DataFrame: 최대 chunksize 행의 데이터프레임
+        """
+        source = source if source is not None else self._source
+        if source is None:
+            raise ValueError("스트리밍할 엑셀 파일이 없습니다.")
+        if chunksize < 1:
+            raise ValueError("chunksize는 1 이상이어야 합니다.")
+        
+        workbook = openpyxl.load_workbook(_as_excel_input(source), read_only=True, data_only=True)
+        try:
+            worksheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+            rows = worksheet.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            
+            columns = _make_column_names(header)
+            width = len(columns)
+            chunk_dtypes = None
+            buffer = []
+            
+            for row in rows:
+                row = row[:width]
+                if len(row) < width:
+                    row = row + (None,) * (width - len(row))
+                buffer.append(row)
+                
+                if len(buffer) >= chunksize:
+                    chunk, chunk_dtypes = _build_chunk(buffer, columns, chunk_dtypes, dtypes)
+                    buffer = []
+                    yield chunk
+            
+            if buffer:
+                chunk, chunk_dtypes = _build_chunk(buffer, columns, chunk_dtypes, dtypes)
+                yield chunk
+        finally:
+            workbook.close()
+    
+    def get_column_profile(self, sheet_name: str) -> Dict:
+        """시트의 컬럼 프로파일 반환 (시트별로 한 번만 계산)"""
+        df = self.get_sheet_data(sheet_name)
+        if df is None:
+            return {}
+        return get_column_profile(df)
     
     def get_data_info(self, sheet_name: str) -> Dict:
         """데이터 정보 반환"""
@@ -52,18 +608,30 @@ class ExcelReader:
         if df is None:
             return {}
         
+        profile = get_column_profile(df)
         info = {
             'shape': df.shape,
             'columns': df.columns.tolist(),
             'dtypes': df.dtypes.to_dict(),
-            'missing_values': df.isnull().sum().to_dict(),
-            'numeric_columns': df.select_dtypes(include=[np.number]).columns.tolist(),
-            'categorical_columns': df.select_dtypes(include=['object']).columns.tolist(),
-            'date_columns': df.select_dtypes(include=['datetime64']).columns.tolist()
+            'missing_values': profile['null_counts'],
+            'numeric_columns': profile['numeric_columns'],
+            'categorical_columns': profile['categorical_columns'],
+            'date_columns': profile['date_columns'],
+            'memory_usage': self._get_memory_usage(df)
         }
         
         return info
     
+    @staticmethod
+    def _get_memory_usage(df: pd.DataFrame) -> Dict[str, int]:
+        """dtype 최적화 전후 메모리 사용량(바이트) 반환 (최적화하지 않았으면 전후 동일)"""
+        current = int(df.memory_usage(deep=True).sum())
+        memory_usage = df.attrs.get('memory_usage', {})
+        return {
+            'before': memory_usage.get('before', current),
+            'after': current
+        }
+    
     def clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """데이터 정리"""
         # 결측값 처리
@@ -0,0 +1,28 @@
+import sys
+from typing import Optional, Tuple
+from utils.byte_lru import ByteLRUCache
+
+
+class FigureCache(ByteLRUCache):
+    """차트를 (데이터 지문, 차트 종류, 인자) 키로 직렬화된 JSON 문자열로 보관하는 LRU 캐시"""
+
+    def __init__(self, max_bytes: int = 128 * 1024 * 1024, max_entry_bytes: int = 8 * 1024 * 1024):
+        """
+        Args:
+            max_bytes (int): 저장할 JSON 문자열 전체 크기 예산
+            max_entry_bytes (int): 차트 하나의 최대 크기 (원본 값을 모두 담은 큰 차트는 JSON에서
+                                   복원하는 데 다시 만드는 것보다 오래 걸릴 수 있어 저장하지 않음)
+        """
+        super().__init__(max_bytes, max_entry_bytes)
+
+    def get(self, key: Tuple) -> Optional[str]:
+        """캐시된 차트 JSON 반환 (없으면 None)"""
+        return self._get(key)
+
+    def put(self, key: Tuple, figure_json: str):
+        """차트 JSON 저장 (예산을 넘으면 가장 오래 사용하지 않은 항목부터 제거)"""
+        self._put(key, figure_json, sys.getsizeof(figure_json))
+
+
+# 프로세스 전체에서 공유하는 차트 캐시 (Streamlit 재실행과 Dash 콜백 사이에도 유지)
+figure_cache = FigureCache()
@@ -0,0 +1,195 @@
+import re
+from typing import List, Optional, Union
+import numpy as np
+import pandas as pd
+from utils.column_profile import get_column_profile
+
+
+# 표준 계정 항목 -> 컬럼 이름(또는 계정과목 이름) 별칭
+# 비교할 때는 대소문자, 공백, 밑줄, 하이픈을 무시합니다.
+ACCOUNT_ALIASES = {
+    'revenue': ['Revenue', 'Sales_Amount', 'Net_Sales', '매출액', '매출', '순매출액'],
+    'cost_of_sales': ['Cost_of_Sales', 'COGS', 'Cost_of_Goods_Sold', '매출원가'],
+    'gross_profit': ['Gross_Profit', '매출총이익'],
+    'selling_expenses': ['Selling_Expenses', '판매비'],
+    'admin_expenses': ['Admin_Expenses', 'Administrative_Expenses', '관리비'],
+    'operating_income': ['Operating_Income', 'Operating_Profit', '영업이익'],
+    'net_income': ['Net_Income', 'Net_Profit', '당기순이익', '순이익'],
+    'total_assets': ['Total_Assets', '자산총계', '총자산'],
+    'total_liabilities': ['Total_Liabilities', '부채총계', '총부채', '부채'],
+    'equity': ['Equity', 'Total_Equity', '자본총계', '자본']
+}
+
+# 다른 항목으로 계산할 수 있는 항목 -> (더할 항목, 뺄 항목) (시트에 없을 때만 계산)
+DERIVED_ACCOUNTS = {
+    'gross_profit': (['revenue'], ['cost_of_sales']),
+    'operating_income': (['gross_profit'], ['selling_expenses', 'admin_expenses'])
+}
+
+# 비율 이름 -> (분자 항목, 분모 항목), 백분율로 계산
+FINANCIAL_RATIOS = {
+    # 수익성 지표
+    'profit_margin': ('net_income', 'revenue'),
+    'gross_margin': ('gross_profit', 'revenue'),
+    'roe': ('net_income', 'equity'),
+    'roa': ('net_income', 'total_assets'),
+    # 안정성 지표
+    'debt_ratio': ('total_liabilities', 'total_assets'),
+    # 비용 구조
+    'operating_margin': ('operating_income', 'revenue'),
+    'cost_ratio': ('cost_of_sales', 'revenue')
+}
+
+# 계정과목별로 한 행씩 기록된 (long 형식) 시트의 계정과목/금액 컬럼 별칭
+ACCOUNT_COLUMN_ALIASES = ['Account', 'Account_Name', '계정과목', '계정']
+AMOUNT_COLUMN_ALIASES = ['Amount', 'Value', '금액']
+
+
+def _normalize(name) -> str:
+    """별칭 비교용 이름 (대소문자, 공백, 밑줄, 하이픈 무시)"""
+    return re.sub(r'[\s_\-]', '', str(name)).lower()
+
+
+_ALIAS_LOOKUP = {_normalize(alias): account for account, aliases in ACCOUNT_ALIASES.items() for alias in aliases}
+
+
+def _find_column(columns, aliases: List[str]) -> Optional[str]:
+    """별칭과 일치하는 첫 번째 컬럼 반환"""
+    normalized = {_normalize(alias) for alias in aliases}
+    return next((col for col in columns if _normalize(col) in normalized), None)
+
+
+def _as_list(keys: Union[str, List[str], None]) -> List[str]:
+    if keys is None:
+        return []
+    return [keys] if isinstance(keys, str) else list(keys)
+
+
+def extract_accounts(df: pd.DataFrame, keys: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    시트에서 표준 계정 항목을 찾아 (행 x 항목) 데이터프레임으로 반환
+
+    컬럼 이름이 별칭과 일치하는 수치형 컬럼을 사용하고, 그런 컬럼이 없으면 계정과목/금액
+    컬럼이 있는 long 형식 시트로 보고 keys (없으면 첫 번째 날짜 컬럼) 별로 금액을 합산합니다.
+
+    Args:
+        df (pd.DataFrame): 데이터프레임
+        keys (List[str]): 결과에 함께 남길 그룹/기간 컬럼
+
+    Returns:
+        pd.DataFrame: keys 컬럼과 표준 항목 컬럼 (찾은 항목이 없으면 빈 데이터프레임)
+    """
+    keys = keys or []
+    profile = get_column_profile(df)
+
+    accounts = {}
+    for col in profile['numeric_columns']:
+        account = _ALIAS_LOOKUP.get(_normalize(col))
+        if account is not None and account not in accounts:
+            accounts[account] = col
+
+    if accounts:
+        result = pd.DataFrame({account: df[col] for account, col in accounts.items()})
+        for key in reversed(keys):
+            result.insert(0, key, df[key])
+        return result
+
+    account_col = _find_column(df.columns, ACCOUNT_COLUMN_ALIASES)
+    amount_col = _find_column(profile['numeric_columns'], AMOUNT_COLUMN_ALIASES)
+    if account_col is None or amount_col is None:
+        return pd.DataFrame()
+
+    # 계정과목 이름은 고유값별로 한 번만 표준 항목에 매칭
+    codes, names = pd.factorize(df[account_col])
+    mapped = np.array([_ALIAS_LOOKUP.get(_normalize(name)) for name in names] + [None], dtype=object)
+    labels = mapped[codes]
+    rows = np.flatnonzero(pd.notna(labels))
+    if len(rows) == 0:
+        return pd.DataFrame()
+
+    # 기간 컬럼을 지정하지 않으면 첫 번째 날짜 컬럼별로 합산
+    pivot_keys = keys or profile['date_columns'][:1]
+    long_df = df.iloc[rows][pivot_keys + [amount_col]].assign(_account=labels[rows])
+    totals = long_df.groupby(pivot_keys + ['_account'], observed=True)[amount_col].sum()
+    if pivot_keys:
+        result = totals.unstack('_account').reset_index()
+    else:
+        result = totals.to_frame().T.reset_index(drop=True)
+    result.columns.name = None
+    return result
+
+
+def compute_ratios(accounts: pd.DataFrame, group_by: Optional[List[str]] = None,
+                   period_col: Optional[str] = None) -> pd.DataFrame:
+    """
+    행별 재무비율을 한 번에 계산 (분모가 0이거나 값이 없으면 NaN)
+
+    Args:
+        accounts (pd.DataFrame): extract_accounts 결과
+        group_by (List[str]): 매출 성장률을 따로 계산할 그룹 컬럼
+        period_col (str): 매출 성장률 계산 순서 (없으면 행 순서)
+
+    Returns:
+        pd.DataFrame: 비율 컬럼 (accounts와 같은 인덱스)
+    """
+    accounts = accounts.copy()
+    for account, (plus, minus) in DERIVED_ACCOUNTS.items():
+        if account not in accounts and all(item in accounts for item in plus + minus):
+            accounts[account] = accounts[plus].sum(axis=1, min_count=len(plus)) - accounts[minus].sum(axis=1, min_count=len(minus))
+
+    available = {name: items for name, items in FINANCIAL_RATIOS.items()
+                 if items[0] in accounts and items[1] in accounts}
+    items = list(dict.fromkeys(item for pair in available.values() for item in pair))
+    position = {item: i for i, item in enumerate(items)}
+
+    # 필요한 항목을 한 배열로 모아 모든 비율을 한 번의 나눗셈으로 계산
+    values = accounts[items].to_numpy(dtype=np.float64, na_value=np.nan) if items else np.empty((len(accounts), 0))
+    numerators = [position[num] for num, _ in available.values()]
+    denominators = [position[den] for _, den in available.values()]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio_values = values[:, numerators] / values[:, denominators] * 100
+    ratio_values[~np.isfinite(ratio_values)] = np.nan
+    ratios = pd.DataFrame(ratio_values, index=accounts.index, columns=list(available))
+
+    # 성장성 지표
+    if 'revenue' in accounts:
+        revenue = accounts['revenue'].astype(np.float64)
+        order = accounts.sort_values(period_col, kind='stable').index if period_col else accounts.index
+        revenue = revenue.loc[order]
+        if group_by:
+            keys = [accounts.loc[order, key] for key in group_by]
+            growth = revenue.groupby(keys, observed=True, sort=False).pct_change(fill_method=None)
+        else:
+            growth = revenue.pct_change(fill_method=None)
+        ratios['revenue_growth'] = growth.replace([np.inf, -np.inf], np.nan).reindex(accounts.index) * 100
+
+    return ratios
+
+
+def financial_ratio_table(df: pd.DataFrame, group_by: Union[str, List[str], None] = None,
+                          period_col: Optional[str] = None) -> pd.DataFrame:
+    """
+    그룹/기간별 재무비율 표
+
+    Args:
+        df (pd.DataFrame): wide 형식(항목별 컬럼) 또는 long 형식(계정과목/금액 컬럼) 시트
+        group_by (str | List[str]): 그룹 컬럼 (예: 회사, 부서)
+        period_col (str): 기간 컬럼 (예: 연도, 날짜)
+
+    Returns:
+        pd.DataFrame: (그룹, 기간)별 행별 비율의 평균 (둘 다 없으면 시트 전체 평균 한 행)
+    """
+    group_by = _as_list(group_by)
+    keys = group_by + ([period_col] if period_col else [])
+
+    accounts = extract_accounts(df, keys)
+    if accounts.empty:
+        return pd.DataFrame()
+
+    ratios = compute_ratios(accounts, group_by, period_col)
+    if ratios.empty:
+        return pd.DataFrame()
+
+    if keys:
+        return ratios.groupby([accounts[key] for key in keys], observed=True, sort=False).mean()
+    return ratios.mean().to_frame().T
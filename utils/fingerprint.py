@@ -0,0 +1,21 @@
+import hashlib
+import pandas as pd
+from utils.frame_memo import frame_memo
+
+
+def build_dataframe_fingerprint(df: pd.DataFrame) -> str:
+    """데이터프레임의 값, 인덱스, 컬럼 이름, dtype으로 내용 지문 계산"""
+    digest = hashlib.sha1()
+    digest.update(repr((df.shape, df.columns.tolist(), [str(dtype) for dtype in df.dtypes])).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+@frame_memo
+def dataframe_fingerprint(df: pd.DataFrame) -> str:
+    """
+    데이터프레임별로 한 번만 계산한 내용 지문 반환
+
+    같은 데이터프레임 객체에 대해서는 저장된 지문을 재사용합니다 (frame_memo 참고).
+    """
+    return build_dataframe_fingerprint(df)
@@ -0,0 +1,67 @@
+import functools
+import inspect
+import threading
+import weakref
+import pandas as pd
+
+
+def _frame_key(df: pd.DataFrame):
+    """저장된 결과를 다시 계산해야 하는지 판단하기 위한 데이터프레임 구성 정보"""
+    return df.shape, tuple(df.columns), tuple(df.dtypes)
+
+
+def frame_memo(func=None, *, exclusive: bool = False):
+    """
+    데이터프레임(과 추가 인자)별로 한 번만 계산한 결과를 재사용하는 데코레이터
+
+    결과는 (데이터프레임 id, 추가 인자) 키로 저장하고 데이터프레임이 사라지면 함께 삭제합니다.
+    컬럼 구성이나 dtype이 바뀌면 다시 계산하지만, 값을 제자리에서 수정한 경우는 감지하지
+    못하므로 이 결과를 사용하는 데이터프레임은 수정하지 않아야 합니다.
+
+    Args:
+        exclusive (bool): True이면 계산하는 동안 잠금을 유지해서 여러 스레드가 동시에 요청해도
+                          한 번만 계산 (비용이 큰 계산용, 다른 데이터프레임의 계산도 기다림)
+    """
+    if func is None:
+        return functools.partial(frame_memo, exclusive=exclusive)
+
+    signature = inspect.signature(func)
+    # 키 -> (약한 참조, 컬럼 구성, 결과)
+    entries = {}
+    lock = threading.Lock()
+
+    def lookup(df: pd.DataFrame, cache_key, key):
+        entry = entries.get(cache_key)
+        if entry is not None and entry[0]() is df and entry[1] == key:
+            return entry
+        return None
+
+    def store(df: pd.DataFrame, cache_key, key, value):
+        ref = weakref.ref(df, lambda _, cache_key=cache_key: entries.pop(cache_key, None))
+        entries[cache_key] = (ref, key, value)
+
+    @functools.wraps(func)
+    def wrapper(df: pd.DataFrame, *args, **kwargs):
+        # 기본값을 채운 인자로 키를 만들어 같은 호출은 위치/키워드 인자 여부와 관계없이 같은 키 사용
+        bound = signature.bind(df, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = tuple(bound.arguments.values())[1:]
+        cache_key = (id(df),) + arguments
+        key = _frame_key(df)
+
+        with lock:
+            entry = lookup(df, cache_key, key)
+            if entry is not None:
+                return entry[2]
+            if exclusive:
+                value = func(df, *arguments)
+                store(df, cache_key, key, value)
+                return value
+
+        value = func(df, *arguments)
+        with lock:
+            store(df, cache_key, key, value)
+        return value
+
+    wrapper.cache_entries = entries
+    return wrapper
@@ -0,0 +1,219 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, Optional
+import pandas as pd
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow가 없으면 사이드카 캐시를 사용하지 않음
+    feather = None
+
+
+class SidecarCache:
+    """파싱된 시트를 워크북 내용 해시별 Feather 파일로 저장하는 디스크 캐시"""
+
+    INDEX_FILE = 'index.json'
+    MANIFEST_FILE = 'manifest.json'
+    # 워크북별 시트 메타데이터 매니페스트 (Feather에 저장되지 않는 df.attrs)
+    SHEET_MANIFEST_FILE = 'sheets.json'
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 2 * 1024 * 1024 * 1024):
+        self.directory = directory or os.path.join(tempfile.gettempdir(), 'exceldash_sidecar')
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        """pyarrow 설치 여부"""
+        return feather is not None
+
+    def get(self, content_hash: str, sheet_name: str) -> Optional[pd.DataFrame]:
+        """사이드카 파일을 메모리 맵으로 열어서 시트 데이터 반환"""
+        path = self._sheet_path(content_hash, sheet_name)
+        if not self.available or not os.path.exists(path):
+            return None
+
+        try:
+            table = feather.read_table(path, memory_map=True)
+            os.utime(path)
+            df = table.to_pandas()
+        except Exception:
+            # 손상된 파일은 지우고 원본에서 다시 파싱
+            self._remove_file(path)
+            return None
+
+        df.attrs.update(self._load_sheet_manifest(content_hash).get(sheet_name, {}))
+        return df
+
+    def put(self, content_hash: str, sheet_name: str, df: pd.DataFrame):
+        """시트 데이터를 사이드카 파일로 저장 (Feather로 표현할 수 없는 시트는 건너뜀)"""
+        if not self.available or not self._is_storable(df):
+            return
+
+        path = self._sheet_path(content_hash, sheet_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        try:
+            # 메모리 맵으로 바로 읽을 수 있도록 압축하지 않고 저장
+            feather.write_feather(df, tmp_path, compression='uncompressed')
+            os.replace(tmp_path, path)
+        except Exception:
+            self._remove_file(tmp_path)
+            return
+
+        # 메모리 사용량 같은 df.attrs는 Feather 파일에 남지 않으므로 매니페스트에 따로 저장
+        with self._lock:
+            manifest = self._load_sheet_manifest(content_hash)
+            if df.attrs:
+                manifest[sheet_name] = df.attrs
+            else:
+                manifest.pop(sheet_name, None)
+            self._save_json(os.path.join(self.directory, content_hash, self.SHEET_MANIFEST_FILE), manifest)
+
+        self._evict()
+
+    def get_sheet_index(self, content_hash: str) -> Optional[Dict[str, Dict]]:
+        """저장된 시트 인덱스 반환"""
+        path = os.path.join(self.directory, content_hash, self.INDEX_FILE)
+        if not self.available or not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put_sheet_index(self, content_hash: str, sheet_index: Dict[str, Dict]):
+        """시트 인덱스 저장"""
+        if not self.available:
+            return
+
+        path = os.path.join(self.directory, content_hash, self.INDEX_FILE)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(sheet_index, f, ensure_ascii=False, default=str)
+
+    def invalidate(self, source_key: str, content_hash: str):
+        """
+        같은 원본(파일 경로)의 내용이 바뀌었으면 이전 내용의 사이드카 파일 삭제
+
+        Args:
+            source_key (str): 원본을 식별하는 키 (예: 절대 경로)
+            content_hash (str): 현재 원본 내용의 해시
+        """
+        if not self.available:
+            return
+
+        with self._lock:
+            manifest = self._load_manifest()
+            previous_hash = manifest.get(source_key)
+            if previous_hash == content_hash:
+                return
+
+            if previous_hash and previous_hash not in [h for k, h in manifest.items() if k != source_key]:
+                self._remove_workbook(previous_hash)
+
+            manifest[source_key] = content_hash
+            self._save_manifest(manifest)
+
+    def clear(self):
+        """모든 사이드카 파일 삭제"""
+        with self._lock:
+            if not os.path.isdir(self.directory):
+                return
+            for name in os.listdir(self.directory):
+                if os.path.isdir(os.path.join(self.directory, name)):
+                    self._remove_workbook(name)
+            self._remove_file(os.path.join(self.directory, self.MANIFEST_FILE))
+
+    def _sheet_path(self, content_hash: str, sheet_name: str) -> str:
+        # 시트 이름에는 파일 이름으로 쓸 수 없는 문자가 있을 수 있으므로 해시 사용
+        sheet_key = hashlib.sha1(sheet_name.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.directory, content_hash, f"{sheet_key}.feather")
+
+    @staticmethod
+    def _is_storable(df: pd.DataFrame) -> bool:
+        """Feather는 기본 인덱스와 문자열 컬럼 이름만 지원"""
+        return (isinstance(df.index, pd.RangeIndex) and df.index.start == 0 and df.index.step == 1
+                and all(isinstance(col, str) for col in df.columns)
+                and df.columns.is_unique)
+
+    def _evict(self):
+        """용량 한도를 넘으면 가장 오래 사용하지 않은 사이드카 파일부터 삭제"""
+        with self._lock:
+            files = []
+            for root, _, names in os.walk(self.directory):
+                for name in names:
+                    if name.endswith('.feather'):
+                        path = os.path.join(root, name)
+                        try:
+                            stat = os.stat(path)
+                        except OSError:
+                            continue
+                        files.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                self._remove_file(path)
+                total -= size
+
+                workbook_dir = os.path.dirname(path)
+                if not any(name.endswith('.feather') for name in os.listdir(workbook_dir)):
+                    self._remove_workbook(os.path.basename(workbook_dir))
+
+    def _remove_workbook(self, content_hash: str):
+        workbook_dir = os.path.join(self.directory, content_hash)
+        if not os.path.isdir(workbook_dir):
+            return
+        for name in os.listdir(workbook_dir):
+            self._remove_file(os.path.join(workbook_dir, name))
+        try:
+            os.rmdir(workbook_dir)
+        except OSError:
+            pass
+
+    def _load_sheet_manifest(self, content_hash: str) -> Dict[str, Dict]:
+        path = os.path.join(self.directory, content_hash, self.SHEET_MANIFEST_FILE)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _save_json(path: str, data: Dict):
+        """임시 파일에 쓴 뒤 교체해서 읽는 쪽이 쓰다 만 파일을 보지 않게 저장"""
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, path)
+        except OSError:
+            SidecarCache._remove_file(tmp_path)
+
+    def _load_manifest(self) -> Dict[str, str]:
+        path = os.path.join(self.directory, self.MANIFEST_FILE)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, manifest: Dict[str, str]):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, self.MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+
+    @staticmethod
+    def _remove_file(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,106 @@
+from typing import Dict, List, Tuple
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+
+def _zero_out_fperr(values: np.ndarray) -> np.ndarray:
+    """부동소수점 오차 수준의 값을 0으로 처리 (pandas skew/kurt와 같은 기준)"""
+    return np.where(np.abs(values) < 1e-14, 0, values)
+
+
+def moment_statistics(count: np.ndarray, m2: np.ndarray, m3: np.ndarray,
+                       m4: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    관측 수와 중심 모멘트 합계(편차의 2/3/4제곱 합)로 표준편차, 왜도, 첨도 계산
+    
+    pandas의 std/skew/kurt와 같은 편향 보정 공식을 사용합니다.
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        std = np.where(count > 1, np.sqrt(m2 / (count - 1)), np.nan)
+        
+        # 왜도 (조정된 Fisher-Pearson 계수)
+        skew_m2 = _zero_out_fperr(m2)
+        skew_m3 = _zero_out_fperr(m3)
+        skewness = (count * (count - 1) ** 0.5 / (count - 2)) * (skew_m3 / skew_m2 ** 1.5)
+        skewness = np.where(skew_m2 == 0, 0, skewness)
+        skewness = np.where(count < 3, np.nan, skewness)
+        
+        # 첨도 (편향 보정된 초과 첨도)
+        adj = 3 * (count - 1) ** 2 / ((count - 2) * (count - 3))
+        numerator = _zero_out_fperr(count * (count + 1) * (count - 1) * m4)
+        denominator = _zero_out_fperr((count - 2) * (count - 3) * m2 ** 2)
+        kurtosis = numerator / denominator - adj
+        kurtosis = np.where(denominator == 0, 0, kurtosis)
+        kurtosis = np.where(count < 4, np.nan, kurtosis)
+    
+    return std, skewness, kurtosis
+
+
+def pairwise_sums(block: np.ndarray, shift: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    결측값이 있는 (행 x 컬럼) 블록의 쌍별 관측 수와 합계 (block은 제자리에서 변경)
+    
+    각 컬럼 쌍에서 두 값이 모두 있는 행만 사용하며(DataFrame.corr와 같은 방식), 모든 쌍의 합계를
+    결측값 여부 행렬과의 행렬곱으로 한 번에 구합니다. 큰 값에서의 자릿수 손실을 줄이기 위해
+    컬럼별 기준점(shift)을 뺀 값으로 계산합니다.
+    
+    Returns:
+        Tuple: (n_obs, sum_x, sum_xx, sum_xy), [i, j]는 쌍 (i, j)가 모두 있는 행에서의
+               관측 수, x_i의 합, x_i 제곱의 합, x_i * x_j의 합
+    """
+    valid = ~np.isnan(block)
+    weights = valid.astype(np.float64)
+    block -= shift
+    block[~valid] = 0.0
+    
+    n_obs = weights.T @ weights
+    sum_x = block.T @ weights
+    sum_xy = block.T @ block
+    np.square(block, out=block)
+    sum_xx = block.T @ weights
+    return n_obs, sum_x, sum_xx, sum_xy
+
+
+def correlation_from_sums(n_obs: np.ndarray, sum_x: np.ndarray, sum_xx: np.ndarray,
+                           sum_xy: np.ndarray) -> np.ndarray:
+    """쌍별 관측 수와 합계 행렬로 쌍별 Pearson 상관계수 행렬 계산"""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = sum_xy - sum_x * sum_x.T / n_obs
+        var_x = sum_xx - sum_x ** 2 / n_obs
+        var_y = var_x.T
+        corr = cov / np.sqrt(var_x * var_y)
+    
+    return np.where((var_x <= 0) | (var_y <= 0) | (n_obs < 2), np.nan, np.clip(corr, -1.0, 1.0))
+
+
+def correlation_p_values(corr: np.ndarray, n_obs: np.ndarray) -> np.ndarray:
+    """
+    Pearson 상관계수 행렬의 양측 p-value 행렬 계산
+    
+    자유도 n - 2인 t 검정(scipy.stats.pearsonr와 같은 검정)으로 대칭 행렬을 한 번에 계산합니다.
+    """
+    dof = n_obs - 2
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t_stat = np.abs(corr) * np.sqrt(dof / (1.0 - corr ** 2))
+        p_values = 2 * stats.t.sf(t_stat, dof)
+    
+    # 완전 상관이면 p = 0, 관측 수가 부족하거나 상관계수가 없으면 NaN
+    p_values = np.where(np.abs(corr) == 1.0, 0.0, p_values)
+    p_values = np.where((n_obs < 3) | np.isnan(corr), np.nan, p_values)
+    return p_values
+
+
+def correlation_result(columns: List[str], corr: np.ndarray, n_obs: np.ndarray) -> Tuple[pd.DataFrame, Dict]:
+    """상관계수 행렬과 쌍별 관측 수를 correlation_analysis 결과 형식으로 변환"""
+    corr_matrix = pd.DataFrame(corr, index=columns, columns=columns)
+    
+    # 유의성 검정: 상관계수 행렬과 쌍별 관측 수로 전체 p-value 행렬을 한 번에 계산
+    p_matrix = correlation_p_values(corr, n_obs)
+    
+    p_values = {}
+    for a, i in enumerate(columns):
+        p_values[i] = {j: p_matrix[a, b] for b, j in enumerate(columns) if a != b}
+    
+    return corr_matrix, p_values
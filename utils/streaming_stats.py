@@ -0,0 +1,263 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from utils.stat_kernels import correlation_from_sums, correlation_result, moment_statistics, pairwise_sums
+
+
+class QuantileSketch:
+    """
+    병합 가능한 근사 분위수 스케치 (KLL 방식)
+
+    계층 h의 값은 가중치 2**h를 가지며, 계층이 용량을 넘으면 정렬한 뒤 하나 건너 하나씩
+    다음 계층으로 올립니다. 아래 계층일수록 용량이 작아 전체 크기는 대략 3 x capacity로
+    유지됩니다. 압축이 한 번도 일어나지 않았으면 분위수는 정확한 값(선형 보간)과 같습니다.
+    """
+
+    MIN_LEVEL_CAPACITY = 8
+
+    def __init__(self, capacity: int = 2048, seed: int = 0):
+        self.capacity = capacity
+        self.levels = []
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def count(self) -> int:
+        """스케치가 나타내는 값의 수"""
+        return sum(len(items) << h for h, items in enumerate(self.levels))
+
+    def update(self, values: np.ndarray):
+        """값 추가 (결측값은 미리 제외해야 함)"""
+        self._add(0, np.asarray(values, dtype=np.float64))
+        self._compress()
+
+    def merge(self, other: 'QuantileSketch'):
+        """다른 스케치의 값을 합침"""
+        for h, items in enumerate(other.levels):
+            self._add(h, items)
+        self._compress()
+
+    def quantiles(self, qs: List[float]) -> np.ndarray:
+        """분위수 추정값 (값이 없으면 NaN)"""
+        if not self.levels or self.count == 0:
+            return np.full(len(qs), np.nan)
+
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2.0 ** h) for h, items in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        values, weights = values[order], weights[order]
+
+        # 가중치 w인 값은 순위 [누적 - w, 누적 - 1]을 차지하므로 그 가운데 순위에 배치
+        cumulative = np.cumsum(weights)
+        ranks = cumulative - (weights + 1) / 2
+        return np.interp(np.asarray(qs) * (cumulative[-1] - 1), ranks, values)
+
+    def _level_capacity(self, h: int) -> int:
+        # 맨 위 계층이 가장 크고 아래로 갈수록 2/3씩 줄어듦
+        depth = len(self.levels) - 1 - h
+        return max(self.MIN_LEVEL_CAPACITY, int(self.capacity * (2 / 3) ** depth))
+
+    def _add(self, h: int, items: np.ndarray):
+        while len(self.levels) <= h:
+            self.levels.append(np.empty(0))
+        self.levels[h] = np.concatenate([self.levels[h], items]) if len(self.levels[h]) else items
+
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            items = self.levels[h]
+            if len(items) > self._level_capacity(h):
+                items = np.sort(items)
+                # 홀수 개면 하나는 현재 계층에 남기고 나머지 쌍에서 하나씩 올림
+                keep = len(items) % 2
+                offset = int(self._rng.integers(2))
+                self._add(h + 1, items[keep + offset::2])
+                self.levels[h] = items[:keep]
+            h += 1
+
+
+class StreamingStatistics:
+    """
+    데이터프레임 청크를 차례로 받아 수치형 컬럼의 통계를 누적하는 병합 가능한 누적기
+
+    컬럼별 관측 수, 평균과 중심 모멘트(병렬 알고리즘으로 병합), 최소/최대값, 결측값 수,
+    분위수 스케치와 컬럼 쌍별 합계(상관계수용)를 보관하므로 전체 데이터를 메모리에 올리지
+    않고 descriptive_statistics, correlation_analysis와 같은 형식의 결과를 만들 수 있습니다.
+    작업자 프로세스마다 따로 누적한 뒤 merge로 합칠 수 있습니다 (pickle 가능).
+    """
+
+    def __init__(self, columns: Optional[List[str]] = None, sketch_capacity: int = 2048):
+        self.sketch_capacity = sketch_capacity
+        self.columns = None
+        self.n_rows = 0
+        if columns is not None:
+            self._initialize(list(columns), {})
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[pd.DataFrame], columns: Optional[List[str]] = None,
+                    sketch_capacity: int = 2048) -> 'StreamingStatistics':
+        """청크를 모두 누적한 누적기 반환 (예: ExcelReader.iter_sheet_chunks 결과)"""
+        accumulator = cls(columns, sketch_capacity)
+        for chunk in chunks:
+            accumulator.update(chunk)
+        return accumulator
+
+    def update(self, chunk: pd.DataFrame) -> 'StreamingStatistics':
+        """
+        청크 하나를 누적
+
+        컬럼을 지정하지 않았으면 첫 청크의 수치형 컬럼을 사용합니다.
+        """
+        if self.columns is None:
+            numeric_cols = chunk.select_dtypes(include=[np.number]).columns.tolist()
+            self._initialize(numeric_cols, chunk.dtypes.to_dict())
+
+        self.n_rows += len(chunk)
+        if not self.columns or len(chunk) == 0:
+            return self
+
+        values = chunk[self.columns].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0)
+
+        # 청크의 중심 모멘트
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(valid, values, 0).sum(axis=0) / count
+        mean = np.where(count > 0, mean, 0.0)
+        adjusted = np.where(valid, values - mean, 0.0)
+        adjusted2 = adjusted ** 2
+        self._merge_moments(count, mean, adjusted2.sum(axis=0), (adjusted2 * adjusted).sum(axis=0),
+                            (adjusted2 ** 2).sum(axis=0))
+
+        self.minimum = np.fmin(self.minimum, np.where(valid, values, np.inf).min(axis=0))
+        self.maximum = np.fmax(self.maximum, np.where(valid, values, -np.inf).max(axis=0))
+
+        for i, sketch in enumerate(self.sketches):
+            if count[i]:
+                sketch.update(values[valid[:, i], i])
+
+        # 쌍별 합계 (첫 청크의 평균을 기준점으로 빼서 자릿수 손실 방지, values는 여기서 변경됨)
+        if self.shift is None:
+            self.shift = mean.copy()
+        n_obs, sum_x, sum_xx, sum_xy = pairwise_sums(values, self.shift)
+        self.n_obs += n_obs
+        self.sum_x += sum_x
+        self.sum_xx += sum_xx
+        self.sum_xy += sum_xy
+
+        return self
+
+    def merge(self, other: 'StreamingStatistics') -> 'StreamingStatistics':
+        """다른 누적기의 상태를 합침 (같은 컬럼이어야 함)"""
+        if other.columns is None:
+            return self
+        if self.columns is None:
+            self._initialize(other.columns, other.dtypes)
+        if self.columns != other.columns:
+            raise ValueError("컬럼 구성이 다른 누적기는 합칠 수 없습니다.")
+
+        self.n_rows += other.n_rows
+        self._merge_moments(other.count, other.mean, other.m2, other.m3, other.m4)
+        self.minimum = np.fmin(self.minimum, other.minimum)
+        self.maximum = np.fmax(self.maximum, other.maximum)
+        for sketch, other_sketch in zip(self.sketches, other.sketches):
+            sketch.merge(other_sketch)
+
+        if other.shift is not None:
+            if self.shift is None:
+                self.shift = other.shift.copy()
+            # 상대 누적기의 합계를 이 누적기의 기준점 기준으로 변환
+            c = other.shift - self.shift
+            ci, cj = c[:, np.newaxis], c[np.newaxis, :]
+            self.sum_xy += other.sum_xy + cj * other.sum_x + ci * other.sum_x.T + ci * cj * other.n_obs
+            self.sum_xx += other.sum_xx + 2 * ci * other.sum_x + ci ** 2 * other.n_obs
+            self.sum_x += other.sum_x + ci * other.n_obs
+            self.n_obs += other.n_obs
+
+        return self
+
+    def descriptive_statistics(self) -> Dict:
+        """DataAnalyzer.descriptive_statistics와 같은 형식의 기술통계 (분위수는 스케치 추정값)"""
+        if not self.columns:
+            return {}
+
+        std, skewness, kurtosis = moment_statistics(self.count, self.m2, self.m3, self.m4)
+
+        stats_dict = {}
+        for i, col in enumerate(self.columns):
+            count = self.count[i]
+            q1, median, q3 = self.sketches[i].quantiles([0.25, 0.5, 0.75])
+            minimum, maximum = (self.minimum[i], self.maximum[i]) if count else (np.nan, np.nan)
+            # 최소/최대값은 원래 dtype으로 반환 (정수 컬럼은 정수)
+            dtype = self.dtypes.get(col)
+            if dtype is not None and pd.api.types.is_integer_dtype(dtype) and count > 0:
+                minimum, maximum = dtype.type(minimum), dtype.type(maximum)
+            missing_count = np.int64(self.n_rows - count)
+
+            stats_dict[col] = {
+                'count': count,
+                'mean': self.mean[i] if count else np.nan,
+                'median': median,
+                'std': std[i],
+                'min': minimum,
+                'max': maximum,
+                'q1': q1,
+                'q3': q3,
+                'skewness': skewness[i],
+                'kurtosis': kurtosis[i],
+                'missing_count': missing_count,
+                'missing_percent': (missing_count / self.n_rows) * 100 if self.n_rows else 0.0
+            }
+
+        return stats_dict
+
+    def correlation_analysis(self) -> Tuple[pd.DataFrame, Dict]:
+        """DataAnalyzer.correlation_analysis와 같은 형식의 상관계수 행렬과 p-value"""
+        columns = self.columns or []
+        if not columns:
+            return pd.DataFrame(), {}
+
+        corr = correlation_from_sums(self.n_obs, self.sum_x, self.sum_xx, self.sum_xy)
+        return correlation_result(columns, corr, self.n_obs)
+
+    def _initialize(self, columns: List[str], dtypes: Dict):
+        n_cols = len(columns)
+        self.columns = columns
+        self.dtypes = {col: dtypes[col] for col in columns if col in dtypes}
+
+        self.count = np.zeros(n_cols, dtype=np.int64)
+        self.mean = np.zeros(n_cols)
+        self.m2 = np.zeros(n_cols)
+        self.m3 = np.zeros(n_cols)
+        self.m4 = np.zeros(n_cols)
+        self.minimum = np.full(n_cols, np.inf)
+        self.maximum = np.full(n_cols, -np.inf)
+        self.sketches = [QuantileSketch(self.sketch_capacity, seed=i) for i in range(n_cols)]
+
+        self.shift = None
+        self.n_obs = np.zeros((n_cols, n_cols))
+        self.sum_x = np.zeros((n_cols, n_cols))
+        self.sum_xx = np.zeros((n_cols, n_cols))
+        self.sum_xy = np.zeros((n_cols, n_cols))
+
+    def _merge_moments(self, count_b: np.ndarray, mean_b: np.ndarray, m2_b: np.ndarray,
+                       m3_b: np.ndarray, m4_b: np.ndarray):
+        """두 부분의 관측 수, 평균, 중심 모멘트 합계를 합침 (Pébay의 병렬 공식)"""
+        count_a, mean_a, m2_a, m3_a, m4_a = self.count, self.mean, self.m2, self.m3, self.m4
+        count = count_a + count_b
+        n_a = count_a.astype(np.float64)
+        n_b = np.asarray(count_b, dtype=np.float64)
+        n = np.where(count > 0, count, 1).astype(np.float64)
+
+        delta = np.where(count_b > 0, mean_b - mean_a, 0.0)
+        delta_n = delta / n
+
+        self.mean = mean_a + delta_n * n_b
+        self.m4 = (m4_a + m4_b
+                   + delta * delta_n ** 3 * n_a * n_b * (n_a ** 2 - n_a * n_b + n_b ** 2)
+                   + 6 * delta_n ** 2 * (n_a ** 2 * m2_b + n_b ** 2 * m2_a)
+                   + 4 * delta_n * (n_a * m3_b - n_b * m3_a))
+        self.m3 = (m3_a + m3_b
+                   + delta * delta_n ** 2 * n_a * n_b * (n_a - n_b)
+                   + 3 * delta_n * (n_a * m2_b - n_b * m2_a))
+        self.m2 = m2_a + m2_b + delta * delta_n * n_a * n_b
+        self.count = count
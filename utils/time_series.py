@@ -0,0 +1,170 @@
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from utils.column_profile import get_column_profile
+from utils.frame_memo import frame_memo
+
+
+@frame_memo(exclusive=True)
+def _time_index(df: pd.DataFrame, date_col: str,
+                group_col: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray, pd.Index]:
+    """
+    데이터프레임별로 한 번만 계산한 날짜 정렬 순서, 정렬된 날짜, 그룹 코드, 그룹 이름
+
+    값 컬럼은 보관하지 않고 행 위치만 보관하므로 데이터프레임이 살아 있는 동안 남아 있어도
+    행 수에 비례하는 작은 배열 몇 개만 차지합니다. 여러 스레드가 동시에 요청해도 한 번만
+    계산하도록 계산하는 동안 잠금을 유지합니다 (frame_memo 참고).
+    """
+    dates = pd.to_datetime(df[date_col]).to_numpy()
+    # 날짜가 없는 행은 끝으로 정렬되고 월별/분기별 패턴에서 제외됨
+    order = np.argsort(dates, kind='stable')
+
+    if group_col is not None:
+        codes, group_names = pd.factorize(df[group_col].to_numpy()[order])
+        # 그룹 값이 없는 행(코드 -1)은 groupby와 마찬가지로 제외
+        has_group = codes >= 0
+        if not has_group.all():
+            order, codes = order[has_group], codes[has_group]
+    else:
+        codes, group_names = np.zeros(len(df), dtype=np.intp), pd.Index([None])
+    return order, dates[order], codes, group_names
+
+
+class TimeSeries:
+    """
+    날짜 순서로 정렬한 시계열 데이터
+
+    날짜 정렬 순서와 그룹 코드는 데이터프레임별로 한 번만 계산하고(_time_index), 값은
+    추세나 계절성을 계산할 때 요청한 컬럼만 날짜 순서의 (행 x 컬럼) 배열로 만듭니다.
+    추세와 월별/분기별 패턴은 요청한 모든 컬럼(과 그룹)에 대해 한 번에 계산합니다.
+    """
+
+    def __init__(self, df: pd.DataFrame, date_col: str, group_col: Optional[str] = None,
+                 value_cols: Optional[List[str]] = None):
+        if value_cols is None:
+            value_cols = [col for col in get_column_profile(df)['numeric_columns'] if col != group_col]
+        self.df = df
+        self.date_col = date_col
+        self.group_col = group_col
+        self.value_cols = list(value_cols)
+        self.order, self.dates, self.group_codes, self.group_names = _time_index(df, date_col, group_col)
+
+    def values(self, value_cols: Optional[List[str]] = None) -> np.ndarray:
+        """날짜 순서의 (행 x 컬럼) 값 배열 (컬럼을 지정하지 않으면 value_cols 전체)"""
+        value_cols = self.value_cols if value_cols is None else value_cols
+        values = np.empty((len(self.order), len(value_cols)), dtype=np.float64, order='F')
+        for i, col in enumerate(value_cols):
+            values[:, i] = self.df[col].to_numpy(dtype=np.float64, na_value=np.nan)[self.order]
+        return values
+
+    def trend(self, value_cols: Optional[List[str]] = None) -> Dict:
+        """
+        컬럼별 선형 추세 (날짜 순서의 행 번호에 대한 최소제곱 직선, 결측값 제외)
+
+        Args:
+            value_cols (List[str]): 계산할 컬럼 (없으면 value_cols 전체)
+
+        Returns:
+            Dict: {컬럼: 추세} (그룹 컬럼이 있으면 {그룹: {컬럼: 추세}})
+        """
+        # 그룹 안에서의 행 번호 (그룹이 없으면 0부터 n-1)
+        positions = pd.Series(self.group_codes).groupby(self.group_codes).cumcount().to_numpy(dtype=np.float64)
+
+        value_cols = self.value_cols if value_cols is None else list(value_cols)
+        values = self.values(value_cols)
+
+        # 자릿수 손실을 줄이기 위해 컬럼 평균을 뺀 값으로 합계 계산 (값이 없는 컬럼은 0)
+        valid = ~np.isnan(values)
+        center = np.where(valid, values, 0.0).sum(axis=0) / np.maximum(valid.sum(axis=0), 1)
+        y = np.where(valid, values - center, 0.0)
+        x = np.where(valid, positions[:, np.newaxis], 0.0)
+
+        sums = {name: self._group_sum(term) for name, term in [
+            ('n', valid.astype(np.float64)), ('x', x), ('y', y), ('xx', x * x), ('xy', x * y), ('yy', y * y)
+        ]}
+        n = sums['n']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sxx = sums['xx'] - sums['x'] ** 2 / n
+            sxy = sums['xy'] - sums['x'] * sums['y'] / n
+            syy = sums['yy'] - sums['y'] ** 2 / n
+
+            slope = np.where(sxx > 0, sxy / sxx, 0.0)
+            intercept = (sums['y'] - slope * sums['x']) / n + center
+            residual = np.clip(syy - slope * sxy, 0, None)
+            # 값이 모두 같으면 직선이 정확히 맞으므로 R² = 1 (sklearn r2_score와 같은 기준)
+            r_squared = np.where(syy > 0, 1 - residual / syy, 1.0)
+            mse = residual / n
+
+        results = {}
+        for g, group in enumerate(self.group_names):
+            group_results = {}
+            for i, col in enumerate(value_cols):
+                if n[g, i] < 2:
+                    continue
+                group_results[col] = {
+                    'slope': slope[g, i],
+                    'intercept': intercept[g, i],
+                    'r_squared': r_squared[g, i],
+                    'mse': mse[g, i],
+                    'trend_direction': 'increasing' if slope[g, i] > 0 else 'decreasing',
+                    'trend_strength': abs(slope[g, i]),
+                    'n_points': int(n[g, i])
+                }
+            results[group] = group_results
+
+        return results if self.group_col is not None else results[None]
+
+    def seasonal(self, value_cols: Optional[List[str]] = None) -> Dict:
+        """
+        컬럼별 월별/분기별 평균과 계절성 강도 (월별 평균의 변동계수)
+
+        Args:
+            value_cols (List[str]): 계산할 컬럼 (없으면 value_cols 전체)
+
+        Returns:
+            Dict: {컬럼: 계절성} (그룹 컬럼이 있으면 {그룹: {컬럼: 계절성}})
+        """
+        has_date = ~np.isnat(self.dates)
+        months = self.dates[has_date].astype('datetime64[M]').astype(np.int64) % 12 + 1
+        quarters = (months - 1) // 3 + 1
+        value_cols = self.value_cols if value_cols is None else list(value_cols)
+        values = pd.DataFrame(self.values(value_cols)[has_date], columns=range(len(value_cols)))
+        codes = self.group_codes[has_date]
+
+        monthly = values.groupby([codes, months]).mean()
+        quarterly = values.groupby([codes, quarters]).mean()
+
+        results = {}
+        for g, group in enumerate(self.group_names):
+            group_monthly = monthly.loc[g] if g in monthly.index.get_level_values(0) else monthly.iloc[:0]
+            group_quarterly = quarterly.loc[g] if g in quarterly.index.get_level_values(0) else quarterly.iloc[:0]
+
+            group_results = {}
+            for i, col in enumerate(value_cols):
+                monthly_avg = group_monthly[i]
+                quarterly_avg = group_quarterly[i]
+                group_results[col] = {
+                    'monthly_pattern': monthly_avg.to_dict(),
+                    'quarterly_pattern': quarterly_avg.to_dict(),
+                    'seasonal_strength': monthly_avg.std() / monthly_avg.mean() if monthly_avg.mean() != 0 else 0
+                }
+            results[group] = group_results
+
+        return results if self.group_col is not None else results[None]
+
+    def _group_sum(self, term: np.ndarray) -> np.ndarray:
+        """(행 x 컬럼) 배열의 그룹별 합계 (그룹 x 컬럼)"""
+        sums = np.empty((len(self.group_names), term.shape[1]))
+        for i in range(term.shape[1]):
+            sums[:, i] = np.bincount(self.group_codes, weights=term[:, i], minlength=len(self.group_names))
+        return sums
+
+
+def get_time_series(df: pd.DataFrame, date_col: str, group_col: Optional[str] = None) -> TimeSeries:
+    """
+    데이터프레임의 시계열 반환
+
+    추세 분석과 계절성 분석이 데이터프레임별로 한 번만 계산한 날짜 정렬 순서와 그룹 코드를
+    공유합니다. 값 배열은 필요한 컬럼만 계산할 때마다 만들어서 메모리에 남기지 않습니다.
+    """
+    return TimeSeries(df, date_col, group_col)
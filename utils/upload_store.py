@@ -0,0 +1,155 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+class UploadStore:
+    """세션별 업로드 파일을 메모리에 보관하고 한도를 넘으면 디스크로 내보내는 저장소"""
+
+    def __init__(self, max_memory_bytes: int = 256 * 1024 * 1024, ttl_seconds: int = 3600,
+                 spill_to_disk: bool = True, spill_dir: Optional[str] = None):
+        self.max_memory_bytes = max_memory_bytes
+        self.ttl_seconds = ttl_seconds
+        self.spill_to_disk = spill_to_disk
+        self.spill_dir = spill_dir
+        self.memory_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, data: bytes, filename: Optional[str] = None, upload_id: Optional[str] = None) -> str:
+        """
+        업로드 파일 저장
+
+        Args:
+            data (bytes): 디코딩된 파일 내용
+            filename (str): 원본 파일 이름
+            upload_id (str): 저장 키 (없으면 새로 생성)
+
+        Returns:
+            str: 이후 조회에 사용할 업로드 ID
+        """
+        upload_id = upload_id or uuid.uuid4().hex
+
+        with self._lock:
+            self._purge_expired()
+            self._remove(upload_id)
+
+            self._entries[upload_id] = {
+                'data': bytes(data),
+                'path': None,
+                'filename': filename,
+                'size': len(data),
+                'last_access': time.time()
+            }
+            self.memory_bytes += len(data)
+            self._enforce_memory_limit()
+
+        return upload_id
+
+    def get(self, upload_id: Optional[str]) -> Optional[bytes]:
+        """업로드 파일 내용 반환 (만료되었거나 없으면 None)"""
+        if not upload_id:
+            return None
+
+        with self._lock:
+            self._purge_expired()
+            entry = self._entries.get(upload_id)
+            if entry is None:
+                return None
+
+            entry['last_access'] = time.time()
+            self._entries.move_to_end(upload_id)
+
+            if entry['data'] is not None:
+                return entry['data']
+
+            with open(entry['path'], 'rb') as f:
+                return f.read()
+
+    def get_filename(self, upload_id: str) -> Optional[str]:
+        """업로드 파일의 원본 이름 반환"""
+        with self._lock:
+            entry = self._entries.get(upload_id)
+            return entry['filename'] if entry is not None else None
+
+    def remove(self, upload_id: str):
+        """업로드 파일 삭제"""
+        with self._lock:
+            self._remove(upload_id)
+
+    def purge_expired(self) -> int:
+        """TTL이 지난 업로드 파일을 삭제하고 삭제한 개수 반환"""
+        with self._lock:
+            return self._purge_expired()
+
+    def stats(self) -> Dict:
+        """저장소 사용 현황 반환"""
+        with self._lock:
+            spilled = [entry for entry in self._entries.values() if entry['path'] is not None]
+            return {
+                'entries': len(self._entries),
+                'memory_bytes': self.memory_bytes,
+                'spilled_entries': len(spilled),
+                'spilled_bytes': sum(entry['size'] for entry in spilled)
+            }
+
+    def clear(self):
+        """모든 업로드 파일 삭제"""
+        with self._lock:
+            for upload_id in list(self._entries):
+                self._remove(upload_id)
+
+    def _remove(self, upload_id: str):
+        entry = self._entries.pop(upload_id, None)
+        if entry is None:
+            return
+
+        if entry['data'] is not None:
+            self.memory_bytes -= entry['size']
+        if entry['path'] is not None and os.path.exists(entry['path']):
+            os.remove(entry['path'])
+
+    def _purge_expired(self) -> int:
+        deadline = time.time() - self.ttl_seconds
+        expired = [upload_id for upload_id, entry in self._entries.items()
+                   if entry['last_access'] < deadline]
+        for upload_id in expired:
+            self._remove(upload_id)
+        return len(expired)
+
+    def _enforce_memory_limit(self):
+        """메모리 한도를 넘으면 가장 오래 사용하지 않은 파일부터 디스크로 내보내거나 삭제"""
+        for upload_id in list(self._entries):
+            if self.memory_bytes <= self.max_memory_bytes:
+                break
+
+            entry = self._entries[upload_id]
+            if entry['data'] is None:
+                continue
+
+            if not self.spill_to_disk:
+                self._remove(upload_id)
+                continue
+
+            if self.spill_dir is None:
+                # 직접 만든 임시 디렉터리는 저장소가 사라질 때 정리
+                self.spill_dir = tempfile.mkdtemp(prefix='exceldash_uploads_')
+                weakref.finalize(self, shutil.rmtree, self.spill_dir, ignore_errors=True)
+
+            path = os.path.join(self.spill_dir, f"{upload_id}.bin")
+            with open(path, 'wb') as f:
+                f.write(entry['data'])
+
+            entry['path'] = path
+            entry['data'] = None
+            self.memory_bytes -= entry['size']
+
+
+# 프로세스 전체에서 공유하는 업로드 저장소
+upload_store = UploadStore()
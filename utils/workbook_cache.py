@@ -0,0 +1,43 @@
+import hashlib
+from typing import Dict, Optional
+import pandas as pd
+from utils.byte_lru import ByteLRUCache
+
+
+class WorkbookCache(ByteLRUCache):
+    """업로드된 파일 내용의 해시를 키로 파싱된 시트를 보관하는 LRU 캐시"""
+
+    # 시트 인덱스 항목의 대략적인 메모리 크기 (바이트)
+    INDEX_ENTRY_BYTES = 1024
+
+    def __init__(self, max_bytes: int = 512 * 1024 * 1024):
+        super().__init__(max_bytes)
+
+    @staticmethod
+    def content_hash(data: bytes) -> str:
+        """파일 내용의 해시 반환"""
+        return hashlib.sha256(data).hexdigest()
+
+    def get(self, content_hash: str, sheet_name: str) -> Optional[pd.DataFrame]:
+        """
+        캐시된 시트 데이터 반환
+
+        반환된 데이터프레임은 여러 콜백이 공유하므로 수정하지 말고 복사해서 사용해야 합니다.
+        """
+        return self._get((content_hash, sheet_name))
+
+    def put(self, content_hash: str, sheet_name: str, df: pd.DataFrame):
+        """파싱된 시트 데이터 저장"""
+        self._put((content_hash, sheet_name), df, int(df.memory_usage(deep=True).sum()))
+
+    def get_sheet_index(self, content_hash: str) -> Optional[Dict[str, Dict]]:
+        """캐시된 시트 인덱스 반환"""
+        return self._get((content_hash, None))
+
+    def put_sheet_index(self, content_hash: str, sheet_index: Dict[str, Dict]):
+        """시트 인덱스 저장"""
+        self._put((content_hash, None), sheet_index, self.INDEX_ENTRY_BYTES * max(len(sheet_index), 1))
+
+
+# 프로세스 전체에서 공유하는 워크북 캐시
+workbook_cache = WorkbookCache()